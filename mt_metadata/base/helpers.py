@@ -9,6 +9,7 @@ Created on Wed Dec 23 20:37:52 2020
 
 """
 
+import importlib.util
 import json
 import logging
 
@@ -18,6 +19,7 @@ import logging
 import textwrap
 from collections import defaultdict, OrderedDict
 from collections.abc import MutableMapping
+from functools import lru_cache
 from operator import itemgetter
 from pathlib import Path
 from xml.dom import minidom
@@ -765,12 +767,17 @@ def recursive_split_xml(element, item, base, name, attr_dict=None):
         for ii in item:
             sub_element = et.SubElement(element, "item")
             recursive_split_xml(sub_element, ii, base, name, attr_dict)
+    elif isinstance(item, np.ndarray):
+        # filter poles, zeros and coefficients, written the same as a list
+        for ii in item.tolist():
+            sub_element = et.SubElement(element, "item")
+            recursive_split_xml(sub_element, ii, base, name, attr_dict)
     elif isinstance(item, str):
         element.text = item
     elif item is None:
         # Leave element.text as None so XML has empty element (no text)
         pass
-    elif isinstance(item, (float, int)):
+    elif isinstance(item, (float, int, complex, np.number)):
         element.text = str(item)
     else:
         # if the value is an hdf5 reference make it a string
@@ -933,6 +940,47 @@ class NumpyEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+class ArrayEncoder(NumpyEncoder):
+    """
+    Encode numpy arrays with their dtype and shape so `array_hook` can read
+    them back, other values as `NumpyEncoder`
+    """
+
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            if np.iscomplexobj(obj):
+                return {
+                    "__ndarray__": [[v.real, v.imag] for v in obj.ravel().tolist()],
+                    "dtype": obj.dtype.str,
+                    "shape": obj.shape,
+                }
+            return {
+                "__ndarray__": obj.ravel().tolist(),
+                "dtype": obj.dtype.str,
+                "shape": obj.shape,
+            }
+        return super().default(obj)
+
+
+def array_hook(obj):
+    """
+    JSON object hook that makes numpy arrays written by `ArrayEncoder`
+
+    :param obj: decoded JSON object
+    :type obj: dict
+    :return: numpy array or the object
+    :rtype: np.ndarray or dict
+
+    """
+    if "__ndarray__" not in obj:
+        return obj
+    dtype = np.dtype(obj["dtype"])
+    values = obj["__ndarray__"]
+    if dtype.kind == "c":
+        values = [complex(real, imag) for real, imag in values]
+    return np.array(values, dtype=dtype).reshape(obj["shape"])
+
+
 def validate_name(name, pattern=None):
     """
     Validate name
@@ -1066,6 +1114,33 @@ def extract_numbers(text):
     return numbers
 
 
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """
+    Check if an optional dependency is installed without importing it.
+
+    Use with `requires` so heavy optional packages like obspy are only
+    imported inside the functions that need them.
+
+    Parameters
+    ----------
+    name : str
+        Top level package name, e.g. 'obspy'.
+
+    Returns
+    -------
+    bool
+        True if the package can be imported.
+
+    Examples
+    --------
+    >>> @requires(obspy=module_available("obspy"))
+    ... def obspy_function():
+    ...     from obspy.core import inventory
+    """
+    return importlib.util.find_spec(name) is not None
+
+
 def requires(**requirements):
     """Decorate a function with optional dependencies.
 
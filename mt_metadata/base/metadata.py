@@ -13,14 +13,13 @@ from __future__ import annotations
 
 import json
 from collections import OrderedDict
-from enum import Enum
+from contextlib import contextmanager
 
 # =============================================================================
 # Imports
 # =============================================================================
-from operator import itemgetter
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterator, Literal, Mapping
 from xml.etree import cElementTree as et
 
 import numpy as np
@@ -33,6 +32,7 @@ from pydantic import (
     create_model,
     field_validator,
     model_validator,
+    ValidationInfo,
 )
 from pydantic.fields import FieldInfo, PrivateAttr
 from typing_extensions import deprecated
@@ -41,7 +41,32 @@ from mt_metadata import NULL_VALUES
 from mt_metadata.utils.exceptions import MTSchemaError
 from mt_metadata.utils.validators import validate_attribute, validate_name
 
-from . import helpers, pydantic_helpers
+from . import helpers, records, serialization
+
+# validation context of a bulk update, field validators that build metadata
+# objects from dictionaries read it to fill them in the same mode
+BULK_CONTEXT = {"from_dict_mode": "bulk"}
+
+
+def get_from_dict_mode(info: ValidationInfo | None) -> Literal["attribute", "bulk"]:
+    """
+    Mode to fill nested objects built from dictionaries inside a validator.
+
+    Parameters
+    ----------
+    info : ValidationInfo | None
+        Validation information passed to the field validator.
+
+    Returns
+    -------
+    {"attribute", "bulk"}
+        "bulk" if the validation runs for `MetadataBase.from_dict` in bulk
+        mode, otherwise "attribute".
+    """
+    if info is not None and info.context:
+        return info.context.get("from_dict_mode", "attribute")
+    return "attribute"
+
 
 # =============================================================================
 #  Base class that everything else will inherit
@@ -222,6 +247,8 @@ class MetadataBase(DotNotationBaseModel):
 
     _skip_equals: list[str] = PrivateAttr(["processed_date", "creation_time"])
     _fields: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _deferred: dict[str, Any] | None = PrivateAttr(None)
+    _fingerprints: dict[tuple, Any] | None = PrivateAttr(None)
 
     @model_validator(mode="before")
     @classmethod
@@ -408,7 +435,13 @@ class MetadataBase(DotNotationBaseModel):
         if other in [None]:
             return False
 
-        elif isinstance(other, (dict, str, pd.Series, et.Element)):
+        # identical content, no need to compare dictionaries
+        if isinstance(other, MetadataBase):
+            skip = self._skip_equals
+            if self.fingerprint(skip) == other.fingerprint(skip):
+                return True
+
+        if isinstance(other, (dict, str, pd.Series, et.Element)):
             try:
                 # Attempt to load the other object into a new instance of MetadataBase
                 # This will ensure that the other object has the same attributes as self
@@ -496,6 +529,37 @@ class MetadataBase(DotNotationBaseModel):
 
         return equals
 
+    def fingerprint(self, skip: list[str] | None = None) -> str:
+        """
+        Content hash of this object and the metadata objects it holds.
+
+        The hash is computed from a canonical walk over the field values and
+        the scalar part is cached until a field is assigned, so repeated
+        calls are cheap.  Two objects of the same class with the same
+        fingerprint compare equal, which makes the fingerprint useful as a
+        dictionary key for deduplication.  Like `to_dict`, child collections
+        held in a `ListDict` (runs, channels, ...) are not included.
+
+        Parameters
+        ----------
+        skip : list[str] | None, optional
+            Field names (or parts of names) to leave out at every level.
+            Default is None, which uses ``_skip_equals`` like `__eq__`.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest.
+
+        Examples
+        --------
+        >>> Station(id="mt01").fingerprint() == Station(id="mt01").fingerprint()
+        True
+        """
+        if skip is None:
+            skip = self._skip_equals
+        return serialization.fingerprint(self, skip)
+
     def __ne__(
         self, other: "MetadataBase" | dict | str | pd.Series | et.Element
     ) -> bool:
@@ -589,6 +653,11 @@ class MetadataBase(DotNotationBaseModel):
             ):
                 logger.warning(f"Cannot update {type(self)} with {type(other)}")
                 return
+        if isinstance(other, MetadataBase) and self.fingerprint(
+            []
+        ) == other.fingerprint([]):
+            # nothing to update
+            return
         for k in match:
             if self.get_attr_from_name(k) != other.get_attr_from_name(k):
                 msg = (
@@ -673,6 +742,8 @@ class MetadataBase(DotNotationBaseModel):
 
         try:
             copied_obj = self.model_copy(update=update, deep=deep)
+            # values in update are set without assignment
+            copied_obj.__pydantic_private__["_fingerprints"] = None
         except (TypeError, AttributeError) as e:
             if "no default __reduce__" in str(e) or "__cinit__" in str(e):
                 # Fallback: create a new instance from dictionary representation
@@ -707,9 +778,7 @@ class MetadataBase(DotNotationBaseModel):
         """
 
         if not self._fields:
-            self._fields = pydantic_helpers.flatten_field_tree_map(
-                pydantic_helpers.get_all_fields_serializable(self)
-            )
+            self._fields = serialization.get_serialization_plan(self).field_map
         return self._fields
 
     def get_attribute_list(self) -> list[str]:
@@ -722,7 +791,7 @@ class MetadataBase(DotNotationBaseModel):
             A list of attribute names
         """
 
-        return sorted(self.get_all_fields().keys())
+        return list(serialization.get_serialization_plan(self).attribute_names)
 
     @property
     def _required_fields(self) -> list[str]:
@@ -743,13 +812,7 @@ class MetadataBase(DotNotationBaseModel):
         Required fields are determined by the 'required' flag in field metadata,
         not by Pydantic's required_on_init behavior.
         """
-        required_fields = []
-        for name, field_dict in self.get_all_fields().items():
-            required = field_dict.get("required", False)
-            if required:
-                required_fields.append(name)
-
-        return required_fields
+        return list(serialization.get_serialization_plan(self).required_fields)
 
     def _field_info_to_string(self, name: str, field_dict: dict[str, Any]) -> str:
         """
@@ -982,6 +1045,8 @@ class MetadataBase(DotNotationBaseModel):
           when they only contain a value (no author or custom timestamp)
         - Numpy arrays, Enums, and nested MetadataBase objects are handled specially
         - Required fields are always included even if None
+        - The attribute walk is compiled once per class and cached, see
+          `mt_metadata.base.serialization.SerializationPlan`
 
         Examples
         --------
@@ -989,177 +1054,16 @@ class MetadataBase(DotNotationBaseModel):
         >>> metadata.to_dict(required=False)  # Include all fields
         """
 
-        meta_dict = {}
-
-        # Keep track of processed comment attributes to avoid duplication
-        processed_comments = set()
-
-        for name in self.get_attribute_list():
-            # Special handling for comment attributes for backwards compatibility
-            if (
-                ".value" in name
-                and name.replace(".value", "") not in processed_comments
-            ):
-                base_attr_name = name.replace(".value", "")
-                # Check if this is a comment attribute
-                try:
-                    comment_obj = self.get_attr_from_name(base_attr_name)
-                    if (
-                        hasattr(comment_obj, "__class__")
-                        and comment_obj.__class__.__name__ == "Comment"
-                    ):
-                        # Check if this is a simple comment (only value set, no author or custom timestamp)
-                        default_timestamp = "1980-01-01T00:00:00+00:00"
-                        is_simple_comment = (
-                            hasattr(comment_obj, "value")
-                            and comment_obj.value is not None
-                            and isinstance(comment_obj.value, str)
-                            and (
-                                not hasattr(comment_obj, "author")
-                                or comment_obj.author is None
-                                or comment_obj.author == ""
-                            )
-                            and (
-                                not hasattr(comment_obj, "time_stamp")
-                                or comment_obj.time_stamp is None
-                                or str(comment_obj.time_stamp) == default_timestamp
-                            )
-                        )
-
-                        if is_simple_comment and not nested:
-                            # Use simple string format for backwards compatibility
-                            if required:
-                                if comment_obj.value not in [
-                                    None,
-                                    "1980-01-01T00:00:00+00:00",
-                                    "1980",
-                                    [],
-                                    "",
-                                ]:
-                                    meta_dict[base_attr_name] = str(comment_obj.value)
-                            else:
-                                meta_dict[base_attr_name] = str(comment_obj.value)
-
-                            # Mark this comment as processed to skip its nested attributes
-                            processed_comments.add(base_attr_name)
-                            continue
-                        else:
-                            # Use nested format - let individual attributes be processed normally
-                            pass
-                except (AttributeError, KeyError):
-                    # Not a comment object or attribute doesn't exist, process normally
-                    pass
-
-            # Skip nested comment attributes if we already processed the base comment
-            skip_attribute = False
-            for processed_comment in processed_comments:
-                if name.startswith(processed_comment + "."):
-                    skip_attribute = True
-                    break
-
-            if skip_attribute:
-                continue
-
-            try:
-                value = self.get_attr_from_name(name)
-                # Special handling for Comment objects for backwards compatibility
-                if (
-                    hasattr(value, "__class__")
-                    and value.__class__.__name__ == "Comment"
-                ):
-                    # Check if this is a simple comment (only value set, no author or custom timestamp)
-                    default_timestamp = "1980-01-01T00:00:00+00:00"
-                    is_simple_comment = (
-                        hasattr(value, "value")
-                        and value.value is not None
-                        and isinstance(value.value, str)
-                        and (
-                            not hasattr(value, "author")
-                            or value.author is None
-                            or value.author == ""
-                        )
-                        and (
-                            not hasattr(value, "time_stamp")
-                            or value.time_stamp is None
-                            or str(value.time_stamp) == default_timestamp
-                        )
-                    )
-
-                    if is_simple_comment and not nested:
-                        # Return simple string for backwards compatibility
-                        value = str(value.value)
-                    else:
-                        # Return full nested format
-                        value = value.to_dict(nested=nested, required=required)
-                elif hasattr(value, "to_dict"):
-                    value = value.to_dict(nested=nested, required=required)
-                elif isinstance(value, dict):
-                    for key, obj in value.items():
-                        if hasattr(obj, "to_dict"):
-                            value[key] = obj.to_dict(nested=nested, required=required)
-                        elif isinstance(obj, Enum):
-                            value[key] = obj.value
-                        else:
-                            value[key] = obj
-                elif isinstance(value, list):
-                    v_list = []
-                    for obj in value:
-                        if hasattr(obj, "to_dict"):
-                            v_list.append(obj.to_dict(nested=nested, required=required))
-                        elif isinstance(obj, Enum):
-                            v_list.append(obj.value)
-                        else:
-                            v_list.append(obj)
-                    value = v_list
-                elif isinstance(value, Enum):
-                    value = value.value
-                elif hasattr(value, "unicode_string"):
-                    value = value.unicode_string()
-                elif isinstance(value, (str, int, float, bool)):
-                    value = value
-            except AttributeError as error:
-                logger.debug(error)
-                value = None
-            if required:
-                if isinstance(value, (np.ndarray)):
-                    if name == "zeros" or name == "poles":
-                        meta_dict[name] = value
-                    elif value.all() != 0:
-                        meta_dict[name] = value
-                elif hasattr(value, "size"):
-                    if value.size > 0:
-                        meta_dict[name] = value
-                elif (
-                    value not in [None, "1980-01-01T00:00:00+00:00", "1980", [], ""]
-                    or name in self._required_fields
-                    or helpers._should_include_coordinate_field(name)
-                    or helpers._should_convert_none_to_empty_string(name)
-                ):
-                    # Convert None coordinate fields to 0.0 for backward compatibility
-                    if helpers._should_include_coordinate_field(name) and value is None:
-                        value = 0.0
-                    # Convert None string fields to empty string for backward compatibility
-                    elif (
-                        helpers._should_convert_none_to_empty_string(name)
-                        and value is None
-                    ):
-                        value = ""
-                    meta_dict[name] = value
-            else:
-                meta_dict[name] = value
-        if nested:
-            meta_dict = helpers.structure_dict(meta_dict)
-        meta_dict = {
-            validate_name(self.__class__.__name__): OrderedDict(
-                sorted(meta_dict.items(), key=itemgetter(0))
-            )
-        }
-
-        if single:
-            meta_dict = meta_dict[list(meta_dict.keys())[0]]
-        return meta_dict
+        return serialization.get_serialization_plan(self).to_dict(
+            self, nested=nested, single=single, required=required
+        )
 
-    def from_dict(self, meta_dict: dict, skip_none: bool = False) -> None:
+    def from_dict(
+        self,
+        meta_dict: dict,
+        skip_none: bool = False,
+        mode: Literal["attribute", "bulk"] = "attribute",
+    ) -> None:
         """
         Fill attributes from a dictionary.
 
@@ -1174,6 +1078,11 @@ class MetadataBase(DotNotationBaseModel):
             both nested dictionaries and flat dictionaries with dot-notation keys.
         skip_none : bool, optional
             If True, skip attributes with None values. Default is False.
+        mode : {"attribute", "bulk"}, optional
+            "attribute" sets each attribute with `update_attribute`, which
+            validates the whole model on every assignment.  "bulk" regroups
+            the keys per object and validates each object once, see
+            `update_attributes`.  Default is "attribute".
 
         Raises
         ------
@@ -1184,6 +1093,7 @@ class MetadataBase(DotNotationBaseModel):
         --------
         >>> metadata.from_dict({"latitude": 45.0, "longitude": -120.0})
         >>> metadata.from_dict({"location": {"latitude": 45.0}})
+        >>> metadata.from_dict(large_dict, mode="bulk")
         """
         if not isinstance(meta_dict, (dict, OrderedDict)):
             msg = f"Input must be a dictionary not {type(meta_dict)}"
@@ -1209,12 +1119,272 @@ class MetadataBase(DotNotationBaseModel):
             )
             meta_dict = helpers.flatten_dict(meta_dict)
         # set attributes by key.
+        self.update_attributes(meta_dict, skip_none=skip_none, mode=mode)
+
+    @classmethod
+    def from_flat_dict(cls, meta_dict: dict, skip_none: bool = False) -> "MetadataBase":
+        """
+        Create a new object from a dictionary validating once per object.
+
+        Shortcut for creating an object and calling
+        ``from_dict(meta_dict, mode="bulk")``.
+
+        Parameters
+        ----------
+        meta_dict : dict
+            Flat (dot-notation keys) or nested dictionary of attributes.
+        skip_none : bool, optional
+            If True, skip attributes with None values. Default is False.
+
+        Returns
+        -------
+        MetadataBase
+            New instance of the class filled from `meta_dict`.
+
+        Examples
+        --------
+        >>> station = Station.from_flat_dict({"id": "mt01", "location.latitude": 40})
+        """
+        obj = cls()
+        obj.from_dict(meta_dict, skip_none=skip_none, mode="bulk")
+        return obj
+
+    def update_attributes(
+        self,
+        meta_dict: dict[str, Any],
+        skip_none: bool = False,
+        mode: Literal["attribute", "bulk"] = "attribute",
+    ) -> None:
+        """
+        Update many attributes from a flat dictionary of dot-notation keys.
+
+        Parameters
+        ----------
+        meta_dict : dict[str, Any]
+            Flat dictionary of attribute names and values.
+        skip_none : bool, optional
+            If True, skip attributes with None values. Default is False.
+        mode : {"attribute", "bulk"}, optional
+            How attributes are set. Default is "attribute".
+
+            - "attribute": call `update_attribute` for each key, in order.
+              With ``validate_assignment=True`` every assignment runs a full
+              validation pass of the object being set.
+            - "bulk": regroup the keys into one payload per object (self and
+              each nested metadata object) and validate each object once with
+              `model_validate`.  Nested objects are updated in place.  Keys
+              that cannot be validated as model fields (extra attributes,
+              aliases, properties or keys that set a field both as a whole and
+              by its nested attributes) fall back to `update_attribute`.  Model
+              validators run once on the final state rather than after every
+              assignment.
+
+        Raises
+        ------
+        ValueError
+            If `mode` is not understood.
+        """
+        if skip_none:
+            meta_dict = {
+                name: value
+                for name, value in meta_dict.items()
+                if value not in NULL_VALUES
+            }
+
+        if mode == "attribute":
+            for name, value in meta_dict.items():
+                self.update_attribute(name, value)
+        elif mode == "bulk":
+            self._bulk_update(meta_dict)
+        else:
+            msg = f"mode must be 'attribute' or 'bulk', not {mode}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+    def _bulk_update(self, meta_dict: dict[str, Any]) -> None:
+        """
+        Set attributes from a flat dictionary, validating this object once.
+
+        Keys are split on the first '.'.  Keys for fields of this model are
+        collected into a single payload, keys for nested metadata objects are
+        grouped and passed on to the nested object, everything else is set
+        with `update_attribute` afterwards in the original order.
+
+        Parameters
+        ----------
+        meta_dict : dict[str, Any]
+            Flat dictionary of attribute names and values.
+        """
+        model_fields = type(self).model_fields
+        payload = {}
+        nested = {}
+        deferred = []
         for name, value in meta_dict.items():
-            if skip_none:
-                if value in NULL_VALUES:
-                    continue
+            key, *other = name.split(".", 1)
+            if key not in model_fields:
+                deferred.append((name, value))
+            elif other:
+                if isinstance(self.__dict__.get(key), MetadataBase):
+                    nested.setdefault(key, {})[other[0]] = value
+                else:
+                    deferred.append((name, value))
+            else:
+                payload[key] = value
+
+        # keys that set a field as a whole and by its attributes are order
+        # dependent, set them one at a time.
+        for key in set(payload).intersection(nested):
+            sub_dict = nested.pop(key)
+            deferred.append((key, payload.pop(key)))
+            deferred.extend(
+                (f"{key}.{name}", value) for name, value in sub_dict.items()
+            )
+        if deferred:
+            order = {name: index for index, name in enumerate(meta_dict)}
+            deferred.sort(key=lambda item: order.get(item[0], -1))
+
+        for key, sub_dict in nested.items():
+            self.__dict__[key]._bulk_update(sub_dict)
+
+        if payload:
+            self._validate_in_place(payload, context=BULK_CONTEXT)
+
+        for name, value in deferred:
             self.update_attribute(name, value)
 
+    def _validate_in_place(
+        self, payload: dict[str, Any], context: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Validate the object once with `payload` applied and keep the result.
+
+        Nested metadata objects are passed through unchanged, so the identity
+        of nested objects is preserved.
+
+        Parameters
+        ----------
+        payload : dict[str, Any]
+            Field names and raw values to validate with the current state.
+        context : dict[str, Any] | None, optional
+            Validation context passed to the validators. Default is None.
+
+        Raises
+        ------
+        ValidationError
+            If the merged values are not valid.
+        """
+        merged = dict(self.__dict__)
+        if self.__pydantic_extra__:
+            merged.update(self.__pydantic_extra__)
+        merged.update(payload)
+        fields_set = self.__pydantic_fields_set__ | set(payload)
+        self.__pydantic_private__["_fingerprints"] = None
+        # validate into this instance, private attributes are kept
+        self.__pydantic_validator__.validate_python(
+            merged, self_instance=self, context=context
+        )
+        object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        private = self.__pydantic_private__
+        if not private:
+            super().__setattr__(name, value)
+            return
+        private["_fingerprints"] = None
+        deferred = private.get("_deferred")
+        if deferred is not None and name in type(self).model_fields:
+            if name not in deferred:
+                deferred[name] = self.__dict__[name]
+            self.__dict__[name] = value
+            return
+        super().__setattr__(name, value)
+
+    @contextmanager
+    def deferred_validation(self) -> Iterator["MetadataBase"]:
+        """
+        Suspend assignment validation and validate each object once on exit.
+
+        Inside the block, assignments to model fields of this object and of
+        every nested metadata object it holds on entry are stored as is.  On
+        exit each object that was assigned to is validated once with
+        `model_validate`, nested objects first, so field and model validators
+        run on the final state instead of after every assignment.
+
+        Values read back inside the block are the raw assigned values.  If the
+        block raises, or validation on exit fails, the assigned fields are
+        restored to the values they had on entry and the error is re-raised.
+        Nested use is allowed, only the outermost block validates.
+
+        Yields
+        ------
+        MetadataBase
+            This object.
+
+        Examples
+        --------
+        >>> station = Station()
+        >>> with station.deferred_validation():
+        ...     station.id = "mt01"
+        ...     station.location.latitude = "40.5"
+        >>> station.location.latitude
+        40.5
+        """
+        objects = [obj for obj in self._iter_metadata_tree() if obj._deferred is None]
+        for obj in objects:
+            obj.__pydantic_private__["_deferred"] = {}
+
+        try:
+            yield self
+        except BaseException:
+            for obj in objects:
+                obj._end_deferred(validate=False)
+            raise
+
+        # validate bottom up, nested objects are validated before parents
+        for index, obj in enumerate(reversed(objects)):
+            try:
+                obj._end_deferred(validate=True)
+            except Exception:
+                for other in objects[: len(objects) - index - 1]:
+                    other._end_deferred(validate=False)
+                raise
+
+    def _iter_metadata_tree(self) -> Iterator["MetadataBase"]:
+        """
+        Iterate over this object and nested metadata objects held in fields.
+
+        Objects in lists or dictionaries are not included.
+        """
+        yield self
+        for value in self.__dict__.values():
+            if isinstance(value, MetadataBase):
+                yield from value._iter_metadata_tree()
+
+    def _end_deferred(self, validate: bool = True) -> None:
+        """
+        Leave deferred validation, validating or restoring assigned fields.
+
+        Parameters
+        ----------
+        validate : bool, optional
+            If True validate the assigned fields, otherwise restore the values
+            they had when deferred validation started.  Default is True.
+        """
+        deferred = self.__pydantic_private__["_deferred"]
+        self.__pydantic_private__["_deferred"] = None
+        if not deferred:
+            return
+        if validate:
+            try:
+                self._validate_in_place(
+                    {name: self.__dict__[name] for name in deferred}
+                )
+                return
+            except Exception:
+                self.__dict__.update(deferred)
+                raise
+        self.__dict__.update(deferred)
+
     def to_json(
         self, nested: bool = False, indent: str = " " * 4, required: bool = True
     ) -> str:
@@ -1328,6 +1498,53 @@ class MetadataBase(DotNotationBaseModel):
 
         return pd.Series(self.to_dict(single=True, required=required))
 
+    def to_records(self, fields: list[str] | None = None) -> np.ndarray:
+        """
+        Convert to a read-only NumPy structured array with a single row.
+
+        To convert many objects at once use
+        `mt_metadata.base.records.to_records` or `ListDict.to_records`.
+
+        Parameters
+        ----------
+        fields : list[str] | None, optional
+            Dotted attribute names to write, by default all attributes.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array with one column per attribute.
+
+        Examples
+        --------
+        >>> electric.to_records(["component", "dipole_length"])
+        """
+        return records.to_records([self], fields=fields)
+
+    @classmethod
+    def from_records(cls, record_array: np.ndarray) -> list["MetadataBase"]:
+        """
+        Create objects from a NumPy structured array, one per row.
+
+        Each row is validated once, missing values (NaN, NaT, "") leave the
+        attribute at its default.  See `mt_metadata.base.records`.
+
+        Parameters
+        ----------
+        record_array : np.ndarray
+            Structured array as returned by `to_records`.
+
+        Returns
+        -------
+        list[MetadataBase]
+            New instances of the class.
+
+        Examples
+        --------
+        >>> electrics = Electric.from_records(record_array)
+        """
+        return records.from_records(cls, record_array)
+
     def to_xml(self, string: bool = False, required: bool = True) -> str | et.Element:
         """
         Convert metadata to an XML representation.
@@ -1,6 +1,6 @@
 """
 Field introspection utilities for Pydantic BaseModel classes with
-lazy in-memory caching and optional on-disk caching.
+lazy in-memory caching and an optional, consolidated on-disk cache.
 
 This module builds a JSON-serializable nested "field tree" for any
 Pydantic BaseModel, avoiding instantiation and guarding against
@@ -41,8 +41,8 @@ Notes
 
 from __future__ import annotations
 
+import atexit
 import enum
-import hashlib
 import json
 import os
 import sys
@@ -74,6 +74,10 @@ SPECIAL_CASE_MODEL_NAMES = {"MTime"}
 _FIELDS_TREE_CACHE: Dict[type[BaseModel], Dict[str, Any]] = {}
 _CACHE_LOCK = RLock()
 
+# Consolidated on-disk cache, loaded on the first miss of the in-memory cache
+_DISK_CACHE: Dict[str, Any] | None = None
+_DISK_CACHE_DIRTY = False
+
 # Environment flag to disable disk caching (e.g., for tests)
 _DISABLE_DISK_CACHE = os.environ.get("MT_METADATA_DISABLE_DISK_CACHE", "0") in {
     "1",
@@ -111,8 +115,9 @@ def get_all_fields_serializable(
     Notes
     -----
     - Uses a sentinel write to the cache prior to recursion to break cycles.
-    - The on-disk cache file name is derived from the class's fully-qualified name,
-      Pydantic version, and a fingerprint of the field schema.
+    - All trees are kept in a single on-disk cache file named after the
+      mt_metadata and Pydantic versions.  It is read once, on the first
+      class that is not in memory yet, and written when the process exits.
     """
     model_cls: type[BaseModel] = (
         model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
@@ -191,12 +196,20 @@ def flatten_field_tree_map(
 
 def clear_field_caches() -> None:
     """
-    Clear the in-memory field tree cache.
+    Clear the in-memory field tree cache and the serialization plans compiled
+    from it.
 
-    This does not remove any on-disk cache files.
+    The on-disk cache will be read again on the next lookup, this does not
+    remove the cache file.
     """
+    global _DISK_CACHE, _DISK_CACHE_DIRTY
+    from mt_metadata.base.serialization import clear_serialization_plans
+
     with _CACHE_LOCK:
         _FIELDS_TREE_CACHE.clear()
+        _DISK_CACHE = None
+        _DISK_CACHE_DIRTY = False
+    clear_serialization_plans()
 
 
 # -------------------------------
@@ -701,80 +714,108 @@ def _cache_dir() -> str:
 #     return path
 
 
-def _model_fingerprint(model_cls: type[BaseModel]) -> str:
+def _disk_cache_path() -> str:
     """
-    Compute a stable fingerprint for a model class's fields.
-
-    Parameters
-    ----------
-    model_cls : type[BaseModel]
-        The model class to fingerprint.
+    Construct the path of the consolidated on-disk field tree cache.
 
     Returns
     -------
     str
-        A SHA-256 hex digest representing the schema shape.
+        Absolute path to the cache JSON file.
 
     Notes
     -----
-    - Uses a sorted JSON of tuples:
-        (name, deprecated, annotation repr, default repr, json_schema_extra snapshot)
-    - Change in any of these will produce a different fingerprint, refreshing the disk cache.
+    - One file holds the trees of every model class.  Its name carries the
+      mt_metadata and Pydantic versions, so upgrading either starts a new
+      cache without having to fingerprint the models.
+    - The file is JSON rather than a memory-mapped binary format.  The field
+      trees are nested dictionaries of mixed types that have to be decoded
+      into Python objects before they can be returned, so a memory map
+      would not save the parse.  Instead the file is read with a single
+      `json.load` the first time a tree is needed, and never on import.
+    """
+    from mt_metadata import __version__
+
+    fname = f"field_trees__mt{__version__}__pyd{_PYDANTIC_VERSION}.json"
+    return os.path.join(_cache_dir(), fname)
+
+
+def _model_key(model_cls: type[BaseModel]) -> str:
     """
-    field_map = getattr(model_cls, "model_fields", None) or getattr(
-        model_cls, "__pydantic_fields__", {}
-    )
-    parts = []
-    for name, info in field_map.items():
-        extra = getattr(info, "json_schema_extra", None)
-        if isinstance(extra, dict):
-            try:
-                extra_snapshot = json.dumps(
-                    extra, sort_keys=True, separators=(",", ":"), ensure_ascii=False
-                )
-            except Exception:
-                extra_snapshot = []
-                print("Non-serializable json_schema_extra for field:", name)
-                for key, value in sorted(extra.items()):
-                    extra_snapshot.append((key, _safe_repr(value)))
-        else:
-            extra_snapshot = _safe_repr(extra)
-        parts.append(
-            (
-                name,
-                _safe_repr(getattr(info, "deprecated", None)),
-                repr(getattr(info, "annotation", None)),
-                _safe_repr(getattr(info, "default", None)),
-                extra_snapshot,
-            )
-        )
-    raw = json.dumps(sorted(parts), separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    Key of a model class in the consolidated cache.
+    """
+    return f"{model_cls.__module__}.{model_cls.__qualname__}"
 
 
-def _disk_cache_path(model_cls: type[BaseModel]) -> str:
+def _source_stamp(model_cls: type[BaseModel]) -> tuple[str, int] | None:
     """
-    Construct the on-disk cache path for a given model class.
+    Get the source file of the module defining a model class and its
+    modification time in nanoseconds.
 
-    Parameters
-    ----------
-    model_cls : type[BaseModel]
-        The model class.
+    Returns None if the module has no source file (e.g. defined in a
+    notebook or frozen), such classes are not written to disk.
+    """
+    module = sys.modules.get(model_cls.__module__)
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sources_unchanged(sources: Dict[str, int]) -> bool:
+    """
+    Check that none of the source files recorded in the cache changed.
+    """
+    for path, mtime_ns in sources.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _get_disk_cache() -> Dict[str, Any]:
+    """
+    Load the consolidated field tree cache from disk, once per process.
 
     Returns
     -------
-    str
-        Absolute path to the cache JSON file.
+    Dict[str, Any]
+        Cache content with keys ``"sources"`` (source file -> mtime) and
+        ``"trees"`` (model key -> field tree).
+
+    Notes
+    -----
+    - Returns an empty cache on any read/parse error.
+    - The whole cache is dropped if any recorded source file was modified,
+      which keeps editable installs from serving stale trees.
     """
-    fqname = f"{model_cls.__module__}.{model_cls.__qualname__}"
-    fp = _model_fingerprint(model_cls)
-    fname = f"{fqname}__pyd{_PYDANTIC_VERSION}__{fp}.json"
-    return os.path.join(_cache_dir(), fname)
+    global _DISK_CACHE
+
+    if _DISK_CACHE is None:
+        cache = None
+        path = _disk_cache_path()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as fid:
+                    cache = json.load(fid)
+                if not _sources_unchanged(cache["sources"]):
+                    cache = None
+            except Exception:
+                cache = None
+        if cache is None:
+            cache = {"sources": {}, "trees": {}}
+        _DISK_CACHE = cache
+    return _DISK_CACHE
 
 
 def _load_fields_from_disk(model_cls: type[BaseModel]) -> Dict[str, Any] | None:
     """
-    Load a serialized field tree from disk cache if present.
+    Get a serialized field tree from the consolidated disk cache.
 
     Parameters
     ----------
@@ -785,24 +826,13 @@ def _load_fields_from_disk(model_cls: type[BaseModel]) -> Dict[str, Any] | None:
     -------
     Dict[str, Any] or None
         The field tree if found, otherwise None.
-
-    Notes
-    -----
-    - Returns None on any read/parse error.
     """
-    path = _disk_cache_path(model_cls)
-    if not os.path.exists(path):
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
+    return _get_disk_cache()["trees"].get(_model_key(model_cls))
 
 
 def _save_fields_to_disk(model_cls: type[BaseModel], tree: Dict[str, Any]) -> None:
     """
-    Persist a serialized field tree to disk cache.
+    Add a serialized field tree to the consolidated disk cache.
 
     Parameters
     ----------
@@ -817,12 +847,51 @@ def _save_fields_to_disk(model_cls: type[BaseModel], tree: Dict[str, Any]) -> No
 
     Notes
     -----
-    - Overwrites any existing file for the same model fingerprint.
+    - The file is written once when the process exits (or on
+      `write_field_cache`), not once per class.
     """
-    path = _disk_cache_path(model_cls)
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(tree, f, indent=2, ensure_ascii=False)
-    except Exception:
-        # Best-effort caching; ignore write errors
-        pass
+    global _DISK_CACHE_DIRTY
+
+    stamp = _source_stamp(model_cls)
+    if stamp is None:
+        return
+    cache = _get_disk_cache()
+    cache["sources"][stamp[0]] = stamp[1]
+    cache["trees"][_model_key(model_cls)] = tree
+    _DISK_CACHE_DIRTY = True
+
+
+def write_field_cache() -> None:
+    """
+    Write the consolidated field tree cache to disk if it has new entries.
+
+    This is called automatically when the process exits.  Long running
+    processes can call it to persist the cache earlier.
+
+    Notes
+    -----
+    - The file is written to a temporary file and moved into place, so
+      concurrent processes never read a partial cache.
+    - Write errors are ignored, caching is best-effort.
+    """
+    global _DISK_CACHE_DIRTY
+
+    with _CACHE_LOCK:
+        if not _DISK_CACHE_DIRTY or _DISK_CACHE is None:
+            return
+        path = _disk_cache_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fid:
+                json.dump(_DISK_CACHE, fid, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp_path, path)
+            _DISK_CACHE_DIRTY = False
+        except Exception:
+            # Best-effort caching; ignore write errors
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+atexit.register(write_field_cache)
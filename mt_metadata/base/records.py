@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Read-only, array-backed records of MetadataBase objects.
+
+Catalog style workloads (listing the component, sample rate, time period and
+location of many channels) do not need full pydantic objects.  A record
+array is a NumPy structured array with one row per object and one column per
+flattened (dot-notation) attribute, so millions of entries fit in memory and
+can be filtered vectorially:
+
+>>> records = run.channels.to_records(["component", "sample_rate"])
+>>> records[records["sample_rate"] > 100]["component"]
+
+Columns are the attribute names of the serialization plan of each class
+(see `mt_metadata.base.serialization`), their dtype is picked from the
+values:
+
+=====================  ===============  ==============
+values                 dtype            missing value
+=====================  ===============  ==============
+int                    int64            -
+int, float             float64          NaN
+bool                   bool             -
+MTime                  datetime64[ns]   NaT
+str, Enum              unicode          ""
+anything else          object           None
+=====================  ===============  ==============
+
+Integer and boolean columns with missing values are written as float64 and
+object respectively.
+
+:copyright:
+    Jared Peacock (jpeacock@usgs.gov)
+
+:license: MIT
+
+"""
+
+from __future__ import annotations
+
+# =============================================================================
+# Imports
+# =============================================================================
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Iterable
+
+import numpy as np
+
+from . import serialization
+
+# =============================================================================
+# Globals
+# =============================================================================
+_MISSING = object()
+
+_KIND_CACHE: dict[type, str] = {}
+
+# =============================================================================
+# Values
+# =============================================================================
+
+
+def _get_value_kind(value_type: type) -> str:
+    """
+    Get the record kind of a value type, cached per type.
+    """
+    try:
+        return _KIND_CACHE[value_type]
+    except KeyError:
+        pass
+
+    # imported here, mt_metadata.common imports this package
+    from mt_metadata.common.list_dict import ListDict
+    from mt_metadata.common.mttime import MTime
+
+    if value_type is type(None):
+        kind = "none"
+    elif issubclass(value_type, (bool, np.bool_)):
+        kind = "bool"
+    elif issubclass(value_type, (int, np.integer)):
+        kind = "int"
+    elif issubclass(value_type, (float, np.floating)):
+        kind = "float"
+    elif issubclass(value_type, Enum):
+        kind = "enum"
+    elif issubclass(value_type, str):
+        kind = "str"
+    elif issubclass(value_type, ListDict):
+        kind = "collection"
+    elif issubclass(value_type, MTime):
+        kind = "time"
+    else:
+        kind = "object"
+    _KIND_CACHE[value_type] = kind
+    return kind
+
+
+def _column_dtype(kinds: set[str]) -> str:
+    """
+    Get the dtype of a column from the kinds of values it holds.
+    """
+    values = kinds - {"none"}
+    if values == {"int"} and "none" not in kinds:
+        return "i8"
+    if values and values <= {"int", "float"}:
+        return "f8"
+    if values == {"bool"} and "none" not in kinds:
+        return "?"
+    if values == {"time"}:
+        return "M8[ns]"
+    if values <= {"str", "enum"}:
+        return "U"
+    return "O"
+
+
+def _to_column(values: list[Any], kinds: set[str]) -> np.ndarray:
+    """
+    Convert the values of one attribute to a column array.
+    """
+    dtype = _column_dtype(kinds)
+    if dtype == "f8":
+        return np.array(
+            [np.nan if v is None or v is _MISSING else v for v in values], dtype=dtype
+        )
+    if dtype == "M8[ns]":
+        return np.array(
+            [
+                (
+                    np.datetime64("NaT", "ns")
+                    if v is None or v is _MISSING
+                    else np.datetime64(v.time_stamp.value, "ns")
+                )
+                for v in values
+            ],
+            dtype=dtype,
+        )
+    if dtype == "U":
+        return np.array(
+            [
+                (
+                    ""
+                    if v is None or v is _MISSING
+                    else str(v.value)
+                    if isinstance(v, Enum)
+                    else v
+                )
+                for v in values
+            ],
+            dtype=str,
+        )
+    if dtype == "O":
+        # fill item by item so lists are not broadcast
+        column = np.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            column[index] = None if value is _MISSING else value
+        return column
+    return np.array(values, dtype=dtype)
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Check if a record value is a missing value (NaN, NaT, "" or None).
+    """
+    if value is None:
+        return True
+    if isinstance(value, np.datetime64):
+        return bool(np.isnat(value))
+    if isinstance(value, (float, np.floating)):
+        return bool(np.isnan(value))
+    if isinstance(value, str):
+        return value == ""
+    return False
+
+
+def _from_record_value(value: Any) -> Any:
+    """
+    Convert a record value back to a value that can be validated.
+    """
+    if isinstance(value, np.datetime64):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# =============================================================================
+# Records
+# =============================================================================
+
+
+def get_record_fields(objects: Iterable[Any]) -> list[str]:
+    """
+    Get the attribute names written as columns for a set of objects.
+
+    The union of the attribute names of the classes of `objects`, sorted,
+    the same names used by `MetadataBase.to_dict`.
+
+    Parameters
+    ----------
+    objects : Iterable[MetadataBase]
+        Metadata objects, may be of different classes.
+
+    Returns
+    -------
+    list[str]
+        Sorted dotted attribute names.
+    """
+    names = set()
+    for model_cls in {type(obj) for obj in objects}:
+        names.update(serialization.get_serialization_plan(model_cls).attribute_names)
+    return sorted(names)
+
+
+def to_records(objects: Iterable[Any], fields: list[str] | None = None) -> np.ndarray:
+    """
+    Convert metadata objects to a read-only NumPy structured array.
+
+    Parameters
+    ----------
+    objects : Iterable[MetadataBase]
+        Metadata objects, may be of different classes (e.g. the Electric,
+        Magnetic and Auxiliary channels of a run).  Attributes an object
+        does not have are filled with the missing value of the column.
+    fields : list[str] | None, optional
+        Dotted attribute names to write, in order.  By default all
+        attributes of the classes of `objects` are written, except child
+        collections (e.g. `Station.runs`).
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with one row per object and one column per field.
+        The array is not writeable, use `from_records` to get objects back.
+
+    Examples
+    --------
+    >>> records = to_records(channels, ["component", "sample_rate"])
+    >>> records[records["component"] == "ex"]["sample_rate"]
+    """
+    objects = list(objects)
+    explicit = fields is not None
+    if fields is None:
+        fields = get_record_fields(objects)
+
+    columns = []
+    for name in fields:
+        getter = attrgetter(name)
+        values = []
+        kinds = set()
+        for obj in objects:
+            try:
+                value = getter(obj)
+            except AttributeError:
+                value = _MISSING
+                kinds.add("none")
+            else:
+                kinds.add(_get_value_kind(type(value)))
+            values.append(value)
+        if "collection" in kinds and not explicit:
+            continue
+        columns.append((name, _to_column(values, kinds)))
+
+    records = np.empty(
+        len(objects), dtype=[(name, column.dtype) for name, column in columns]
+    )
+    for name, column in columns:
+        records[name] = column
+    records.flags.writeable = False
+    return records
+
+
+def from_records(model_cls: type, records: np.ndarray) -> list[Any]:
+    """
+    Create metadata objects from a NumPy structured array.
+
+    Each row is validated once with ``from_dict(mode="bulk")``.  Missing
+    values (NaN, NaT, "" and None) leave the attribute at its default and
+    columns that are not attributes of `model_cls` are ignored.
+
+    Parameters
+    ----------
+    model_cls : type[MetadataBase]
+        Class of the objects to create.
+    records : np.ndarray
+        Structured array, as returned by `to_records`.  A single row is
+        also accepted.
+
+    Returns
+    -------
+    list[MetadataBase]
+        One object per row.
+    """
+    records = np.atleast_1d(records)
+    attribute_names = set(
+        serialization.get_serialization_plan(model_cls).attribute_names
+    )
+    names = [name for name in records.dtype.names if name in attribute_names]
+
+    objects = []
+    for row in records:
+        meta_dict = {}
+        for name in names:
+            value = row[name]
+            if _is_missing(value):
+                continue
+            meta_dict[name] = _from_record_value(value)
+        objects.append(model_cls.from_flat_dict(meta_dict))
+    return objects
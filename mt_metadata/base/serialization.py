@@ -0,0 +1,573 @@
+# -*- coding: utf-8 -*-
+"""
+Compiled serialization plans for MetadataBase objects.
+
+`MetadataBase.to_dict` used to re-walk the flattened field tree on every call,
+resolving each dotted attribute name, re-computing the list of required
+fields and re-running the Comment detection for every attribute.  None of
+that depends on the values of the object, only on its class, so it is
+compiled once per class into a :class:`SerializationPlan` and cached.
+
+A plan is an ordered tuple of :class:`FieldPlan` entries (one per dotted
+attribute name, sorted) that carry a C-level accessor
+(:func:`operator.attrgetter`) and the pre-computed flags used when filtering
+required output.  Values are encoded with small per-type encoder functions
+that are also resolved once per value type and cached.
+
+The output of :meth:`SerializationPlan.to_dict` is identical to the
+historical per-attribute walk, including the backwards compatible handling
+of "simple" comments.
+
+The same per-class information is used by :func:`fingerprint`, a canonical
+walk over the field values that produces a content hash used for fast
+equality checks.
+
+:copyright:
+    Jared Peacock (jpeacock@usgs.gov)
+
+:license: MIT
+
+"""
+
+from __future__ import annotations
+
+# =============================================================================
+# Imports
+# =============================================================================
+import hashlib
+from collections import OrderedDict
+from enum import Enum
+from operator import attrgetter, itemgetter
+from threading import RLock
+from typing import Any, Callable
+
+import numpy as np
+from loguru import logger
+
+from mt_metadata.utils.validators import validate_name
+
+from . import helpers, pydantic_helpers
+
+# =============================================================================
+# Globals
+# =============================================================================
+DEFAULT_TIME_STAMP = "1980-01-01T00:00:00+00:00"
+
+# values that are dropped from the output when ``required=True``
+EMPTY_OUTPUT_VALUES = [None, DEFAULT_TIME_STAMP, "1980", [], ""]
+
+# names of array fields that are always kept, even when all zeros
+ALWAYS_KEEP_ARRAYS = {"zeros", "poles"}
+
+# value types whose contribution to a fingerprint can be cached, anything
+# else may be mutated in place and is hashed on every call
+FINGERPRINT_SCALAR_TYPES = (str, int, float, bool, complex, type(None))
+
+_PLAN_CACHE: dict[type, "SerializationPlan"] = {}
+_ENCODER_CACHE: dict[type, Callable | None] = {}
+_FINGERPRINT_KIND_CACHE: dict[type, str] = {}
+_PLAN_LOCK = RLock()
+
+# =============================================================================
+# Value encoders
+# =============================================================================
+
+
+def is_simple_comment(comment_obj: Any) -> bool:
+    """
+    Check if a Comment only has a value set (no author or custom time stamp).
+
+    Simple comments are written as a plain string for backwards
+    compatibility.
+
+    Parameters
+    ----------
+    comment_obj : Comment
+        Comment object to check.
+
+    Returns
+    -------
+    bool
+        True if the comment can be represented by its value string.
+    """
+    return (
+        hasattr(comment_obj, "value")
+        and comment_obj.value is not None
+        and isinstance(comment_obj.value, str)
+        and (
+            not hasattr(comment_obj, "author")
+            or comment_obj.author is None
+            or comment_obj.author == ""
+        )
+        and (
+            not hasattr(comment_obj, "time_stamp")
+            or comment_obj.time_stamp is None
+            or str(comment_obj.time_stamp) == DEFAULT_TIME_STAMP
+        )
+    )
+
+
+def _encode_comment(value: Any, nested: bool, required: bool) -> Any:
+    if is_simple_comment(value) and not nested:
+        return str(value.value)
+    return value.to_dict(nested=nested, required=required)
+
+
+def _encode_to_dict(value: Any, nested: bool, required: bool) -> Any:
+    return value.to_dict(nested=nested, required=required)
+
+
+def _encode_dict(value: dict, nested: bool, required: bool) -> dict:
+    for key, obj in value.items():
+        if hasattr(obj, "to_dict"):
+            value[key] = obj.to_dict(nested=nested, required=required)
+        elif isinstance(obj, Enum):
+            value[key] = obj.value
+        else:
+            value[key] = obj
+    return value
+
+
+def _encode_list(value: list, nested: bool, required: bool) -> list:
+    v_list = []
+    for obj in value:
+        if hasattr(obj, "to_dict"):
+            v_list.append(obj.to_dict(nested=nested, required=required))
+        elif isinstance(obj, Enum):
+            v_list.append(obj.value)
+        else:
+            v_list.append(obj)
+    return v_list
+
+
+def _encode_enum(value: Enum, nested: bool, required: bool) -> Any:
+    return value.value
+
+
+def _encode_unicode_string(value: Any, nested: bool, required: bool) -> str:
+    return value.unicode_string()
+
+
+def get_encoder(value_type: type) -> Callable | None:
+    """
+    Get the encoder used by `to_dict` for a given value type.
+
+    The dispatch order mirrors the historical isinstance ladder in
+    `MetadataBase.to_dict`.  Results are cached per type.
+
+    Parameters
+    ----------
+    value_type : type
+        Type of the value to encode.
+
+    Returns
+    -------
+    Callable | None
+        Encoder with signature ``encoder(value, nested, required)`` or None
+        if the value is written as is.
+    """
+    try:
+        return _ENCODER_CACHE[value_type]
+    except KeyError:
+        pass
+
+    if value_type.__name__ == "Comment":
+        encoder = _encode_comment
+    elif hasattr(value_type, "to_dict"):
+        encoder = _encode_to_dict
+    elif issubclass(value_type, dict):
+        encoder = _encode_dict
+    elif issubclass(value_type, list):
+        encoder = _encode_list
+    elif issubclass(value_type, Enum):
+        encoder = _encode_enum
+    elif hasattr(value_type, "unicode_string"):
+        encoder = _encode_unicode_string
+    else:
+        encoder = None
+    _ENCODER_CACHE[value_type] = encoder
+    return encoder
+
+
+# =============================================================================
+# Plans
+# =============================================================================
+
+
+class FieldPlan:
+    """
+    Compiled serialization information for a single dotted attribute.
+
+    Parameters
+    ----------
+    name : str
+        Dotted attribute name, e.g. 'location.latitude'.
+    required : bool
+        Whether the attribute is required by the metadata standards.
+    comment_bases : set[str]
+        All attribute names in the plan that may hold a Comment object.
+    """
+
+    __slots__ = (
+        "name",
+        "getter",
+        "comment_base",
+        "comment_getter",
+        "comment_prefixes",
+        "always_include",
+        "zero_as_none",
+        "empty_as_none",
+        "keep_array",
+    )
+
+    def __init__(self, name: str, required: bool, comment_bases: set[str]) -> None:
+        self.name = name
+        self.getter = attrgetter(name)
+
+        if ".value" in name:
+            self.comment_base = name.replace(".value", "")
+            self.comment_getter = attrgetter(self.comment_base)
+        else:
+            self.comment_base = None
+            self.comment_getter = None
+
+        self.comment_prefixes = tuple(
+            base for base in sorted(comment_bases) if name.startswith(f"{base}.")
+        )
+
+        self.zero_as_none = helpers._should_include_coordinate_field(name)
+        self.empty_as_none = helpers._should_convert_none_to_empty_string(name)
+        self.always_include = required or self.zero_as_none or self.empty_as_none
+        self.keep_array = name in ALWAYS_KEEP_ARRAYS
+
+    def __repr__(self) -> str:
+        return f"FieldPlan({self.name})"
+
+
+class SerializationPlan:
+    """
+    Compiled, per-class plan used by `MetadataBase.to_dict`.
+
+    Parameters
+    ----------
+    model_cls : type
+        MetadataBase subclass to compile the plan for.
+
+    Attributes
+    ----------
+    class_name : str
+        Name of the class as written as the root key of `to_dict`.
+    attribute_names : tuple[str, ...]
+        Sorted dotted attribute names.
+    model_field_names : tuple[str, ...]
+        Sorted names of the top level model fields.
+    required_fields : list[str]
+        Attributes that are required by the metadata standards.
+    fields : tuple[FieldPlan, ...]
+        Compiled entries, one per attribute, in sorted order.
+    """
+
+    def __init__(self, model_cls: type) -> None:
+        self.model_cls = model_cls
+        self.class_name = validate_name(model_cls.__name__)
+        self.field_map = pydantic_helpers.flatten_field_tree_map(
+            pydantic_helpers.get_all_fields_serializable(model_cls)
+        )
+        self.attribute_names = tuple(sorted(self.field_map.keys()))
+        self.model_field_names = tuple(sorted(model_cls.model_fields.keys()))
+        self.required_fields = [
+            name
+            for name, field_dict in self.field_map.items()
+            if field_dict.get("required", False)
+        ]
+        required = set(self.required_fields)
+        comment_bases = {
+            name.replace(".value", "")
+            for name in self.attribute_names
+            if ".value" in name
+        }
+        self.fields = tuple(
+            FieldPlan(name, name in required, comment_bases)
+            for name in self.attribute_names
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"SerializationPlan({self.model_cls.__name__}, n_fields={len(self.fields)})"
+        )
+
+    def to_dict(
+        self,
+        obj: Any,
+        nested: bool = False,
+        single: bool = False,
+        required: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Serialize an object with the compiled plan.
+
+        See `MetadataBase.to_dict` for a description of the parameters.
+        """
+        meta_dict = {}
+
+        # Keep track of processed comment attributes to avoid duplication
+        processed_comments = set()
+
+        for field in self.fields:
+            name = field.name
+            # Special handling for comment attributes for backwards compatibility
+            if (
+                field.comment_base is not None
+                and field.comment_base not in processed_comments
+            ):
+                try:
+                    comment_obj = field.comment_getter(obj)
+                    if (
+                        comment_obj.__class__.__name__ == "Comment"
+                        and not nested
+                        and is_simple_comment(comment_obj)
+                    ):
+                        if not required or comment_obj.value not in EMPTY_OUTPUT_VALUES:
+                            meta_dict[field.comment_base] = str(comment_obj.value)
+                        processed_comments.add(field.comment_base)
+                        continue
+                except (AttributeError, KeyError):
+                    pass
+
+            # Skip nested comment attributes if we already processed the base comment
+            if processed_comments and any(
+                prefix in processed_comments for prefix in field.comment_prefixes
+            ):
+                continue
+
+            try:
+                value = field.getter(obj)
+                encoder = get_encoder(type(value))
+                if encoder is not None:
+                    value = encoder(value, nested, required)
+            except AttributeError as error:
+                logger.debug(error)
+                value = None
+
+            if required:
+                if isinstance(value, np.ndarray):
+                    if field.keep_array or value.all() != 0:
+                        meta_dict[name] = value
+                elif hasattr(value, "size"):
+                    if value.size > 0:
+                        meta_dict[name] = value
+                elif value not in EMPTY_OUTPUT_VALUES or field.always_include:
+                    # Convert None coordinate fields to 0.0 for backward compatibility
+                    if field.zero_as_none and value is None:
+                        value = 0.0
+                    # Convert None string fields to empty string for backward compatibility
+                    elif field.empty_as_none and value is None:
+                        value = ""
+                    meta_dict[name] = value
+            else:
+                meta_dict[name] = value
+
+        if nested:
+            meta_dict = helpers.structure_dict(meta_dict)
+        meta_dict = OrderedDict(sorted(meta_dict.items(), key=itemgetter(0)))
+
+        if single:
+            return meta_dict
+        return {self.class_name: meta_dict}
+
+
+# =============================================================================
+# Fingerprints
+# =============================================================================
+
+
+def _get_fingerprint_kind(value_type: type) -> str:
+    """
+    Get how values of a given type are hashed, cached per type.
+    """
+    try:
+        return _FINGERPRINT_KIND_CACHE[value_type]
+    except KeyError:
+        pass
+
+    # imported here, mt_metadata.common imports this package
+    from mt_metadata.common.list_dict import ListDict
+
+    if issubclass(value_type, FINGERPRINT_SCALAR_TYPES):
+        kind = "scalar"
+    elif issubclass(value_type, ListDict):
+        kind = "collection"
+    elif hasattr(value_type, "fingerprint") and hasattr(value_type, "model_fields"):
+        kind = "metadata"
+    elif issubclass(value_type, Enum):
+        kind = "enum"
+    elif issubclass(value_type, np.ndarray):
+        kind = "array"
+    elif issubclass(value_type, (list, tuple)):
+        kind = "list"
+    elif issubclass(value_type, dict) or hasattr(value_type, "items"):
+        kind = "dict"
+    elif hasattr(value_type, "isoformat"):
+        kind = "time"
+    elif hasattr(value_type, "model_dump"):
+        kind = "model"
+    else:
+        kind = "repr"
+    _FINGERPRINT_KIND_CACHE[value_type] = kind
+    return kind
+
+
+def _hash_value(digest: Any, value: Any, skip: tuple[str, ...]) -> None:
+    """
+    Feed a canonical representation of `value` into `digest`.
+    """
+    kind = _get_fingerprint_kind(type(value))
+    if kind == "scalar":
+        digest.update(repr(value).encode())
+    elif kind == "metadata":
+        digest.update(b"M")
+        digest.update(_fingerprint_bytes(value, skip))
+    elif kind == "list":
+        digest.update(b"[")
+        for item in value:
+            _hash_value(digest, item, skip)
+            digest.update(b",")
+        digest.update(b"]")
+    elif kind == "dict":
+        digest.update(b"{")
+        for key, item in value.items():
+            digest.update(repr(key).encode())
+            digest.update(b":")
+            _hash_value(digest, item, skip)
+            digest.update(b",")
+        digest.update(b"}")
+    elif kind == "collection":
+        return
+    elif kind == "time":
+        digest.update(str(value.isoformat()).encode())
+    elif kind == "enum":
+        digest.update(repr(value.value).encode())
+    elif kind == "array":
+        digest.update(f"A{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif kind == "model":
+        digest.update(type(value).__name__.encode())
+        _hash_value(digest, value.model_dump(), skip)
+    else:
+        digest.update(repr(value).encode())
+
+
+def _fingerprint_bytes(obj: Any, skip: tuple[str, ...]) -> bytes:
+    """
+    Compute the fingerprint digest of a MetadataBase object.
+
+    The part of the digest made of scalar field values is cached on the
+    object (keyed by `skip`) and dropped when a field is assigned.  Values
+    that can be mutated in place (nested objects, lists, arrays, ...) are
+    hashed on every call, nested metadata objects use their own cache.
+    Child collections held in a `ListDict` (runs, channels, ...) are not
+    part of the digest, the same as in `to_dict`.
+    """
+    private = obj.__pydantic_private__
+    cache = private.get("_fingerprints")
+    if cache is None:
+        cache = private["_fingerprints"] = {}
+
+    try:
+        scalar_digest, other_names = cache[skip]
+    except KeyError:
+        values = obj.__dict__
+        extra = obj.__pydantic_extra__ or {}
+        names = get_serialization_plan(obj).model_field_names
+        if extra:
+            names = names + tuple(sorted(extra))
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(type(obj).__name__.encode())
+        other_names = []
+        for name in names:
+            if skip and any(skip_key in name for skip_key in skip):
+                continue
+            value = values[name] if name in values else extra.get(name)
+            kind = _get_fingerprint_kind(type(value))
+            if kind == "scalar":
+                digest.update(f"{name}={value!r};".encode())
+            elif kind != "collection":
+                other_names.append(name)
+        scalar_digest = digest.digest()
+        other_names = tuple(other_names)
+        cache[skip] = (scalar_digest, other_names)
+
+    if not other_names:
+        return scalar_digest
+
+    values = obj.__dict__
+    extra = obj.__pydantic_extra__ or {}
+    digest = hashlib.blake2b(scalar_digest, digest_size=16)
+    for name in other_names:
+        digest.update(f"{name}=".encode())
+        _hash_value(digest, values[name] if name in values else extra.get(name), skip)
+        digest.update(b";")
+    return digest.digest()
+
+
+def fingerprint(obj: Any, skip: list[str] | tuple[str, ...] = ()) -> str:
+    """
+    Content hash of a MetadataBase object and everything it holds.
+
+    Field values are walked in a canonical (sorted) order.  Fields whose name
+    contains any of the strings in `skip` are left out, at every level, the
+    same way `MetadataBase.__eq__` skips ``_skip_equals``.  Child collections
+    held in a `ListDict` (e.g. `Station.runs`) are not included, matching
+    what `to_dict` and `__eq__` compare.
+
+    Parameters
+    ----------
+    obj : MetadataBase
+        Object to hash.
+    skip : list[str] | tuple[str, ...], optional
+        Field names (or parts of names) to leave out, by default ().
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.  Equal digests mean equal field values for
+        objects of the same class.
+    """
+    return _fingerprint_bytes(obj, tuple(skip)).hex()
+
+
+def get_serialization_plan(model_or_cls: Any) -> SerializationPlan:
+    """
+    Get the cached serialization plan for a MetadataBase class or instance.
+
+    Parameters
+    ----------
+    model_or_cls : type | MetadataBase
+        Class or instance to get the plan for.
+
+    Returns
+    -------
+    SerializationPlan
+        Compiled plan, built on first request and cached per class.
+    """
+    model_cls = model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
+    try:
+        return _PLAN_CACHE[model_cls]
+    except KeyError:
+        pass
+
+    with _PLAN_LOCK:
+        if model_cls not in _PLAN_CACHE:
+            _PLAN_CACHE[model_cls] = SerializationPlan(model_cls)
+        return _PLAN_CACHE[model_cls]
+
+
+def clear_serialization_plans() -> None:
+    """
+    Clear the cached serialization plans, value encoders and fingerprint
+    value kinds.
+    """
+    with _PLAN_LOCK:
+        _PLAN_CACHE.clear()
+        _ENCODER_CACHE.clear()
+        _FINGERPRINT_KIND_CACHE.clear()
@@ -331,6 +331,43 @@ class ListDict:
         self._home = new_home
         return updates
 
+    def to_records(self, fields=None):
+        """
+        Convert the items to a read-only NumPy structured array, one row per
+        item.  Items can be of different metadata classes, see
+        :func:`mt_metadata.base.records.to_records`.
+
+        :param fields: dotted attribute names to write, defaults to all
+        :type fields: list of str, optional
+        :return: structured array of the items
+        :rtype: numpy.ndarray
+
+        """
+        from mt_metadata.base.records import to_records
+
+        return to_records(self.values(), fields=fields)
+
+    @classmethod
+    def from_records(cls, records, model_cls):
+        """
+        Create a ListDict from a NumPy structured array, one item per row,
+        keyed the same way as :meth:`append`.
+
+        :param records: structured array as returned by :meth:`to_records`
+        :type records: numpy.ndarray
+        :param model_cls: metadata class of the items
+        :type model_cls: type
+        :return: new ListDict
+        :rtype: ListDict
+
+        """
+        from mt_metadata.base.records import from_records
+
+        list_dict = cls()
+        for obj in from_records(model_cls, records):
+            list_dict.append(obj)
+        return list_dict
+
     def to_dict(self, single=False, nested=False, required=False) -> None:
         """need to implement this method"""
         return None
@@ -4,11 +4,10 @@
 from typing import Annotated
 
 from pydantic import AliasChoices, Field, field_validator, ValidationInfo
-from pyproj import CRS
 
 from mt_metadata.base import MetadataBase
 from mt_metadata.common import Declination, GeographicLocation
-from mt_metadata.utils.location_helpers import validate_position
+from mt_metadata.utils.location_helpers import get_datum_name, validate_position
 
 # =====================================================
 
@@ -131,8 +130,7 @@ class BasicLocation(BasicLocationNoDatum):
         Validate the datum value and convert it to the appropriate enum type.
         """
         try:
-            datum_crs = CRS.from_user_input(value)
-            return datum_crs.name
+            return get_datum_name(value)
         except Exception:
             raise ValueError(
                 f"Invalid datum value: {value}. Must be a valid CRS string or identifier."
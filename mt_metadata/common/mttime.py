@@ -21,13 +21,6 @@ from dateutil.parser import parse as dtparser
 from loguru import logger
 from pandas._libs.tslibs import OutOfBoundsDatetime
 
-try:
-    from obspy.core.utcdatetime import UTCDateTime  # for type hinting
-
-    from_obspy = True
-except ImportError:
-    from_obspy = False
-
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -10,6 +10,7 @@ case strings.
 """
 
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Annotated
 
 # =============================================================================
@@ -392,9 +393,14 @@ def get_unit_object(unit: str, allow_none=True) -> Unit:
     return unit
 
 
-def get_unit_from_df(value: str, allow_none=True) -> Unit:
+@lru_cache(maxsize=512)
+def _find_unit_row(value: str) -> tuple[tuple[str, str], ...] | None:
     """
-    Retrieve a row from the UNITS_DF DataFrame based on the unit's name or symbol.
+    Find the first row of UNITS_DF matching a unit name or symbol.
+
+    Filtering the DataFrame is slow compared to validating a metadata
+    object, and the same few units are looked up for every channel and
+    filter, so results are cached.
 
     Parameters
     ----------
@@ -403,13 +409,8 @@ def get_unit_from_df(value: str, allow_none=True) -> Unit:
 
     Returns
     -------
-    pd.Series
-        A row from the UNITS_DF DataFrame corresponding to the given name or symbol.
-
-    Raises
-    ------
-    KeyError
-        If the unit is not found in the DataFrame.
+    tuple[tuple[str, str], ...] | None
+        (column, value) pairs of the matching row, None if not found.
     """
     # First try exact match for symbol (case-sensitive) to handle prefixes correctly
     # (e.g., 'mV' should match milliVolt, not megaVolt)
@@ -422,11 +423,35 @@ def get_unit_from_df(value: str, allow_none=True) -> Unit:
     if unit_row.empty and len(value) == 1:
         unit_row = UNITS_DF[UNITS_DF["symbol"].str.lower() == value.lower()]
 
+    if unit_row.empty:
+        return None
+    return tuple(unit_row.iloc[0].to_dict().items())
+
+
+def get_unit_from_df(value: str, allow_none=True) -> Unit:
+    """
+    Retrieve a row from the UNITS_DF DataFrame based on the unit's name or symbol.
+
+    Parameters
+    ----------
+    value : str
+        The name or symbol of the unit to search for.
+
+    Returns
+    -------
+    pd.Series
+        A row from the UNITS_DF DataFrame corresponding to the given name or symbol.
+
+    Raises
+    ------
+    KeyError
+        If the unit is not found in the DataFrame.
+    """
+    unit_row = _find_unit_row(value)
+
     # Check if a match was found
-    if not unit_row.empty:
-        return Unit(
-            **unit_row.iloc[0].to_dict()
-        )  # Return the first matching row as a Series
+    if unit_row is not None:
+        return Unit(**dict(unit_row))
     else:
         if allow_none:
             logger.warning(
@@ -10,7 +10,6 @@ from typing import Annotated
 
 import numpy as np
 import pandas as pd
-import scipy.signal as ssig
 from pydantic import AliasChoices, computed_field, Field, field_validator, PrivateAttr
 
 from mt_metadata.base import MetadataBase
@@ -178,6 +177,9 @@ class Window(MetadataBase):
 
         """
         if self._taper is None:
+            # scipy.signal is slow to import, only load it when needed
+            import scipy.signal as ssig
+
             # Repackaging the args so that scipy.signal.get_window() accepts all cases
             window_args = [v for k, v in self.additional_args.items()]
             window_args.insert(0, self.type)
@@ -37,23 +37,42 @@ Created on Sun Apr 24 20:50:41 2020
 
 """
 
-### !!! DO NOT CHANGE THE ORDER !!!
+# Classes are imported on first access (PEP 562) so that importing a single
+# class does not build every metadata model in the package.
+import importlib
 
-from .diagnostic import Diagnostic
-from .battery import Battery
-from .electrode import Electrode
-from .timing_system import TimingSystem
-from .filtered import AppliedFilter
-from .filters.filter_base import FilterBase
-from .data_logger import DataLogger
-from .channel import Channel, ChannelBase
-from .auxiliary import Auxiliary
-from .electric import Electric
-from .magnetic import Magnetic
-from .run import Run
-from .station import Station
-from .survey import Survey
-from .experiment import Experiment
+_LAZY_IMPORTS = {
+    "Diagnostic": ".diagnostic",
+    "Battery": ".battery",
+    "Electrode": ".electrode",
+    "TimingSystem": ".timing_system",
+    "AppliedFilter": ".filtered",
+    "FilterBase": ".filters.filter_base",
+    "DataLogger": ".data_logger",
+    "Channel": ".channel",
+    "ChannelBase": ".channel",
+    "Auxiliary": ".auxiliary",
+    "Electric": ".electric",
+    "Magnetic": ".magnetic",
+    "Run": ".run",
+    "Station": ".station",
+    "Survey": ".survey",
+    "Experiment": ".experiment",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
@@ -3,7 +3,7 @@
 # =====================================================
 
 from collections import OrderedDict
-from typing import Annotated
+from typing import Annotated, Literal
 
 import numpy as np
 from loguru import logger
@@ -16,7 +16,6 @@ from pydantic import (
     ValidationInfo,
 )
 
-from mt_metadata import NULL_VALUES
 from mt_metadata.base import helpers, MetadataBase
 from mt_metadata.common import (
     BasicLocation,
@@ -682,7 +681,12 @@ class ChannelBase(MetadataBase):
 
         return None
 
-    def from_dict(self, meta_dict: dict, skip_none: bool = False) -> None:
+    def from_dict(
+        self,
+        meta_dict: dict,
+        skip_none: bool = False,
+        mode: Literal["attribute", "bulk"] = "attribute",
+    ) -> None:
         """
         Fill attributes from a dictionary with backwards compatibility for legacy filter formats.
 
@@ -692,6 +696,9 @@ class ChannelBase(MetadataBase):
             Dictionary of attributes to set.
         skip_none : bool, optional
             If True, skip attributes with None values, by default False.
+        mode : {"attribute", "bulk"}, optional
+            Validate on every attribute or once per object, see
+            `MetadataBase.update_attributes`, by default "attribute".
 
         Raises
         -------
@@ -776,14 +783,20 @@ class ChannelBase(MetadataBase):
                     f"The '{filter_format}' attribute is deprecated and will be ignored. Use 'filters' as a list of AppliedFilter objects instead."
                 )
 
+        # A single filter read from XML is a dictionary, not a list, and is
+        # flattened with the rest
+        single_filter = {
+            key.split(".", 2)[2]: meta_dict.pop(key)
+            for key in list(meta_dict)
+            if key.startswith("filters.applied_filter.")
+        }
+        if single_filter:
+            meta_dict["filters"] = [{"applied_filter": single_filter}]
+
         # Handle new format filters separately to combine with old format
         new_format_filters = meta_dict.pop("filters", None)
 
-        for name, value in meta_dict.items():
-            if skip_none:
-                if value in NULL_VALUES:
-                    continue
-            self.update_attribute(name, value)
+        self.update_attributes(meta_dict, skip_none=skip_none, mode=mode)
 
         # Process new format filters after other attributes, adding to existing filters
         if new_format_filters is not None:
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar (Arrow/Parquet) tables of an Experiment.
+
+The metadata tree is written as one table per level::
+
+    survey, station, run, channel, filter
+
+with one row per object and one column per flattened (dot-notation)
+attribute, the same columns as `mt_metadata.base.records`.  Each table also
+has key columns that link a row to its parents:
+
+==========  ===================================================
+level       key columns
+==========  ===================================================
+survey      _survey
+station     _survey, _station
+run         _survey, _station, _run
+channel     _survey, _station, _run, _channel, _class
+filter      _survey, _filter, _class
+==========  ===================================================
+
+Values that are not simple scalars (lists, arrays, nested lists of objects)
+are stored as JSON strings, the names of those columns are kept in the
+table schema metadata.
+
+A catalog can query the Parquet files without building any metadata
+objects, using column projection and predicate pushdown:
+
+>>> table = read_parquet(
+...     "archive",
+...     "channel",
+...     columns=["_station", "component", "sample_rate"],
+...     filters=[("_class", "==", "Magnetic"), ("sample_rate", ">", 100)],
+... )
+
+pyarrow is an optional dependency (``pip install mt_metadata[parquet]``).
+
+:copyright:
+    Jared Peacock (jpeacock@usgs.gov)
+
+:license: MIT
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import json
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+import pandas as pd
+
+from mt_metadata.base import records
+from mt_metadata.base.helpers import (
+    array_hook,
+    ArrayEncoder,
+    module_available,
+    requires,
+)
+from mt_metadata.base.serialization import get_encoder
+
+from . import Auxiliary, Electric, Magnetic, Run, Station, Survey
+from .filters import (
+    CoefficientFilter,
+    FIRFilter,
+    FrequencyResponseTableFilter,
+    PoleZeroFilter,
+    TimeDelayFilter,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# =============================================================================
+# Globals
+# =============================================================================
+LEVELS = ("survey", "station", "run", "channel", "filter")
+
+KEY_COLUMNS = {
+    "survey": ["_survey"],
+    "station": ["_survey", "_station"],
+    "run": ["_survey", "_station", "_run"],
+    "channel": ["_survey", "_station", "_run", "_channel", "_class"],
+    "filter": ["_survey", "_filter", "_class"],
+}
+
+CHANNEL_CLASSES = {cls.__name__: cls for cls in (Electric, Magnetic, Auxiliary)}
+CHANNELS_RECORDED_KEYS = [
+    "channels_recorded_electric",
+    "channels_recorded_magnetic",
+    "channels_recorded_auxiliary",
+]
+FILTER_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        PoleZeroFilter,
+        CoefficientFilter,
+        TimeDelayFilter,
+        FrequencyResponseTableFilter,
+        FIRFilter,
+    )
+}
+
+# schema metadata key holding the names of the JSON encoded columns
+JSON_COLUMNS_KEY = b"mt_metadata.json_columns"
+
+# =============================================================================
+# JSON values
+# =============================================================================
+
+
+def _encode_json_value(value: Any) -> str:
+    """
+    Encode a non-scalar value as a JSON string.
+
+    Metadata objects are written with ``to_dict(nested=True)`` and numpy
+    arrays keep their dtype so complex poles and zeros can be read back.
+    """
+    if isinstance(value, dict):
+        # the dict encoder works in place
+        value = dict(value)
+    encoder = get_encoder(type(value))
+    if encoder is not None:
+        value = encoder(value, True, False)
+    return json.dumps(value, cls=ArrayEncoder)
+
+
+def _decode_json_value(value: str) -> Any:
+    """
+    Decode a JSON string written by `_encode_json_value`.
+    """
+    return json.loads(value, object_hook=array_hook)
+
+
+# =============================================================================
+# Tables
+# =============================================================================
+
+
+def _to_table(keys: dict[str, list], objects: list) -> "pyarrow.Table":
+    """
+    Make an Arrow table from key columns and metadata objects.
+    """
+    import pyarrow as pa
+
+    record_array = records.to_records(objects)
+    columns = {
+        name: pa.array(values, type=pa.string()) for name, values in keys.items()
+    }
+    json_columns = []
+    for name in record_array.dtype.names:
+        column = record_array[name]
+        if column.dtype == object:
+            columns[name] = pa.array(
+                [None if v is None else _encode_json_value(v) for v in column],
+                type=pa.string(),
+            )
+            json_columns.append(name)
+        else:
+            columns[name] = pa.array(column, from_pandas=True)
+
+    table = pa.table(columns)
+    return table.replace_schema_metadata(
+        {JSON_COLUMNS_KEY: json.dumps(json_columns).encode()}
+    )
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Missing value of a table cell.  Depending on the pandas version null
+    strings come back as None or NaN.
+    """
+    if isinstance(value, str):
+        return value == ""
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
+def _from_table(table: "pyarrow.Table", level: str) -> list[dict[str, Any]]:
+    """
+    Convert an Arrow table to flat dictionaries, one per row, leaving out
+    missing values.  Key columns are always kept.
+    """
+    metadata = table.schema.metadata or {}
+    json_columns = set(json.loads(metadata.get(JSON_COLUMNS_KEY, b"[]")))
+    key_columns = KEY_COLUMNS[level]
+
+    rows = []
+    for row in table.to_pandas().to_dict("records"):
+        meta_dict = {}
+        for name, value in row.items():
+            if name in key_columns:
+                meta_dict[name] = value
+            elif _is_missing(value):
+                continue
+            elif name in json_columns:
+                meta_dict[name] = _decode_json_value(value)
+            else:
+                meta_dict[name] = value
+        rows.append(meta_dict)
+    return rows
+
+
+def _pop_keys(meta_dict: dict[str, Any], level: str) -> list[str]:
+    """
+    Pop the key columns of a level from a row.
+    """
+    return [meta_dict.pop(key, None) for key in KEY_COLUMNS[level]]
+
+
+@requires(pyarrow=module_available("pyarrow"))
+def experiment_to_arrow(experiment) -> dict[str, "pyarrow.Table"]:
+    """
+    Convert an Experiment to Arrow tables, one per level.
+
+    Parameters
+    ----------
+    experiment : Experiment
+        Experiment to convert.
+
+    Returns
+    -------
+    dict[str, pyarrow.Table]
+        Tables keyed by level name, see `LEVELS`.
+    """
+    keys = {level: {name: [] for name in KEY_COLUMNS[level]} for level in LEVELS}
+    objects = {level: [] for level in LEVELS}
+
+    def add(level, obj, *key_values):
+        for name, value in zip(KEY_COLUMNS[level], key_values):
+            keys[level][name].append(value)
+        objects[level].append(obj)
+
+    for survey_key, survey in experiment.surveys.items():
+        add("survey", survey, survey_key)
+        for filter_key, mt_filter in survey.filters.items():
+            add("filter", mt_filter, survey_key, filter_key, type(mt_filter).__name__)
+        for station_key, station in survey.stations.items():
+            add("station", station, survey_key, station_key)
+            for run_key, run in station.runs.items():
+                add("run", run, survey_key, station_key, run_key)
+                for channel_key, channel in run.channels.items():
+                    add(
+                        "channel",
+                        channel,
+                        survey_key,
+                        station_key,
+                        run_key,
+                        channel_key,
+                        type(channel).__name__,
+                    )
+
+    return {level: _to_table(keys[level], objects[level]) for level in LEVELS}
+
+
+@requires(pyarrow=module_available("pyarrow"))
+def experiment_from_arrow(experiment, tables: dict[str, "pyarrow.Table"]) -> None:
+    """
+    Fill an Experiment from Arrow tables made by `experiment_to_arrow`.
+
+    Parameters
+    ----------
+    experiment : Experiment
+        Experiment to add the surveys to.
+    tables : dict[str, pyarrow.Table]
+        Tables keyed by level name.  Rows can be a subset of the written
+        rows, children without a parent row are skipped.
+    """
+    surveys = {}
+    for meta_dict in _from_table(tables["survey"], "survey"):
+        (survey_key,) = _pop_keys(meta_dict, "survey")
+        survey = Survey()
+        survey.from_dict(meta_dict, mode="bulk")
+        surveys[survey_key] = survey
+
+    for meta_dict in _from_table(tables["filter"], "filter"):
+        survey_key, filter_key, class_name = _pop_keys(meta_dict, "filter")
+        if survey_key in surveys:
+            mt_filter = FILTER_CLASSES[class_name].from_flat_dict(meta_dict)
+            surveys[survey_key].filters[filter_key] = mt_filter
+
+    channels = {}
+    for meta_dict in _from_table(tables["channel"], "channel"):
+        *run_key, _, class_name = _pop_keys(meta_dict, "channel")
+        channel = CHANNEL_CLASSES[class_name].from_flat_dict(meta_dict)
+        channels.setdefault(tuple(run_key), []).append(channel)
+
+    runs = {}
+    for meta_dict in _from_table(tables["run"], "run"):
+        run_key = tuple(_pop_keys(meta_dict, "run"))
+        run_channels = channels.get(run_key, [])
+        # Run makes a channel for every component recorded, keep only the
+        # components of the channel rows that were read
+        components = [channel.component for channel in run_channels]
+        for key in CHANNELS_RECORDED_KEYS:
+            if key in meta_dict:
+                meta_dict[key] = [c for c in meta_dict[key] if c in components]
+        run = Run()
+        for channel in run_channels:
+            run.add_channel(channel)
+        run.from_dict(meta_dict, mode="bulk")
+        runs.setdefault(run_key[:2], []).append(run)
+
+    for meta_dict in _from_table(tables["station"], "station"):
+        station_key = tuple(_pop_keys(meta_dict, "station"))
+        if station_key[0] not in surveys:
+            continue
+        station_runs = runs.get(station_key, [])
+        # Station makes an empty run for every run listed and puts the
+        # channels recorded into the first one, so attach the runs that were
+        # read and list only those
+        run_ids = [run.id for run in station_runs]
+        components = {c for run in station_runs for c in run.channels_recorded_all}
+        if "run_list" in meta_dict:
+            meta_dict["run_list"] = [r for r in meta_dict["run_list"] if r in run_ids]
+        if "channels_recorded" in meta_dict:
+            meta_dict["channels_recorded"] = [
+                c for c in meta_dict["channels_recorded"] if c in components
+            ]
+        meta_dict["runs"] = station_runs
+        station = Station()
+        station.from_dict(meta_dict, mode="bulk")
+        surveys[station_key[0]].add_station(station)
+
+    for survey in surveys.values():
+        experiment.add_survey(survey)
+
+
+@requires(pyarrow=module_available("pyarrow"))
+def write_parquet(experiment, path: str | Path) -> Path:
+    """
+    Write an Experiment as Parquet files, one per level.
+
+    Parameters
+    ----------
+    experiment : Experiment
+        Experiment to write.
+    path : str | Path
+        Directory to write ``<level>.parquet`` files into, created if it
+        does not exist.
+
+    Returns
+    -------
+    Path
+        Directory the files were written to.
+    """
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    for level, table in experiment_to_arrow(experiment).items():
+        pq.write_table(table, path.joinpath(f"{level}.parquet"))
+    return path
+
+
+@requires(pyarrow=module_available("pyarrow"))
+def read_parquet(
+    path: str | Path,
+    level: str,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+) -> "pyarrow.Table":
+    """
+    Read one level of an Experiment written with `write_parquet`.
+
+    No metadata objects are created, so this is the fast path for catalog
+    queries.
+
+    Parameters
+    ----------
+    path : str | Path
+        Directory the Experiment was written to.
+    level : str
+        One of `LEVELS`.
+    columns : list[str] | None, optional
+        Columns to read, by default all columns.
+    filters : list | None, optional
+        Row filters pushed down to the Parquet reader, in the
+        `pyarrow.parquet.read_table` format, e.g.
+        ``[("sample_rate", ">", 100)]``.
+
+    Returns
+    -------
+    pyarrow.Table
+        Table of the level.
+
+    Raises
+    ------
+    ValueError
+        If `level` is not one of `LEVELS`.
+    """
+    import pyarrow.parquet as pq
+
+    if level not in LEVELS:
+        raise ValueError(f"level must be one of {LEVELS}, not '{level}'")
+    return pq.read_table(
+        Path(path).joinpath(f"{level}.parquet"), columns=columns, filters=filters
+    )
@@ -22,27 +22,40 @@ import json
 # =============================================================================
 from collections import OrderedDict
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 from xml.etree import cElementTree as et
 
+import numpy as np
 from loguru import logger
-from pydantic import computed_field, Field, field_validator
+from pydantic import computed_field, Field, field_validator, ValidationInfo
 
 from mt_metadata.base import helpers, MetadataBase
+from mt_metadata.base.metadata import get_from_dict_mode
 from mt_metadata.common.list_dict import ListDict
 
 from . import Auxiliary, Electric, Magnetic, Run, Station, Survey
-from .filters import (
-    CoefficientFilter,
-    FIRFilter,
-    FrequencyResponseTableFilter,
-    PoleZeroFilter,
-    TimeDelayFilter,
+from .columnar import (
+    experiment_from_arrow,
+    experiment_to_arrow,
+    LEVELS,
+    read_parquet,
+    write_parquet,
 )
+from .mtml_stream import iter_surveys, read_filter_dict, station_to_xml, write_xml
 
 # =============================================================================
 
 
+def _decode_complex(value):
+    """
+    Complex arrays are written by `helpers.NumpyEncoder` as
+    {"real": [...], "imag": [...]}, make them arrays again.
+    """
+    if isinstance(value, dict) and set(value.keys()) == {"real", "imag"}:
+        return np.array(value["real"]) + 1j * np.array(value["imag"])
+    return value
+
+
 class Experiment(MetadataBase):
     """
     Top level of the metadata
@@ -122,7 +135,7 @@ class Experiment(MetadataBase):
 
     @field_validator("surveys", mode="before")
     @classmethod
-    def validate_surveys(cls, value) -> ListDict:
+    def validate_surveys(cls, value, info: ValidationInfo) -> ListDict:
         """set the survey list"""
 
         if not isinstance(value, (list, tuple, dict, ListDict, OrderedDict)):
@@ -144,7 +157,7 @@ class Experiment(MetadataBase):
         for ii, survey in enumerate(value_list):
             if isinstance(survey, (dict, OrderedDict)):
                 s = Survey()
-                s.from_dict(survey)
+                s.from_dict(survey, mode=get_from_dict_mode(info))
                 surveys.append(s)
             elif not isinstance(survey, Survey):
                 msg = f"Item {ii} is not type(Survey); type={type(survey)}"
@@ -285,12 +298,21 @@ class Experiment(MetadataBase):
 
         return ex_dict
 
-    def from_dict(self, ex_dict: dict | OrderedDict, skip_none: bool = True) -> None:
+    def from_dict(
+        self,
+        ex_dict: dict | OrderedDict,
+        skip_none: bool = True,
+        mode: Literal["attribute", "bulk"] = "bulk",
+    ) -> None:
         """
         fill from an input dictionary
 
         :param ex_dict: DESCRIPTION
         :type ex_dict: TYPE
+        :param mode: how surveys, stations and runs are filled, "bulk"
+         validates each object once, see :meth:`MetadataBase.from_dict`,
+         defaults to "bulk"
+        :type mode: str, optional
         :return: DESCRIPTION
         :rtype: TYPE
 
@@ -304,8 +326,13 @@ class Experiment(MetadataBase):
             return
 
         for survey_dict in ex_dict["experiment"]["surveys"]:
+            survey_dict = dict(survey_dict)
+            survey_dict["filters"] = [
+                {key: _decode_complex(value) for key, value in filter_dict.items()}
+                for filter_dict in survey_dict.get("filters") or []
+            ]
             survey_object = Survey()
-            survey_object.from_dict(survey_dict, skip_none=skip_none)
+            survey_object.from_dict(survey_dict, skip_none=skip_none, mode=mode)
             self.add_survey(survey_object)
 
     def to_json(
@@ -340,12 +367,20 @@ class Experiment(MetadataBase):
                 indent=indent,
             )
 
-    def from_json(self, json_str: str, skip_none: bool = True) -> None:
+    def from_json(
+        self,
+        json_str: str,
+        skip_none: bool = True,
+        mode: Literal["attribute", "bulk"] = "bulk",
+    ) -> None:
         """
         read in a json string and update attributes of an object
 
         :param json_str: json string or file path
         :type json_str: string or :class:`pathlib.Path`
+        :param mode: how objects are filled, see :meth:`from_dict`, defaults
+         to "bulk"
+        :type mode: str, optional
 
         """
         if isinstance(json_str, str):
@@ -365,20 +400,39 @@ class Experiment(MetadataBase):
             msg = "Input must be valid JSON string not %"
             logger.error(msg, type(json_str))
             raise TypeError(msg % type(json_str))
-        self.from_dict(json_dict, skip_none=skip_none)
+        self.from_dict(json_dict, skip_none=skip_none, mode=mode)
 
     def to_xml(
-        self, fn: str | Path = None, required: bool = True, sort: bool = True
-    ) -> et.Element:
+        self,
+        fn: str | Path = None,
+        required: bool = True,
+        sort: bool = True,
+        stream: bool = False,
+    ) -> et.Element | None:
         """
         Write XML version of the experiment
 
-        :param fn: DESCRIPTION
-        :type fn: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
-
-        """
+        :param fn: file name to write to, defaults to None
+        :type fn: str or Path, optional
+        :param required: only write required and set attributes, defaults
+         to True
+        :type required: bool, optional
+        :param sort: sort surveys, stations, runs and channels, defaults to
+         True
+        :type sort: bool, optional
+        :param stream: write `fn` one station at a time without building
+         the whole tree, see :func:`mt_metadata.timeseries.mtml_stream.write_xml`.
+         Nothing is returned.  Defaults to False
+        :type stream: bool, optional
+        :return: Experiment element
+        :rtype: :class:`xml.etree.ElementTree.Element`
+
+        """
+        if stream:
+            if fn is None:
+                raise ValueError("fn is required to stream the experiment")
+            write_xml(self, fn, required=required, sort=sort)
+            return None
 
         experiment_element = et.Element(self.__class__.__name__)
         if sort:
@@ -393,38 +447,9 @@ class Experiment(MetadataBase):
             if sort:
                 survey.stations.sort()
             for station in survey.stations:
-                station.update_time_period()
-                station_element = station.to_xml(required=required)
-                if sort:
-                    station.runs.sort()
-                for run in station.runs:
-                    run.update_time_period()
-                    run_element = run.to_xml(required=required)
-                    if sort:
-                        run.channels.sort()
-                    for channel in run.channels:
-                        if channel.type in ["electric"]:
-                            if (
-                                channel.positive.latitude == 0
-                                and channel.positive.longitude == 0
-                                and channel.positive.elevation == 0
-                            ):
-                                channel.positive.latitude = station.location.latitude
-                                channel.positive.longitude = station.location.longitude
-                                channel.positive.elevation = station.location.elevation
-                        else:
-                            if (
-                                channel.location.latitude == 0
-                                and channel.location.longitude == 0
-                                and channel.location.elevation == 0
-                            ):
-                                channel.location.latitude = station.location.latitude
-                                channel.location.longitude = station.location.longitude
-                                channel.location.elevation = station.location.elevation
-
-                        run_element.append(channel.to_xml(required=required))
-                    station_element.append(run_element)
-                survey_element.append(station_element)
+                survey_element.append(
+                    station_to_xml(station, required=required, sort=sort)
+                )
             experiment_element.append(survey_element)
 
         if fn:
@@ -438,38 +463,57 @@ class Experiment(MetadataBase):
         element: et.Element | None = None,
         sort: bool = True,
         skip_none: bool = True,
+        stations: list[str] | None = None,
     ) -> None:
         """
+        Read an MTML file or element.
 
-        :param fn: DESCRIPTION, defaults to None
-        :type fn: TYPE, optional
-        :param element: DESCRIPTION, defaults to None
-        :type element: TYPE, optional
-        :return: DESCRIPTION
-        :rtype: TYPE
-
+        Files are streamed with :func:`mt_metadata.timeseries.mtml_stream.iter_surveys`,
+        elements are freed as soon as they are converted to objects.
 
+        :param fn: MTML file name, defaults to None
+        :type fn: str or Path, optional
+        :param element: parsed Experiment element, used instead of `fn` if
+         given, defaults to None
+        :type element: :class:`xml.etree.ElementTree.Element`, optional
+        :param sort: sort surveys, stations, runs and channels, defaults to True
+        :type sort: bool, optional
+        :param skip_none: skip None values, defaults to True
+        :type skip_none: bool, optional
+        :param stations: only read these station ids, defaults to None
+         (all stations)
+        :type stations: list of str, optional
 
         """
-        if fn:
-            experiment_element = et.parse(fn).getroot()
-        if element is not None:
-            experiment_element = element
+        if element is None and fn:
+            for survey_obj in iter_surveys(fn, stations=stations, skip_none=skip_none):
+                self.add_survey(survey_obj)
+            if sort:
+                self.sort()
+            return
+
+        experiment_element = element
 
         # need to set the lists for each layer, otherwise you get duplicates.
         for survey_element in list(experiment_element):
             survey_dict = helpers.element_to_dict(survey_element)
-            stations = self._pop_dictionary(survey_dict["survey"], "station")
+            station_dicts = self._pop_dictionary(survey_dict["survey"], "station")
             survey_obj = Survey()
-            survey_obj.from_dict(survey_dict, skip_none=skip_none)
+            with survey_obj.deferred_validation():
+                survey_obj.from_dict(survey_dict, skip_none=skip_none, mode="bulk")
             fd = survey_dict["survey"].pop("filters")
             filter_dict = self._read_filter_dict(fd)
             survey_obj.filters.update(filter_dict)
 
-            for station_dict in stations:
+            for station_dict in station_dicts:
+                if stations is not None and station_dict.get("id") not in stations:
+                    continue
                 station_obj = Station()
                 runs = self._pop_dictionary(station_dict, "run")
-                station_obj.from_dict(station_dict, skip_none=skip_none)
+                with station_obj.deferred_validation():
+                    station_obj.from_dict(
+                        station_dict, skip_none=skip_none, mode="bulk"
+                    )
                 for run_dict in runs:
                     run_obj = Run()
 
@@ -482,11 +526,15 @@ class Experiment(MetadataBase):
                                     channel = Magnetic()
                                 elif ch == "auxiliary":
                                     channel = Auxiliary()
-                                channel.from_dict(ch_dict, skip_none=skip_none)
+                                with channel.deferred_validation():
+                                    channel.from_dict(
+                                        ch_dict, skip_none=skip_none, mode="bulk"
+                                    )
                                 run_obj.add_channel(channel)
                         except KeyError:
                             logger.debug(f"Could not find channel {ch}")
-                    run_obj.from_dict(run_dict, skip_none=skip_none)
+                    with run_obj.deferred_validation():
+                        run_obj.from_dict(run_dict, skip_none=skip_none, mode="bulk")
                     station_obj.add_run(run_obj)
                 survey_obj.add_station(station_obj)
             self.add_survey(survey_obj)
@@ -513,6 +561,65 @@ class Experiment(MetadataBase):
 
         return elements
 
+    def to_arrow(self) -> dict:
+        """
+        Convert to Arrow tables, one per level (survey, station, run,
+        channel, filter) with flattened dot-notation columns.
+
+        Requires pyarrow, see :mod:`mt_metadata.timeseries.columnar`.
+
+        :return: tables keyed by level name
+        :rtype: dict of :class:`pyarrow.Table`
+
+        """
+        return experiment_to_arrow(self)
+
+    def from_arrow(self, tables: dict) -> None:
+        """
+        Fill from Arrow tables made by :meth:`to_arrow`.
+
+        :param tables: tables keyed by level name
+        :type tables: dict of :class:`pyarrow.Table`
+
+        """
+        experiment_from_arrow(self, tables)
+
+    def to_parquet(self, path: str | Path) -> Path:
+        """
+        Write the experiment as Parquet files, one per level, into the
+        directory `path`.
+
+        Use :func:`mt_metadata.timeseries.columnar.read_parquet` to query a
+        level without creating metadata objects.
+
+        :param path: directory to write to
+        :type path: str or Path
+        :return: directory written to
+        :rtype: Path
+
+        """
+        return write_parquet(self, path)
+
+    def from_parquet(self, path: str | Path, filters: dict | None = None) -> None:
+        """
+        Read an experiment written with :meth:`to_parquet`.
+
+        :param path: directory the experiment was written to
+        :type path: str or Path
+        :param filters: row filters per level pushed down to the Parquet
+         reader, e.g. ``{"channel": [("sample_rate", ">", 100)]}``.  Children
+         of rows that are filtered out are skipped.
+        :type filters: dict, optional
+
+        """
+        if filters is None:
+            filters = {}
+        tables = {
+            level: read_parquet(path, level, filters=filters.get(level))
+            for level in LEVELS
+        }
+        experiment_from_arrow(self, tables)
+
     def to_pickle(self, fn: str | Path = None) -> None:
         """
         Write a pickle version of the experiment
@@ -549,63 +656,13 @@ class Experiment(MetadataBase):
         """
         Read in filter element an put it in the correct object
 
-        :param filter_element: DESCRIPTION
-        :type filter_element: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
+        :param filters_dict: filters keyed by filter type
+        :type filters_dict: dict or None
+        :return: filters keyed by name
+        :rtype: ListDict
 
         """
-        return_dict = ListDict()
-        if filters_dict is None:
-            return return_dict
-
-        for key, value in filters_dict.items():
-            if key in ["pole_zero_filter"]:
-                if isinstance(value, list):
-                    for v in value:
-                        mt_filter = PoleZeroFilter(**v)
-                        return_dict[mt_filter.name.lower()] = mt_filter
-                else:
-                    mt_filter = PoleZeroFilter(value)
-                    return_dict[mt_filter.name.lower()] = mt_filter
-
-            elif key in ["coefficient_filter"]:
-                if isinstance(value, list):
-                    for v in value:
-                        mt_filter = CoefficientFilter(**v)
-                        return_dict[mt_filter.name.lower()] = mt_filter
-                else:
-                    mt_filter = CoefficientFilter(value)
-                    return_dict[mt_filter.name.lower()] = mt_filter
-
-            elif key in ["time_delay_filter"]:
-                if isinstance(value, list):
-                    for v in value:
-                        mt_filter = TimeDelayFilter(**v)
-                        return_dict[mt_filter.name.lower()] = mt_filter
-                else:
-                    mt_filter = TimeDelayFilter(value)
-                    return_dict[mt_filter.name.lower()] = mt_filter
-
-            elif key in ["frequency_response_table_filter"]:
-                if isinstance(value, list):
-                    for v in value:
-                        mt_filter = FrequencyResponseTableFilter(**v)
-                        return_dict[mt_filter.name.lower()] = mt_filter
-                else:
-                    mt_filter = FrequencyResponseTableFilter(value)
-                    return_dict[mt_filter.name.lower()] = mt_filter
-
-            elif key in ["fir_filter"]:
-                if isinstance(value, list):
-                    for v in value:
-                        mt_filter = FIRFilter(**v)
-                        return_dict[mt_filter.name.lower()] = mt_filter
-                else:
-                    mt_filter = FIRFilter(value)
-                    return_dict[mt_filter.name.lower()] = mt_filter
-
-        return return_dict
+        return read_filter_dict(filters_dict)
 
     def sort(self, inplace: bool = True) -> "Experiment":
         """
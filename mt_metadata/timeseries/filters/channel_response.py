@@ -15,7 +15,7 @@ from pydantic import (
     ValidationInfo,
 )
 
-from mt_metadata.base.helpers import object_to_array, requires
+from mt_metadata.base.helpers import module_available, object_to_array, requires
 from mt_metadata.common.units import get_unit_object
 from mt_metadata.timeseries.filters import (
     CoefficientFilter,
@@ -27,12 +27,6 @@ from mt_metadata.timeseries.filters import (
 )
 from mt_metadata.timeseries.filters.plotting_helpers import plot_response
 
-try:
-    from obspy.core import inventory
-except ImportError:
-    inventory = None
-
-
 # =====================================================
 
 
@@ -529,7 +523,7 @@ class ChannelResponse(FilterBase):
 
         return round(total_gain, sig_figs - int(np.floor(np.log10(abs(total_gain)))))
 
-    @requires(obspy=inventory)
+    @requires(obspy=module_available("obspy"))
     def to_obspy(self, sample_rate=1):
         """
         Output :class:`obspy.core.inventory.InstrumentSensitivity` object that
@@ -553,6 +547,8 @@ class ChannelResponse(FilterBase):
         units_in_obj = get_unit_object(self.units_in)
         units_out_obj = get_unit_object(self.units_out)
 
+        from obspy.core import inventory
+
         total_response = inventory.Response()
         total_response.instrument_sensitivity = inventory.InstrumentSensitivity(
             total_sensitivity,
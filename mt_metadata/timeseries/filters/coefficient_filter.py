@@ -8,12 +8,7 @@ from pydantic import Field, PrivateAttr
 
 from mt_metadata.timeseries.filters import FilterBase
 
-try:
-    from obspy.core import inventory
-except ImportError:
-    inventory = None
-
-from mt_metadata.base.helpers import requires
+from mt_metadata.base.helpers import module_available, requires
 
 
 # =====================================================
@@ -47,7 +42,7 @@ class CoefficientFilter(FilterBase):
         ),
     ]
 
-    @requires(obspy=inventory)
+    @requires(obspy=module_available("obspy"))
     def to_obspy(
         self,
         stage_number=1,
@@ -86,6 +81,7 @@ class CoefficientFilter(FilterBase):
         :rtype: TYPE
 
         """
+        from obspy.core import inventory
 
         stage = inventory.CoefficientsTypeResponseStage(
             stage_number,
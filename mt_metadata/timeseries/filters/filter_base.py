@@ -9,22 +9,12 @@ from loguru import logger
 from pydantic import computed_field, Field, field_validator, PrivateAttr, ValidationInfo
 
 from mt_metadata.base import MetadataBase
-from mt_metadata.base.helpers import filter_descriptions, requires
+from mt_metadata.base.helpers import filter_descriptions, module_available, requires
 from mt_metadata.common import Comment
 from mt_metadata.common.mttime import MTime
 from mt_metadata.common.units import get_unit_object, Unit
 from mt_metadata.timeseries.filters.plotting_helpers import plot_response
 
-try:
-    from obspy.core.inventory.response import ResponseListResponseStage, ResponseStage
-
-    obspy_import = True
-except ImportError:
-    ResponseListResponseStage = None
-    ResponseStage = None
-    obspy_import = False
-
-
 # =====================================================
 
 
@@ -284,7 +274,7 @@ class FilterBase(MetadataBase):
 
         return self.comments
 
-    @requires(obspy=obspy_import)
+    @requires(obspy=module_available("obspy"))
     @classmethod
     def from_obspy_stage(
         cls,
@@ -307,6 +297,10 @@ class FilterBase(MetadataBase):
         :rtype: mt_metadata.timeseries.filter object
 
         """
+        from obspy.core.inventory.response import (
+            ResponseListResponseStage,
+            ResponseStage,
+        )
 
         if mapping is None:
             mapping = cls().make_obspy_mapping()
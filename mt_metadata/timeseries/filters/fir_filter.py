@@ -3,20 +3,12 @@
 # =====================================================
 from typing import Annotated
 
-import matplotlib.pyplot as plt
 import numpy as np
 from pydantic import computed_field, Field, field_validator, PrivateAttr, ValidationInfo
 
-from mt_metadata.base.helpers import requires
-from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
-
-try:
-    from obspy.core.inventory.response import FIRResponseStage
-except ImportError:
-    FIRResponseStage = None
-import scipy.signal as signal
-
+from mt_metadata.base.helpers import module_available, requires
 from mt_metadata.common import SymmetryEnum
+from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
 
 # =====================================================
 
@@ -159,6 +151,8 @@ class FIRFilter(FilterBase):
             coefficient_gain = self.symmetry_corrected_coefficients.sum()
         else:
             # estimate the gain from the coefficeints at gain_frequency
+            import scipy.signal as signal
+
             ww, hh = signal.freqz(
                 self.symmetry_corrected_coefficients,
                 worN=2 * np.pi * self.gain_frequency,
@@ -180,6 +174,9 @@ class FIRFilter(FilterBase):
             return 1.0
 
     def plot_fir_response(self):
+        import matplotlib.pyplot as plt
+        import scipy.signal as signal
+
         w, h = signal.freqz(self.full_coefficients)
         fig = plt.figure()
         plt.title("Digital filter frequency response")
@@ -198,7 +195,7 @@ class FIRFilter(FilterBase):
 
         return fig
 
-    @requires(obspy=FIRResponseStage)
+    @requires(obspy=module_available("obspy"))
     def to_obspy(
         self,
         stage_number=1,
@@ -221,6 +218,8 @@ class FIRFilter(FilterBase):
         # decimation_input_sample_rate=None, decimation_factor=None,
         # decimation_offset=None, decimation_delay=None,
         # decimation_correction=None
+        from obspy.core.inventory.response import FIRResponseStage
+
         rs = FIRResponseStage(
             stage_number,
             self.gain,
@@ -254,6 +253,8 @@ class FIRFilter(FilterBase):
         :param frequencies:
         :return:
         """
+        import scipy.signal as signal
+
         angular_frequencies = 2 * np.pi * frequencies
         w, h = signal.freqz(
             self.symmetry_corrected_coefficients,
@@ -275,6 +276,8 @@ class FIRFilter(FilterBase):
 
         """
         # fir_filter.full_coefficients
+        import scipy.signal as signal
+
         angular_frequencies = 2 * np.pi * frequencies
         w, h = signal.freqz(
             self.symmetry_corrected_coefficients,
@@ -6,20 +6,10 @@ from typing import Annotated
 import numpy as np
 from loguru import logger
 from pydantic import Field, field_validator, ValidationInfo
-from scipy.interpolate import interp1d
 
-from mt_metadata.base.helpers import object_to_array, requires
+from mt_metadata.base.helpers import module_available, object_to_array, requires
 from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
 
-try:
-    from obspy.core.inventory.response import (
-        ResponseListElement,
-        ResponseListResponseStage,
-    )
-except ImportError:
-    ResponseListResponseStage = ResponseListElement = None
-
-
 # =====================================================
 
 
@@ -167,7 +157,7 @@ class FrequencyResponseTableFilter(FilterBase):
             return 0.0
         return float(self.frequencies.max())
 
-    @requires(obspy=(ResponseListResponseStage and ResponseListElement))
+    @requires(obspy=module_available("obspy"))
     def to_obspy(
         self,
         stage_number=1,
@@ -187,6 +177,11 @@ class FrequencyResponseTableFilter(FilterBase):
         :rtype: :class:`obspy.core.inventory.ResponseListResponseStage`
 
         """
+        from obspy.core.inventory.response import (
+            ResponseListElement,
+            ResponseListResponseStage,
+        )
+
         response_elements = []
         for f, a, p in zip(self.frequencies, self.amplitudes, self.phases):
             element = ResponseListElement(f, a, p)
@@ -229,6 +224,8 @@ class FrequencyResponseTableFilter(FilterBase):
                 f"than table frequencies ({self.max_frequency} Hz)."
             )
 
+        from scipy.interpolate import interp1d
+
         phase_response = interp1d(
             self.frequencies,
             self.phases,
@@ -1,6 +1,4 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.gridspec import GridSpec
 
 
 def is_flat_amplitude(array):
@@ -65,6 +63,9 @@ def plot_response(
     -------
 
     """
+    # matplotlib is slow to import, only load it when plotting
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
 
     fig = plt.figure(figsize=(14, 4))
 
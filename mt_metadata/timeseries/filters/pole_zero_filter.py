@@ -6,13 +6,7 @@ from typing import Annotated
 import numpy as np
 from pydantic import Field, field_validator, ValidationInfo
 
-try:
-    import obspy
-except ImportError:
-    obspy = None
-import scipy.signal as signal
-
-from mt_metadata.base.helpers import object_to_array, requires
+from mt_metadata.base.helpers import module_available, object_to_array, requires
 from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
 
 
@@ -115,6 +109,8 @@ class PoleZeroFilter(FilterBase):
         :rtype: :class:`scipy.signal.ZerosPolesGain`
 
         """
+        import scipy.signal as signal
+
         zpg = signal.ZerosPolesGain(self.zeros, self.poles, self.normalization_factor)
         return zpg
 
@@ -128,7 +124,7 @@ class PoleZeroFilter(FilterBase):
         """
         return self.gain * self.normalization_factor
 
-    @requires(obspy=obspy)
+    @requires(obspy=module_available("obspy"))
     def to_obspy(
         self,
         stage_number=1,
@@ -156,6 +152,8 @@ class PoleZeroFilter(FilterBase):
         if self.poles is None:
             self.poles = []
 
+        import obspy
+
         rs = obspy.core.inventory.PolesZerosResponseStage(
             stage_number,
             self.gain,
@@ -186,6 +184,8 @@ class PoleZeroFilter(FilterBase):
 
         """
         angular_frequencies = 2 * np.pi * np.array(frequencies)
+        import scipy.signal as signal
+
         w, h = signal.freqs_zpk(
             self.zeros, self.poles, self.total_gain, worN=angular_frequencies
         )
@@ -7,14 +7,9 @@ import numpy as np
 from loguru import logger
 from pydantic import Field, field_validator, PrivateAttr, ValidationInfo
 
-from mt_metadata.base.helpers import requires
+from mt_metadata.base.helpers import module_available, requires
 from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
 
-try:
-    from obspy.core import inventory
-except ImportError:
-    inventory = None
-
 
 # =====================================================
 class TimeDelayFilter(FilterBase):
@@ -63,7 +58,7 @@ class TimeDelayFilter(FilterBase):
         mapping["decimation_delay"] = "delay"
         return mapping
 
-    @requires(obspy=inventory)
+    @requires(obspy=module_available("obspy"))
     def to_obspy(self, stage_number=1, sample_rate=1, normalization_frequency=0):
         """
         Convert to an obspy stage
@@ -78,6 +73,7 @@ class TimeDelayFilter(FilterBase):
         :rtype: :class:`obspy.core.inventory.CoefficientsTypeResponseStage`
 
         """
+        from obspy.core import inventory
 
         stage = inventory.CoefficientsTypeResponseStage(
             stage_number,
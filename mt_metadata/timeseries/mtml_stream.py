@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming reader and writer for MTML (Experiment XML) files.
+
+`Experiment.from_xml` used to parse the whole document and convert each
+survey element to a dictionary before building any objects, so memory
+peaked at several times the file size.  The functions here walk the file
+with :func:`xml.etree.ElementTree.iterparse`, build metadata objects as soon
+as their element is complete and drop the element from the tree.
+
+The layout written by `Experiment.to_xml` is expected::
+
+    Experiment
+        survey
+            <survey metadata>
+            filters
+            station
+                <station metadata>
+                run
+                    <run metadata>
+                    electric | magnetic | auxiliary
+
+Survey metadata and filters have to come before the stations, and station
+metadata (at least the station id) before the runs, which is the order
+`Experiment.to_xml` writes.
+
+`write_xml` goes the other way: each station is converted to an element,
+pretty printed and written to the file before the next one is built, so
+memory is bounded by the largest station instead of the whole experiment.
+
+Example
+-------
+>>> for survey, station in iter_stations(fn, stations=["mt01", "mt02"]):
+...     print(survey.id, station.id, station.n_runs)
+>>> write_xml(experiment, "experiment.xml")
+
+:copyright:
+    Jared Peacock (jpeacock@usgs.gov)
+
+:license: MIT
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+from xml.etree import cElementTree as et
+
+from loguru import logger
+
+from mt_metadata.base import helpers
+from mt_metadata.common.list_dict import ListDict
+
+from . import Auxiliary, Electric, Magnetic, Run, Station, Survey
+from .filters import (
+    CoefficientFilter,
+    FIRFilter,
+    FrequencyResponseTableFilter,
+    PoleZeroFilter,
+    TimeDelayFilter,
+)
+
+# =============================================================================
+CHANNEL_CLASSES = {"electric": Electric, "magnetic": Magnetic, "auxiliary": Auxiliary}
+FILTER_CLASSES = {
+    "pole_zero_filter": PoleZeroFilter,
+    "coefficient_filter": CoefficientFilter,
+    "time_delay_filter": TimeDelayFilter,
+    "frequency_response_table_filter": FrequencyResponseTableFilter,
+    "fir_filter": FIRFilter,
+}
+
+# child elements that hold other objects, not metadata of the parent, keyed
+# by parent tag.  The filters of a channel are metadata of the channel.
+CONTAINER_TAGS = {"survey": {"filters", "station"}, "station": {"run"}}
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+INDENT = "    "
+
+# depth of each element in the document, Experiment is 1
+SURVEY_DEPTH = 2
+STATION_DEPTH = 3
+RUN_DEPTH = 4
+CHANNEL_DEPTH = 5
+
+
+def read_filter_dict(filters_dict: dict | None) -> ListDict:
+    """
+    Make filter objects from the dictionary of a `filters` element.
+
+    :param filters_dict: dictionary of filters keyed by filter type, e.g.
+     'pole_zero_filter', with a dictionary or a list of dictionaries
+    :type filters_dict: dict or None
+    :return: filters keyed by lower case name
+    :rtype: :class:`mt_metadata.common.list_dict.ListDict`
+
+    """
+    return_dict = ListDict()
+    if filters_dict is None:
+        return return_dict
+
+    for key, value in filters_dict.items():
+        try:
+            filter_class = FILTER_CLASSES[key]
+        except KeyError:
+            logger.debug(f"Skipping unknown filter type {key}")
+            continue
+        if not isinstance(value, list):
+            value = [value]
+        for v in value:
+            mt_filter = filter_class(**v)
+            return_dict[mt_filter.name.lower()] = mt_filter
+
+    return return_dict
+
+
+def _metadata_dict(element: et.Element) -> dict:
+    """
+    Dictionary of the metadata children of an element, leaving out child
+    containers (survey filters, stations, runs) and the wrapper key of the tag.
+
+    When iterparse reports the start of an element it has already been
+    added to its parent, so the parent can hold an empty container.
+    """
+    containers = CONTAINER_TAGS.get(element.tag, set())
+    metadata_element = et.Element(element.tag, element.attrib)
+    metadata_element.extend(child for child in element if child.tag not in containers)
+    meta_dict = helpers.element_to_dict(metadata_element)[element.tag]
+    if meta_dict is None:
+        return {}
+    return meta_dict
+
+
+def _fill(obj, element: et.Element, skip_none: bool):
+    """
+    Fill an object from the metadata of an element, validating it once.
+    """
+    with obj.deferred_validation():
+        obj.from_dict(_metadata_dict(element), skip_none=skip_none, mode="bulk")
+    return obj
+
+
+def _make_survey(element: et.Element, skip_none: bool) -> Survey:
+    return _fill(Survey(), element, skip_none)
+
+
+def _make_station(element: et.Element, skip_none: bool) -> Station:
+    return _fill(Station(), element, skip_none)
+
+
+def _detach(parent: et.Element | None, element: et.Element) -> None:
+    """
+    Free an element that has been converted to objects.
+    """
+    element.clear()
+    if parent is not None:
+        parent.remove(element)
+
+
+def iter_xml(
+    fn: str | Path,
+    level: str = "station",
+    stations: Iterable[str] | None = None,
+    skip_none: bool = True,
+) -> Iterator[tuple]:
+    """
+    Stream metadata objects out of an MTML file.
+
+    Elements are freed as soon as they have been converted, so only the
+    objects of the current level are in memory.
+
+    :param fn: MTML file written by `Experiment.to_xml`
+    :type fn: str or Path
+    :param level: 'survey', 'station' or 'run', defaults to 'station'
+    :type level: str, optional
+    :param stations: station ids to read, all other stations are skipped
+     without building any objects, defaults to None (all stations)
+    :type stations: iterable of str, optional
+    :param skip_none: skip None values when filling objects, defaults to True
+    :type skip_none: bool, optional
+    :raises ValueError: if level is not 'survey', 'station' or 'run'
+    :return: tuples of objects for each item of the level:
+     (survey,) for 'survey', (survey, station) for 'station' and
+     (survey, station, run) for 'run'.  For 'station' and 'run' the survey
+     holds its metadata and filters but no stations, for 'run' the station
+     holds its metadata but no runs.
+    :rtype: iterator of tuple
+
+    """
+    if level not in ("survey", "station", "run"):
+        raise ValueError(f"level must be 'survey', 'station' or 'run', not {level}")
+    if stations is not None:
+        stations = set(stations)
+
+    path = []
+    survey = None
+    filters = ListDict()
+    station = None
+    skip_station = False
+    runs = []
+    channels = []
+
+    for event, element in et.iterparse(str(fn), events=("start", "end")):
+        if event == "start":
+            depth = len(path) + 1
+            path.append(element)
+            # metadata of the parent is complete once the first child
+            # container starts
+            if depth == STATION_DEPTH and element.tag == "station":
+                if survey is None:
+                    survey = _make_survey(path[-2], skip_none)
+                    survey.filters.update(filters)
+            elif depth == RUN_DEPTH and element.tag == "run":
+                if station is None:
+                    station = _make_station(path[-2], skip_none)
+                    skip_station = stations is not None and station.id not in stations
+                    if level == "run":
+                        # drop the empty runs made from run_list
+                        station.runs.clear()
+            continue
+
+        depth = len(path)
+        path.pop()
+        parent = path[-1] if path else None
+
+        if (
+            depth == CHANNEL_DEPTH
+            and element.tag in CHANNEL_CLASSES
+            and parent.tag == "run"
+        ):
+            if not skip_station:
+                channels.append(
+                    _fill(CHANNEL_CLASSES[element.tag](), element, skip_none)
+                )
+            _detach(parent, element)
+
+        elif depth == RUN_DEPTH and element.tag == "run":
+            if not skip_station:
+                run = Run()
+                for channel in channels:
+                    run.add_channel(channel)
+                _fill(run, element, skip_none)
+                if level == "run":
+                    yield survey, station, run
+                else:
+                    runs.append(run)
+            channels = []
+            _detach(parent, element)
+
+        elif depth == STATION_DEPTH and element.tag == "filters":
+            filters.update(read_filter_dict(_metadata_dict(element)))
+            if survey is not None:
+                survey.filters.update(filters)
+            _detach(parent, element)
+
+        elif depth == STATION_DEPTH and element.tag == "station":
+            if station is None:
+                station = _make_station(element, skip_none)
+                skip_station = stations is not None and station.id not in stations
+            if not skip_station and level != "run":
+                # fill again, metadata may follow the runs
+                station = _make_station(element, skip_none)
+                for run in runs:
+                    station.add_run(run)
+                if level == "station":
+                    yield survey, station
+                else:
+                    survey.add_station(station)
+            station = None
+            skip_station = False
+            runs = []
+            _detach(parent, element)
+
+        elif depth == SURVEY_DEPTH and element.tag == "survey":
+            if survey is None:
+                survey = _make_survey(element, skip_none)
+                survey.filters.update(filters)
+            if level == "survey":
+                yield (survey,)
+            survey = None
+            filters = ListDict()
+            _detach(parent, element)
+
+
+def iter_surveys(
+    fn: str | Path, stations: Iterable[str] | None = None, skip_none: bool = True
+) -> Iterator[Survey]:
+    """
+    Stream complete Survey objects out of an MTML file.
+
+    :param fn: MTML file
+    :type fn: str or Path
+    :param stations: station ids to read, defaults to None (all stations)
+    :type stations: iterable of str, optional
+    :return: surveys with their filters and (selected) stations
+    :rtype: iterator of :class:`mt_metadata.timeseries.Survey`
+
+    """
+    for (survey,) in iter_xml(
+        fn, level="survey", stations=stations, skip_none=skip_none
+    ):
+        yield survey
+
+
+def iter_stations(
+    fn: str | Path, stations: Iterable[str] | None = None, skip_none: bool = True
+) -> Iterator[tuple[Survey, Station]]:
+    """
+    Stream Station objects, with their runs and channels, out of an MTML
+    file.
+
+    :param fn: MTML file
+    :type fn: str or Path
+    :param stations: station ids to read, defaults to None (all stations)
+    :type stations: iterable of str, optional
+    :return: (survey, station), the survey holds its metadata and filters
+    :rtype: iterator of tuple
+
+    """
+    yield from iter_xml(fn, level="station", stations=stations, skip_none=skip_none)
+
+
+def iter_runs(
+    fn: str | Path, stations: Iterable[str] | None = None, skip_none: bool = True
+) -> Iterator[tuple[Survey, Station, Run]]:
+    """
+    Stream Run objects, with their channels, out of an MTML file.
+
+    :param fn: MTML file
+    :type fn: str or Path
+    :param stations: station ids to read, defaults to None (all stations)
+    :type stations: iterable of str, optional
+    :return: (survey, station, run), the station holds its metadata only
+    :rtype: iterator of tuple
+
+    """
+    yield from iter_xml(fn, level="run", stations=stations, skip_none=skip_none)
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+
+def station_to_xml(station: Station, required: bool = True, sort: bool = True):
+    """
+    Make the element of a station with its runs and channels.
+
+    The time periods of the station and runs are updated and channels
+    without a location get the station location, the same as
+    `Experiment.to_xml`.
+
+    :param station: station to convert
+    :type station: :class:`mt_metadata.timeseries.Station`
+    :param required: only write required and set attributes, defaults to True
+    :type required: bool, optional
+    :param sort: sort runs and channels, defaults to True
+    :type sort: bool, optional
+    :return: station element
+    :rtype: :class:`xml.etree.ElementTree.Element`
+
+    """
+    station.update_time_period()
+    station_element = station.to_xml(required=required)
+    if sort:
+        station.runs.sort()
+    for run in station.runs:
+        run.update_time_period()
+        run_element = run.to_xml(required=required)
+        if sort:
+            run.channels.sort()
+        for channel in run.channels:
+            if channel.type in ["electric"]:
+                location = channel.positive
+            else:
+                location = channel.location
+            if (
+                location.latitude == 0
+                and location.longitude == 0
+                and location.elevation == 0
+            ):
+                location.latitude = station.location.latitude
+                location.longitude = station.location.longitude
+                location.elevation = station.location.elevation
+
+            run_element.append(channel.to_xml(required=required))
+        station_element.append(run_element)
+    return station_element
+
+
+def _pretty_lines(element: et.Element, depth: int) -> list[str]:
+    """
+    Pretty print an element, the same as `helpers.element_to_string`,
+    indented for its depth in the document and without the declaration.
+    """
+    lines = helpers.element_to_string(element).splitlines()[1:]
+    return [f"{INDENT * depth}{line}" for line in lines if line.strip()]
+
+
+def iter_xml_strings(
+    experiment, required: bool = True, sort: bool = True
+) -> Iterator[str]:
+    """
+    Generate the MTML document of an experiment in chunks, one per survey
+    header and one per station.
+
+    Only one station element exists at a time.
+
+    :param experiment: experiment to write
+    :type experiment: :class:`mt_metadata.timeseries.Experiment`
+    :param required: only write required and set attributes, defaults to True
+    :type required: bool, optional
+    :param sort: sort surveys, stations, runs and channels, defaults to True
+    :type sort: bool, optional
+    :return: pieces of the document, each ends with a new line
+    :rtype: iterator of str
+
+    """
+    tag = experiment.__class__.__name__
+    if len(experiment.surveys) == 0:
+        yield f"{XML_DECLARATION}\n<{tag}/>\n"
+        return
+
+    yield f"{XML_DECLARATION}\n<{tag}>\n"
+    if sort:
+        experiment.surveys.sort()
+    for survey in experiment.surveys:
+        survey.update_bounding_box()
+        survey.update_time_period()
+        survey_element = survey.to_xml(required=required)
+        filter_element = et.SubElement(survey_element, "filters")
+        for key, value in survey.filters.items():
+            filter_element.append(value.to_xml(required=required))
+        # the survey element always has children (filters), so the last
+        # line is the closing tag
+        survey_lines = _pretty_lines(survey_element, 1)
+        yield "\n".join(survey_lines[:-1]) + "\n"
+        del survey_element, filter_element
+
+        if sort:
+            survey.stations.sort()
+        for station in survey.stations:
+            station_element = station_to_xml(station, required=required, sort=sort)
+            yield "\n".join(_pretty_lines(station_element, 2)) + "\n"
+        yield survey_lines[-1] + "\n"
+    yield f"</{tag}>\n"
+
+
+def write_xml(
+    experiment,
+    fn: str | Path | IO[str],
+    required: bool = True,
+    sort: bool = True,
+) -> None:
+    """
+    Write an experiment to an MTML file one station at a time.
+
+    The output is the same document as `Experiment.to_xml(fn)`, but the
+    whole tree is never held in memory.
+
+    :param experiment: experiment to write
+    :type experiment: :class:`mt_metadata.timeseries.Experiment`
+    :param fn: file name or open text file handle
+    :type fn: str, Path or file object
+    :param required: only write required and set attributes, defaults to True
+    :type required: bool, optional
+    :param sort: sort surveys, stations, runs and channels, defaults to True
+    :type sort: bool, optional
+
+    """
+    if hasattr(fn, "write"):
+        fn.writelines(iter_xml_strings(experiment, required=required, sort=sort))
+        return
+    with open(fn, "w") as fid:
+        fid.writelines(iter_xml_strings(experiment, required=required, sort=sort))
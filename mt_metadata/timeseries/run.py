@@ -303,14 +303,18 @@ class Run(MetadataBase):
         Validate that the value is a list of strings.
         """
         # need to make each another object list() otherwise the contents
-        # get overwritten with the new channel.
-        for electric in list(self.channels_recorded_electric):
+        # get overwritten with the new channel.  Copy all of the lists before
+        # adding channels, add_channel resets every channels_recorded list.
+        electric_list = list(self.channels_recorded_electric)
+        magnetic_list = list(self.channels_recorded_magnetic)
+        auxiliary_list = list(self.channels_recorded_auxiliary)
+        for electric in electric_list:
             if electric not in self.channels.keys():
                 self.add_channel(Electric(component=electric))  # type: ignore
-        for magnetic in list(self.channels_recorded_magnetic):
+        for magnetic in magnetic_list:
             if magnetic not in self.channels.keys():
                 self.add_channel(Magnetic(component=magnetic))  # type: ignore
-        for auxiliary in list(self.channels_recorded_auxiliary):
+        for auxiliary in auxiliary_list:
             if auxiliary not in self.channels.keys():
                 self.add_channel(Auxiliary(component=auxiliary))  # type: ignore
         return self
@@ -11,6 +11,7 @@ from typing_extensions import Self
 
 from mt_metadata import NULL_VALUES
 from mt_metadata.base import MetadataBase
+from mt_metadata.base.metadata import get_from_dict_mode
 from mt_metadata.common import (
     AuthorPerson,
     ChannelLayoutEnum,
@@ -319,7 +320,7 @@ class Station(MetadataBase):
             if isinstance(run_entry, (dict, OrderedDict)):
                 try:
                     run = Run()
-                    run.from_dict(run_entry)
+                    run.from_dict(run_entry, mode=get_from_dict_mode(info))
                     runs.append(run)
                 except KeyError:
                     msg = f"Item {ii} is not type(Run); type={type(run_entry)}"
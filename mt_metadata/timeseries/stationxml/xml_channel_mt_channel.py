@@ -115,18 +115,19 @@ class XMLChannelMTChannel(BaseTranslator):
         # Always set component from XML channel code, overriding any defaults
         mt_channel.component = create_mt_component(xml_channel.code)
 
-        mt_channel = self._get_mt_position(xml_channel, mt_channel)
-        mt_channel = self._parse_xml_comments(xml_channel.comments, mt_channel)
-        mt_channel = self._sensor_to_mt(xml_channel.sensor, mt_channel)
-        mt_channel = self._get_mt_units(xml_channel, mt_channel)
+        with mt_channel.deferred_validation():
+            mt_channel = self._get_mt_position(xml_channel, mt_channel)
+            mt_channel = self._parse_xml_comments(xml_channel.comments, mt_channel)
+            mt_channel = self._sensor_to_mt(xml_channel.sensor, mt_channel)
+            mt_channel = self._get_mt_units(xml_channel, mt_channel)
+
+            for xml_key, mt_key in self.xml_translator.items():
+                if mt_key:
+                    value = getattr(xml_channel, xml_key)
+                    if value:
+                        mt_channel.update_attribute(mt_key, value)
         mt_filters = self._xml_response_to_mt(xml_channel, existing_filters)
 
-        for xml_key, mt_key in self.xml_translator.items():
-            if mt_key:
-                value = getattr(xml_channel, xml_key)
-                if value:
-                    mt_channel.update_attribute(mt_key, value)
-
         # fill channel filters
         for filter_name, mt_filter in mt_filters.items():
             mt_channel.add_filter(
@@ -140,24 +140,25 @@ class XMLStationMTStation(BaseTranslator):
             else:
                 mt_station.update_attribute(key, value)
 
-        for mt_key, xml_key in self.mt_translator.items():
-            if xml_key is None:
-                continue
-            if xml_key in ["site"]:
-                site = xml_station.site
-                mt_station.geographic_name = site.name
-            else:
-                value = getattr(xml_station, xml_key)
-                if value is None:
+        with mt_station.deferred_validation():
+            for mt_key, xml_key in self.mt_translator.items():
+                if xml_key is None:
                     continue
-                if isinstance(value, (list, tuple)):
-                    for k, v in zip(mt_key, value):
-                        mt_station.update_attribute(k, v)
+                if xml_key in ["site"]:
+                    site = xml_station.site
+                    mt_station.geographic_name = site.name
                 else:
-                    if xml_key == "restricted_status":
-                        value = self.flip_dict(release_dict)[value]
-
-                mt_station.update_attribute(mt_key, value)
+                    value = getattr(xml_station, xml_key)
+                    if value is None:
+                        continue
+                    if isinstance(value, (list, tuple)):
+                        for k, v in zip(mt_key, value):
+                            mt_station.update_attribute(k, v)
+                    else:
+                        if xml_key == "restricted_status":
+                            value = self.flip_dict(release_dict)[value]
+
+                    mt_station.update_attribute(mt_key, value)
 
         if mt_station.id is None:
             if mt_station.fdsn.id is not None:
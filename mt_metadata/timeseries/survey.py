@@ -6,9 +6,9 @@ from typing import Annotated
 
 from loguru import logger
 from pydantic import computed_field, Field, field_validator, ValidationInfo
-from pyproj import CRS
 
 from mt_metadata.base import MetadataBase
+from mt_metadata.base.metadata import get_from_dict_mode
 from mt_metadata.common import (
     AuthorPerson,
     BasicLocationNoDatum,
@@ -28,6 +28,7 @@ from mt_metadata.timeseries.filters import (
     PoleZeroFilter,
     TimeDelayFilter,
 )
+from mt_metadata.utils.location_helpers import get_datum_name
 
 # =====================================================
 
@@ -346,8 +347,7 @@ class Survey(MetadataBase):
         Validate the datum value and convert it to the appropriate enum type.
         """
         try:
-            datum_crs = CRS.from_user_input(value)
-            return datum_crs.name
+            return get_datum_name(value)
         except Exception:
             raise ValueError(
                 f"Invalid datum value: {value}. Must be a valid CRS string or identifier."
@@ -399,7 +399,7 @@ class Survey(MetadataBase):
             if isinstance(station_entry, (dict, OrderedDict)):
                 try:
                     station = Station()
-                    station.from_dict(station_entry)
+                    station.from_dict(station_entry, mode=get_from_dict_mode(info))
                     stations.append(station)
                 except KeyError:
                     msg = f"Item {ii} is not type(Station); type={type(station_entry)}"
@@ -16,6 +16,7 @@ seamless data interchange and analysis across different MT software packages.
 MetadataBase Objects
 --------------------
 * TF - Main transfer function container with impedance, tipper, and associated metadata
+* TFCollection - Transfer functions of many stations stacked in one dataset
 * Station - Station-level metadata specific to transfer function processing
 * TransferFunction - Core transfer function metadata (impedance, tipper, processing info)
 * StatisticalEstimate - Statistical quality metrics and error estimates for transfer functions
@@ -49,6 +50,8 @@ The TF object serves as a central repository that:
 
 """
 
+import importlib
+
 # Define allowed sets of channel labellings
 STANDARD_INPUT_CHANNELS = [
     "hx",
@@ -91,7 +94,28 @@ def get_allowed_channel_names(standard_names):
 ALLOWED_INPUT_CHANNELS = get_allowed_channel_names(STANDARD_INPUT_CHANNELS)
 ALLOWED_OUTPUT_CHANNELS = get_allowed_channel_names(STANDARD_OUTPUT_CHANNELS)
 
-from .core import TF
+
+# TF imports every reader and xarray, only load it when it is used (PEP 562)
+_LAZY_IMPORTS = {
+    "TF": ".core",
+    "read_many": ".bulk",
+    "read_catalog": ".bulk",
+    "TFCollection": ".collection",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
-__all__ = ["TF"]
+__all__ = ["TF", "TFCollection", "read_many", "read_catalog"]
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.bulk
+   :synopsis: Read many transfer function files in parallel
+
+Reading a transfer function file is CPU bound text parsing, so a survey
+directory is read fastest by spreading the files over a process pool.
+
+:Example: ::
+
+    >>> from mt_metadata.transfer_functions import read_many, read_catalog
+    >>> for result in read_many("/home/mt/survey", workers=8):
+    ...     if result.error is not None:
+    ...         print(f"{result.fn}: {result.error}")
+    ...         continue
+    ...     print(result.tf.station, result.tf.period.size)
+    >>> catalog = read_catalog("/home/mt/survey", workers=8)
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+from collections.abc import Iterable, Iterator
+from concurrent.futures import as_completed, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+import pandas as pd
+from loguru import logger
+
+from mt_metadata.transfer_functions.core import TF
+
+# =============================================================================
+
+TF_EXTENSIONS = [".edi", ".xml", ".j", ".zmm", ".zrr", ".zss", ".avg", ".nc", ".zarr"]
+
+
+class TFReadResult(NamedTuple):
+    """Result of reading one file with :func:`read_many`"""
+
+    fn: Path
+    tf: TF | None
+    error: Exception | None
+
+
+def get_tf_files(
+    paths: str | Path | Iterable[str | Path],
+    extensions: list[str] = TF_EXTENSIONS,
+) -> list[Path]:
+    """
+    List transfer function files.
+
+    :param paths: a file, a directory or a list of them, directories are
+     searched recursively for files with a transfer function extension
+    :type paths: str | Path | Iterable[str | Path]
+    :param extensions: file extensions to look for in directories
+    :type extensions: list[str]
+    :return: files sorted by name within each directory
+    :rtype: list[Path]
+
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    fn_list = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir() and path.suffix.lower() != ".zarr":
+            fn_list += sorted(
+                fn
+                for fn in path.rglob("*")
+                if fn.suffix.lower() in extensions
+                and (fn.is_file() or fn.suffix.lower() == ".zarr")
+            )
+        else:
+            fn_list.append(path)
+    return fn_list
+
+
+def _read_error(fn: Path, error: Exception) -> TFReadResult:
+    return TFReadResult(fn, None, error)
+
+
+def _read_tf(fn: Path, kwargs: dict[str, Any]) -> TFReadResult:
+    """Read one file in a worker, errors are returned not raised"""
+    try:
+        tf = TF(fn=fn)
+        tf.read(**kwargs)
+        return TFReadResult(fn, tf, None)
+    except Exception as error:
+        return _read_error(fn, error)
+
+
+def _peek_error(fn: Path, error: Exception) -> dict[str, Any]:
+    return {"fn": fn, "error": f"{type(error).__name__}: {error}"}
+
+
+def _peek_tf(fn: Path, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Summarize one file in a worker, errors are returned not raised"""
+    try:
+        summary = TF().peek(fn, **kwargs)
+        summary["error"] = None
+        return summary
+    except Exception as error:
+        return _peek_error(fn, error)
+
+
+def _map_files(
+    function,
+    on_error,
+    fn_list: list[Path],
+    kwargs: dict[str, Any],
+    workers: int | None,
+    executor: Literal["process", "thread"],
+) -> Iterator[Any]:
+    """
+    Apply ``function(fn, kwargs)`` to each file and yield the results in
+    the order they complete.  ``on_error(fn, error)`` makes the result of a
+    worker that failed outside of ``function``.
+    """
+    if workers == 1 or len(fn_list) <= 1:
+        for fn in fn_list:
+            yield function(fn, kwargs)
+        return
+
+    if executor == "process":
+        pool_class = ProcessPoolExecutor
+    elif executor == "thread":
+        pool_class = ThreadPoolExecutor
+    else:
+        raise ValueError(f"executor must be 'process' or 'thread', not '{executor}'")
+
+    with pool_class(max_workers=workers) as pool:
+        futures = {pool.submit(function, fn, kwargs): fn for fn in fn_list}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as error:
+                # the worker died or its result could not be sent back
+                yield on_error(futures[future], error)
+
+
+def read_many(
+    paths: str | Path | Iterable[str | Path],
+    workers: int | None = None,
+    executor: Literal["process", "thread"] = "process",
+    **kwargs,
+) -> Iterator[TFReadResult]:
+    """
+    Read many transfer function files in parallel.
+
+    Results are yielded as each file is read, in the order they complete.
+    A file that cannot be read yields a result with the error instead of
+    stopping the other reads.
+
+    :param paths: a file, a directory or a list of them, directories are
+     searched recursively, see :func:`get_tf_files`
+    :type paths: str | Path | Iterable[str | Path]
+    :param workers: number of workers, defaults to the number of CPUs
+    :type workers: int | None
+    :param executor: "process" to parse in parallel, "thread" when the
+     files are on a slow file system and reading dominates
+    :type executor: str
+    :param kwargs: keyword arguments passed to :meth:`TF.read`, for
+     example ``metadata_only=True`` or ``cache=True``
+    :return: (fn, tf, error) of each file
+    :rtype: Iterator[TFReadResult]
+
+    """
+    fn_list = get_tf_files(paths)
+    logger.debug(f"Reading {len(fn_list)} transfer function files")
+    for result in _map_files(_read_tf, _read_error, fn_list, kwargs, workers, executor):
+        if result.error is not None:
+            logger.warning(f"Could not read {result.fn}: {result.error}")
+        yield result
+
+
+def read_catalog(
+    paths: str | Path | Iterable[str | Path],
+    workers: int | None = None,
+    executor: Literal["process", "thread"] = "process",
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Summarize many transfer function files in one table.
+
+    Only the metadata of each file is read, see :meth:`TF.peek`.
+
+    :param paths: a file, a directory or a list of them, directories are
+     searched recursively, see :func:`get_tf_files`
+    :type paths: str | Path | Iterable[str | Path]
+    :param workers: number of workers, defaults to the number of CPUs
+    :type workers: int | None
+    :param executor: "process" or "thread"
+    :type executor: str
+    :param kwargs: keyword arguments passed to :meth:`TF.peek`
+    :return: one row per file with the columns of :meth:`TF.peek` and an
+     error column, sorted by file name
+    :rtype: pd.DataFrame
+
+    """
+    fn_list = get_tf_files(paths)
+    rows = list(_map_files(_peek_tf, _peek_error, fn_list, kwargs, workers, executor))
+    for row in rows:
+        if row["error"] is not None:
+            logger.warning(f"Could not read {row['fn']}: {row['error']}")
+    catalog = pd.DataFrame(rows)
+    if len(catalog) > 0:
+        catalog = catalog.sort_values("fn", key=lambda fn: fn.astype(str))
+        catalog = catalog.reset_index(drop=True)
+    return catalog
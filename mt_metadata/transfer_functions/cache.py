@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.cache
+   :synopsis: Sidecar cache of parsed transfer function files
+
+Parsing text transfer function files (EDI, ZMM, J, ...) is slow compared
+to loading arrays, so :meth:`TF.read` can store what it parsed in a cache
+directory and load it from there the next time the same file is read.
+
+Each entry is a pair of files named after a key computed from the path,
+size, modification time and content of the source file:
+
+    - ``<key>.npz`` holds the coordinates and data variables of the
+      transfer function dataset.
+    - ``<key>.json`` holds the survey metadata and the other attributes
+      the readers set, see ``STATE_ATTRIBUTES``, written as JSON so that
+      loading an entry never runs code from the cache directory.
+
+The cache is bounded in size, the least recently used entries are removed
+when it grows past ``max_size``.
+
+Environment variables
+---------------------
+    - ``MT_METADATA_TF_CACHE_DIR``: cache directory, defaults to
+      ``transfer_functions`` in the mt_metadata cache directory.
+    - ``MT_METADATA_TF_CACHE_SIZE``: maximum size of the cache in bytes.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import xarray as xr
+from loguru import logger
+
+from mt_metadata import __version__
+from mt_metadata.base.helpers import array_hook, ArrayEncoder
+from mt_metadata.base.pydantic_helpers import _cache_dir
+from mt_metadata.transfer_functions.io.netcdf.netcdf import (
+    survey_from_dict,
+    survey_to_dict,
+)
+
+# =============================================================================
+
+DEFAULT_MAX_SIZE = 1024**3
+
+# TF attributes set by the readers besides the dataset and survey metadata
+STATE_ATTRIBUTES = ["_rotation_angle", "channel_nomenclature", "decimation_dict"]
+
+
+class TFCache:
+    """
+    Size bounded, least recently used cache of parsed transfer functions.
+
+    :param cache_dir: directory to store the cache entries in, defaults to
+     ``MT_METADATA_TF_CACHE_DIR`` or ``transfer_functions`` in the
+     mt_metadata cache directory.
+    :type cache_dir: str | Path | None
+    :param max_size: maximum size of the cache in bytes, defaults to
+     ``MT_METADATA_TF_CACHE_SIZE`` or 1 GB.
+    :type max_size: int | None
+
+    :Example: ::
+
+        >>> from mt_metadata.transfer_functions import TF
+        >>> from mt_metadata.transfer_functions.cache import TFCache
+        >>> tf_cache = TFCache(cache_dir="/home/mt/tf_cache", max_size=10e6)
+        >>> tf_obj = TF()
+        >>> tf_obj.read(fn=r"/home/mt/mt01.edi", cache=tf_cache)
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_size: int | None = None,
+    ):
+        if cache_dir is None:
+            cache_dir = os.environ.get("MT_METADATA_TF_CACHE_DIR")
+        if cache_dir is None:
+            cache_dir = Path(_cache_dir()).joinpath("transfer_functions")
+        self.cache_dir = Path(cache_dir).expanduser()
+
+        if max_size is None:
+            max_size = os.environ.get("MT_METADATA_TF_CACHE_SIZE", DEFAULT_MAX_SIZE)
+        self.max_size = int(float(max_size))
+
+    def __str__(self) -> str:
+        return f"TFCache(cache_dir={self.cache_dir}, max_size={self.max_size})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def get_key(self, fn: str | Path, **kwargs: Any) -> str:
+        """
+        Key of a file in the cache.
+
+        The key changes when the file is moved, modified or replaced, when
+        it is read with different arguments or by another version of
+        mt_metadata.
+
+        :param fn: transfer function file
+        :type fn: str | Path
+        :param kwargs: read arguments that change the parsed result
+        :return: hexadecimal key
+        :rtype: str
+
+        """
+        fn = Path(fn).resolve()
+        stat = fn.stat()
+        key = hashlib.sha256()
+        key.update(
+            repr(
+                (
+                    __version__,
+                    str(fn),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    sorted((k, repr(v)) for k, v in kwargs.items()),
+                )
+            ).encode()
+        )
+        with open(fn, "rb") as fid:
+            key.update(fid.read())
+        return key.hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return (
+            self.cache_dir.joinpath(f"{key}.npz"),
+            self.cache_dir.joinpath(f"{key}.json"),
+        )
+
+    def load(self, key: str, tf_object) -> bool:
+        """
+        Fill a TF object from the cache.
+
+        :param key: key of the entry, see :meth:`get_key`
+        :type key: str
+        :param tf_object: transfer function to fill
+        :type tf_object: :class:`mt_metadata.transfer_functions.core.TF`
+        :return: True if the entry was found and loaded
+        :rtype: bool
+
+        """
+        data_fn, metadata_fn = self._paths(key)
+        if not data_fn.exists() or not metadata_fn.exists():
+            return False
+        try:
+            with np.load(data_fn, allow_pickle=False) as npz:
+                coords = {
+                    name: npz[name].copy() for name in ["period", "output", "input"]
+                }
+                data_vars = {
+                    name[len("data_") :]: (["period", "output", "input"], npz[name])
+                    for name in npz.files
+                    if name.startswith("data_")
+                }
+            with open(metadata_fn, "r") as fid:
+                metadata = json.load(fid, object_hook=array_hook)
+            survey_metadata = survey_from_dict(metadata.pop("survey_metadata"))
+            if "decimation_dict" in metadata:
+                # JSON has no tuples, bands are a tuple
+                metadata["decimation_dict"] = {
+                    period: {
+                        name: tuple(value) if isinstance(value, list) else value
+                        for name, value in decimation.items()
+                    }
+                    for period, decimation in metadata["decimation_dict"].items()
+                }
+        except Exception as error:
+            logger.warning(f"Could not load cache entry {key}: {error}")
+            self.remove(key)
+            return False
+
+        tf_object._transfer_function = xr.Dataset(data_vars, coords=coords)
+        tf_object._survey_metadata = survey_metadata
+        for name, value in metadata.items():
+            setattr(tf_object, name, value)
+        # mark the entry as recently used
+        for fn in (data_fn, metadata_fn):
+            os.utime(fn)
+        logger.debug(f"Loaded {tf_object.fn} from cache entry {key}")
+        return True
+
+    def save(self, key: str, tf_object) -> None:
+        """
+        Store a TF object in the cache and evict old entries if the cache
+        grew too large.
+
+        :param key: key of the entry, see :meth:`get_key`
+        :type key: str
+        :param tf_object: transfer function to store
+        :type tf_object: :class:`mt_metadata.transfer_functions.core.TF`
+
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        data_fn, metadata_fn = self._paths(key)
+        dataset = tf_object._transfer_function
+        arrays = {
+            name: np.asarray(dataset.coords[name].data)
+            for name in ["period", "output", "input"]
+        }
+        for name, data_array in dataset.data_vars.items():
+            arrays[f"data_{name}"] = data_array.data
+        metadata = {"survey_metadata": survey_to_dict(tf_object._survey_metadata)}
+        for name in STATE_ATTRIBUTES:
+            if hasattr(tf_object, name):
+                metadata[name] = getattr(tf_object, name)
+
+        # write to temporary files first so a reader never sees half an entry
+        tmp_data_fn = data_fn.with_suffix(".npz.tmp")
+        tmp_metadata_fn = metadata_fn.with_suffix(".json.tmp")
+        try:
+            with open(tmp_data_fn, "wb") as fid:
+                np.savez(fid, **arrays)
+            with open(tmp_metadata_fn, "w") as fid:
+                json.dump(metadata, fid, cls=ArrayEncoder)
+            os.replace(tmp_data_fn, data_fn)
+            os.replace(tmp_metadata_fn, metadata_fn)
+        except Exception as error:
+            logger.warning(f"Could not write cache entry {key}: {error}")
+            for fn in (tmp_data_fn, tmp_metadata_fn, data_fn, metadata_fn):
+                fn.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def remove(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        :param key: key of the entry, see :meth:`get_key`
+        :type key: str
+
+        """
+        for fn in self._paths(key):
+            fn.unlink(missing_ok=True)
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """
+        Last use, size and key of each entry in the cache.
+        """
+        entries = {}
+        if not self.cache_dir.exists():
+            return []
+        for fn in self.cache_dir.iterdir():
+            if fn.suffix not in [".npz", ".json"]:
+                continue
+            stat = fn.stat()
+            last_used, size = entries.get(fn.stem, (0, 0))
+            entries[fn.stem] = (max(last_used, stat.st_mtime), size + stat.st_size)
+        return sorted((used, size, key) for key, (used, size) in entries.items())
+
+    @property
+    def size(self) -> int:
+        """Size of the cache in bytes"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache is no larger
+        than ``max_size``.
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total <= self.max_size:
+                break
+            logger.debug(f"Evicting cache entry {key}")
+            self.remove(key)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        for _, _, key in self._entries():
+            self.remove(key)
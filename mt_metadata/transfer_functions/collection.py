@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.collection
+   :synopsis: Many transfer functions stacked in one xarray.Dataset
+
+A :class:`TFCollection` stacks the datasets of many :class:`TF` objects
+along a ``station`` dimension.  The period axis is the union of the
+periods of all stations, a station is NaN at periods it does not have.
+Channels are labeled with the default names (ex, ey, hz, hx, hy) whatever
+the channel nomenclature of each station.
+
+Station location and file information are kept in a table
+(:attr:`TFCollection.station_table`) so selections by location are done on
+columns, and selections by period on the stacked arrays, without a loop
+over stations.  The full metadata of each station is kept to rebuild a
+:class:`TF` for writing.
+
+:Example: ::
+
+    >>> from mt_metadata.transfer_functions import TFCollection
+    >>> tfc = TFCollection.from_directory("/home/mt/survey", workers=8)
+    >>> z_10 = tfc.sel_period(10).transfer_function.sel(
+    ...     output=["ex", "ey"], input=["hx", "hy"]
+    ... )
+    >>> north = tfc.sel_bounds(min_latitude=40)
+    >>> north.write(save_dir="/home/mt/north", file_type="xml")
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+from collections.abc import Iterable, Iterator
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from loguru import logger
+
+from mt_metadata.transfer_functions.bulk import read_many
+from mt_metadata.transfer_functions.core import TF, TFError
+
+# =============================================================================
+
+STATION_COLUMNS = [
+    "survey",
+    "latitude",
+    "longitude",
+    "elevation",
+    "n_periods",
+    "period_min",
+    "period_max",
+    "fn",
+]
+LOCATION_COORDINATES = ["latitude", "longitude", "elevation"]
+EARTH_RADIUS = 6371.0088
+
+
+class TFCollection:
+    """
+    Transfer functions of many stations in one dataset with dimensions
+    (station, period, output, input).
+
+    :param tf_list: transfer functions to add, defaults to None
+    :type tf_list: Iterable[TF] | None
+
+    """
+
+    def __init__(self, tf_list: Iterable[TF] | None = None):
+        self.dataset = None
+        self.station_table = pd.DataFrame(
+            columns=STATION_COLUMNS, index=pd.Index([], name="station")
+        )
+        # metadata needed to rebuild each TF, keyed by station
+        self._tf_metadata = {}
+        if tf_list is not None:
+            self.add(tf_list)
+
+    def __str__(self) -> str:
+        lines = [f"TFCollection: {len(self)} stations"]
+        if self.dataset is not None:
+            lines.append(
+                f"\tPeriods: {self.period.size} from {self.period.min():.4g} to "
+                f"{self.period.max():.4g} s"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __len__(self) -> int:
+        return len(self._tf_metadata)
+
+    def __contains__(self, station: str) -> bool:
+        return station in self._tf_metadata
+
+    def __iter__(self) -> Iterator[TF]:
+        for station in self.stations:
+            yield self.to_tf(station)
+
+    def __getitem__(self, station: str) -> TF:
+        return self.to_tf(station)
+
+    @classmethod
+    def from_directory(
+        cls,
+        paths: str | Path | Iterable[str | Path],
+        workers: int | None = None,
+        executor: Literal["process", "thread"] = "process",
+        **kwargs,
+    ) -> "TFCollection":
+        """
+        Read many transfer function files in parallel into a collection.
+
+        Files that cannot be read are logged and skipped, see
+        :func:`mt_metadata.transfer_functions.bulk.read_many`.
+
+        :param paths: a file, a directory or a list of them, directories are
+         searched recursively
+        :type paths: str | Path | Iterable[str | Path]
+        :param workers: number of workers, defaults to the number of CPUs
+        :type workers: int | None
+        :param executor: "process" or "thread"
+        :type executor: str
+        :param kwargs: keyword arguments passed to :meth:`TF.read`
+        :return: collection of the stations sorted by file name
+        :rtype: TFCollection
+
+        """
+        results = [
+            result
+            for result in read_many(paths, workers=workers, executor=executor, **kwargs)
+            if result.tf is not None
+        ]
+        results.sort(key=lambda result: str(result.fn))
+        return cls([result.tf for result in results])
+
+    @property
+    def stations(self) -> list[str]:
+        """station names in the order of the station dimension"""
+        if self.dataset is None:
+            return []
+        return [str(station) for station in self.dataset.station.data]
+
+    @property
+    def period(self) -> np.ndarray | None:
+        """union of the periods of all stations"""
+        if self.dataset is None:
+            return None
+        return self.dataset.period.data
+
+    def _get_components(self, key: str, outputs: list[str]) -> xr.DataArray | None:
+        if self.dataset is None:
+            return None
+        return self.dataset[key].loc[dict(output=outputs, input=["hx", "hy"])]
+
+    @property
+    def impedance(self) -> xr.DataArray | None:
+        """impedance of all stations (station, period, output, input)"""
+        return self._get_components("transfer_function", ["ex", "ey"])
+
+    @property
+    def impedance_error(self) -> xr.DataArray | None:
+        """impedance error of all stations"""
+        return self._get_components("transfer_function_error", ["ex", "ey"])
+
+    @property
+    def tipper(self) -> xr.DataArray | None:
+        """tipper of all stations (station, period, output, input)"""
+        return self._get_components("transfer_function", ["hz"])
+
+    @property
+    def tipper_error(self) -> xr.DataArray | None:
+        """tipper error of all stations"""
+        return self._get_components("transfer_function_error", ["hz"])
+
+    def _station_row(self, tf: TF) -> dict[str, Any]:
+        """row of the station table"""
+        location = tf.station_metadata.location
+        period = tf.period
+        return {
+            "survey": tf.survey_metadata.id,
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "elevation": location.elevation,
+            "n_periods": int(period.size),
+            "period_min": float(period.min()),
+            "period_max": float(period.max()),
+            "fn": tf.fn,
+        }
+
+    def _station_dataset(self, tf: TF) -> xr.Dataset:
+        """dataset of a TF with default channel names and a station axis"""
+        inverse = {value: key for key, value in tf.channel_nomenclature.items()}
+        dataset = tf.dataset.sortby("period")
+        dataset = dataset.assign_coords(
+            output=[inverse[ch] for ch in dataset.output.data],
+            input=[inverse[ch] for ch in dataset.input.data],
+        )
+        dataset.attrs = {}
+        return dataset.expand_dims(station=[tf.station])
+
+    def add(self, tf_list: TF | Iterable[TF]) -> None:
+        """
+        Add transfer functions, the period axis becomes the union of the
+        periods of all stations.
+
+        :param tf_list: transfer functions to add
+        :type tf_list: TF | Iterable[TF]
+        :raises TFError: if a station is already in the collection
+
+        """
+        if isinstance(tf_list, TF):
+            tf_list = [tf_list]
+
+        datasets = []
+        rows = {}
+        metadata = {}
+        for tf in tf_list:
+            if tf.station in self._tf_metadata or tf.station in metadata:
+                msg = f"Station {tf.station} is already in the collection"
+                logger.error(msg)
+                raise TFError(msg)
+            datasets.append(self._station_dataset(tf))
+            rows[tf.station] = self._station_row(tf)
+            metadata[tf.station] = {
+                "survey_metadata": deepcopy(tf.survey_metadata),
+                "channel_nomenclature": dict(tf.channel_nomenclature),
+                "rotation_angle": deepcopy(tf._rotation_angle),
+                "period": np.sort(tf.period),
+            }
+        if not datasets:
+            return
+
+        if self.dataset is not None:
+            datasets.insert(0, self.dataset.drop_vars(LOCATION_COORDINATES))
+        dataset = xr.concat(
+            datasets,
+            dim="station",
+            join="outer",
+            fill_value=np.nan,
+            combine_attrs="drop",
+        )
+        new_table = pd.DataFrame.from_dict(
+            rows, orient="index", columns=STATION_COLUMNS
+        )
+        new_table.index.name = "station"
+        if len(self.station_table) > 0:
+            new_table = pd.concat([self.station_table, new_table])
+        self._set(dataset, new_table, {**self._tf_metadata, **metadata})
+
+    def _set(
+        self,
+        dataset: xr.Dataset,
+        station_table: pd.DataFrame,
+        tf_metadata: dict[str, dict[str, Any]],
+    ) -> None:
+        """set the dataset and the station table with location coordinates"""
+        self.station_table = station_table
+        self._tf_metadata = tf_metadata
+        stations = dataset.station.data
+        self.dataset = dataset.assign_coords(
+            {
+                key: ("station", station_table.loc[stations, key].to_numpy())
+                for key in LOCATION_COORDINATES
+            }
+        )
+
+    def to_tf(self, station: str) -> TF:
+        """
+        Rebuild the TF of a station with its own periods, channel
+        nomenclature and metadata.
+
+        :param station: station name
+        :type station: str
+        :return: transfer function of the station
+        :rtype: TF
+        :raises KeyError: if the station is not in the collection
+
+        """
+        try:
+            metadata = self._tf_metadata[station]
+        except KeyError:
+            msg = f"Station {station} is not in the collection"
+            logger.error(msg)
+            raise KeyError(msg)
+
+        nomenclature = metadata["channel_nomenclature"]
+        dataset = self.dataset.sel(station=station, period=metadata["period"])
+        dataset = dataset.drop_vars(["station"] + LOCATION_COORDINATES)
+        dataset = dataset.assign_coords(
+            output=[nomenclature[ch] for ch in dataset.output.data],
+            input=[nomenclature[ch] for ch in dataset.input.data],
+        )
+
+        tf = TF()
+        tf.channel_nomenclature = nomenclature
+        tf._survey_metadata = deepcopy(metadata["survey_metadata"])
+        tf._rotation_angle = deepcopy(metadata["rotation_angle"])
+        # fn is not set so writing does not default to the original directory
+        tf._transfer_function = dataset
+        return tf
+
+    def sel_stations(self, stations: str | Iterable[str]) -> "TFCollection":
+        """
+        Collection of some of the stations, the period axis is the union of
+        the periods of those stations.
+
+        :param stations: station names
+        :type stations: str | Iterable[str]
+        :return: new collection
+        :rtype: TFCollection
+
+        """
+        if isinstance(stations, str):
+            stations = [stations]
+        stations = [station for station in self.stations if station in set(stations)]
+        collection = TFCollection()
+        if not stations:
+            return collection
+
+        periods = np.concatenate(
+            [self._tf_metadata[station]["period"] for station in stations]
+        )
+        dataset = self.dataset.sel(station=stations).isel(
+            period=np.isin(self.period, periods)
+        )
+        collection._set(
+            dataset.drop_vars(LOCATION_COORDINATES),
+            self.station_table.loc[stations],
+            {station: self._tf_metadata[station] for station in stations},
+        )
+        return collection
+
+    def sel_bounds(
+        self,
+        min_latitude: float = -90,
+        max_latitude: float = 90,
+        min_longitude: float = -180,
+        max_longitude: float = 180,
+    ) -> "TFCollection":
+        """
+        Collection of the stations inside a bounding box, inclusive.
+
+        :param min_latitude: minimum latitude in degrees
+        :type min_latitude: float
+        :param max_latitude: maximum latitude in degrees
+        :type max_latitude: float
+        :param min_longitude: minimum longitude in degrees
+        :type min_longitude: float
+        :param max_longitude: maximum longitude in degrees
+        :type max_longitude: float
+        :return: new collection
+        :rtype: TFCollection
+
+        """
+        table = self.station_table
+        inside = table.latitude.between(
+            min_latitude, max_latitude
+        ) & table.longitude.between(min_longitude, max_longitude)
+        return self.sel_stations(table.index[inside])
+
+    def distance(self, latitude: float, longitude: float) -> pd.Series:
+        """
+        Great circle distance of every station to a point.
+
+        :param latitude: latitude of the point in degrees
+        :type latitude: float
+        :param longitude: longitude of the point in degrees
+        :type longitude: float
+        :return: distance in km by station
+        :rtype: pd.Series
+
+        """
+        lat_1 = np.radians(self.station_table.latitude.to_numpy(dtype=float))
+        lon_1 = np.radians(self.station_table.longitude.to_numpy(dtype=float))
+        lat_2 = np.radians(latitude)
+        lon_2 = np.radians(longitude)
+        haversine = (
+            np.sin((lat_2 - lat_1) / 2) ** 2
+            + np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) / 2) ** 2
+        )
+        return pd.Series(
+            2 * EARTH_RADIUS * np.arcsin(np.sqrt(haversine)),
+            index=self.station_table.index,
+            name="distance",
+        )
+
+    def sel_radius(
+        self, latitude: float, longitude: float, radius: float
+    ) -> "TFCollection":
+        """
+        Collection of the stations within a distance of a point.
+
+        :param latitude: latitude of the point in degrees
+        :type latitude: float
+        :param longitude: longitude of the point in degrees
+        :type longitude: float
+        :param radius: distance in km, inclusive
+        :type radius: float
+        :return: new collection
+        :rtype: TFCollection
+
+        """
+        distance = self.distance(latitude, longitude)
+        return self.sel_stations(distance.index[distance <= radius])
+
+    def sel_period(
+        self, period: float | np.ndarray, tolerance: float | None = None
+    ) -> xr.Dataset:
+        """
+        Values of every station at the period closest in log-period to each
+        requested period, among the periods the station has.
+
+        :param period: requested periods in seconds
+        :type period: float | np.ndarray
+        :param tolerance: maximum relative difference between the requested
+         and the station period, 0.05 is 5 %, values outside the tolerance
+         are NaN, defaults to None for no limit
+        :type tolerance: float | None
+        :return: dataset with dimensions (station, period, output, input) on
+         the requested periods and the periods used by each station as the
+         ``station_period`` coordinate (station, period)
+        :rtype: xr.Dataset
+
+        """
+        period = np.atleast_1d(np.asarray(period, dtype=float))
+        has_data = np.isfinite(self.dataset.transfer_function.data).any(axis=(-2, -1))
+        distance = np.abs(
+            np.log10(self.period)[np.newaxis, np.newaxis, :]
+            - np.log10(period)[np.newaxis, :, np.newaxis]
+        )
+        distance = np.where(has_data[:, np.newaxis, :], distance, np.inf)
+        index = np.argmin(distance, axis=-1)
+        station_period = self.period[index]
+
+        # stations without any data
+        missing = np.isinf(distance.min(axis=-1))
+        if tolerance is not None:
+            missing |= np.abs(station_period / period - 1) > tolerance
+        station_period = np.where(missing, np.nan, station_period)
+
+        data_vars = {}
+        for key, data_array in self.dataset.data_vars.items():
+            data = np.take_along_axis(
+                data_array.data, index[..., np.newaxis, np.newaxis], axis=1
+            )
+            data = np.where(missing[..., np.newaxis, np.newaxis], np.nan, data)
+            data_vars[key] = (data_array.dims, data, data_array.attrs)
+
+        coords = {
+            key: value for key, value in self.dataset.coords.items() if key != "period"
+        }
+        coords["period"] = period
+        coords["station_period"] = (("station", "period"), station_period)
+        return xr.Dataset(data_vars, coords=coords)
+
+    def write(
+        self,
+        save_dir: str | Path | None = None,
+        file_type: Literal["edi", "xml", "zmm", "avg", "j", "nc", "zarr"] = "edi",
+        **kwargs,
+    ) -> list[Any]:
+        """
+        Write every station with :meth:`TF.write`, files are named by
+        station.
+
+        :param save_dir: directory to write to, defaults to the current
+         directory
+        :type save_dir: str | Path | None
+        :param file_type: type of file to write
+        :type file_type: str
+        :param kwargs: keyword arguments passed to :meth:`TF.write`
+        :return: the written objects returned by :meth:`TF.write`
+        :rtype: list[Any]
+
+        """
+        return [
+            tf.write(save_dir=save_dir, file_type=file_type, **kwargs) for tf in self
+        ]
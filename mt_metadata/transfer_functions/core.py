@@ -24,8 +24,20 @@ from mt_metadata.common.list_dict import ListDict
 from mt_metadata.timeseries import Electric, Magnetic, Run
 from mt_metadata.timeseries import Station as TSStation
 from mt_metadata.timeseries import Survey
-from mt_metadata.transfer_functions.io import EDI, EMTFXML, JFile, ZMM, ZongeMTAvg
+from mt_metadata.transfer_functions import derived
+from mt_metadata.transfer_functions.cache import TFCache
+from mt_metadata.transfer_functions.interpolation import interpolate_tensors
+from mt_metadata.transfer_functions.io import (
+    EDI,
+    EMTFXML,
+    JFile,
+    TFNetCDF,
+    ZMM,
+    ZongeMTAvg,
+)
+from mt_metadata.transfer_functions.io.tools import errors_from_covariance
 from mt_metadata.transfer_functions.io.zfiles.metadata import Channel as ZChannel
+from mt_metadata.transfer_functions.rotation import rotate_tensors
 from mt_metadata.transfer_functions.tf import Station
 
 # =============================================================================
@@ -58,6 +70,10 @@ class TF:
 
         self._rotation_angle = 0
         self.save_dir = Path.cwd()
+        # periods found by a metadata only read, the dataset is not filled
+        self._metadata_period = None
+        # read arguments of a lazy read, the data are read on first access
+        self._lazy_read_kwargs = None
 
         self._dataset_attr_dict = {
             "survey": "survey_metadata.id",
@@ -85,6 +101,8 @@ class TF:
             "zrr": {"write": self.to_zrr, "read": self.from_zrr},
             "zss": {"write": self.to_zss, "read": self.from_zss},
             "avg": {"write": self.to_avg, "read": self.from_avg},
+            "nc": {"write": self.to_netcdf, "read": self.from_netcdf},
+            "zarr": {"write": self.to_netcdf, "read": self.from_netcdf},
         }
 
         tf_set = False
@@ -726,6 +744,33 @@ class TF:
 
         self.station_metadata.location.elevation = elevation
 
+    @property
+    def _transfer_function(self) -> xr.Dataset:
+        """Transfer function dataset, data of a lazy read are read here"""
+        if self._lazy_read_kwargs is not None:
+            self._read_lazy_data()
+        return self._tf_dataset
+
+    @_transfer_function.setter
+    def _transfer_function(self, value: xr.Dataset) -> None:
+        self._tf_dataset = value
+        self._derived_cache = {}
+
+    def _read_lazy_data(self) -> None:
+        """
+        Read the data of a file opened with ``read(lazy=True)``.
+
+        The metadata set by the lazy read, including any changes made since,
+        are kept.
+        """
+        read_kwargs = self._lazy_read_kwargs
+        self._lazy_read_kwargs = None
+        # the reader fills the survey metadata in place, keep a copy
+        survey_metadata = deepcopy(self._survey_metadata)
+        logger.debug(f"Reading data of {read_kwargs['fn']}")
+        self.read(**read_kwargs)
+        self._survey_metadata = survey_metadata
+
     @property
     def dataset(self) -> xr.Dataset:
         """
@@ -900,6 +945,7 @@ class TF:
             )
             logger.error(msg)
             raise TFError(msg)
+        self._derived_cache = {}
 
     def has_transfer_function(self) -> bool:
         """
@@ -1457,45 +1503,40 @@ class TF:
         if self.has_inverse_signal_power():
             self._compute_error_from_covariance()
 
-    def _compute_impedance_error_from_covariance(self) -> None:
+    def _set_error_from_covariance(self, outputs: list[str]) -> None:
         """
-        Compute transfer function errors from covariance matrices
-
-        This will become important when writing edi files.
+        Set the transfer function errors of the given output channels from
+        the residual covariance and inverse signal power.
 
-        Translated from code written by Ben Murphy.
+        Parameters
+        ----------
+        outputs : list[str]
+            Output channels to set the errors of.
 
         """
-        sigma_e = self.residual_covariance.loc[
-            dict(input=self.ex_ey, output=self.ex_ey)
-        ]
-        sigma_s = self.inverse_signal_power.loc[
+        sigma_e = self._transfer_function.residual_covariance.loc[
+            dict(input=outputs, output=outputs)
+        ].data
+        sigma_s = self._transfer_function.inverse_signal_power.loc[
             dict(input=self.hx_hy, output=self.hx_hy)
-        ]
+        ].data
 
-        z_err = np.zeros((self.period.size, 2, 2), dtype=float)
-        z_err[:, 0, 0] = np.abs(
-            sigma_e.loc[dict(input=[self.ex], output=[self.ex])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hx], output=[self.hx])].data.flatten()
-        )
-        z_err[:, 0, 1] = np.abs(
-            sigma_e.loc[dict(input=[self.ex], output=[self.ex])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hy], output=[self.hy])].data.flatten()
-        )
-        z_err[:, 1, 0] = np.abs(
-            sigma_e.loc[dict(input=[self.ey], output=[self.ey])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hx], output=[self.hx])].data.flatten()
-        )
-        z_err[:, 1, 1] = np.abs(
-            sigma_e.loc[dict(input=[self.ey], output=[self.ey])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hy], output=[self.hy])].data.flatten()
+        self._transfer_function.transfer_function_error.loc[
+            dict(input=self.hx_hy, output=outputs)
+        ] = errors_from_covariance(
+            np.diagonal(sigma_e, axis1=1, axis2=2),
+            np.diagonal(sigma_s, axis1=1, axis2=2),
         )
+        self._derived_cache = {}
 
-        z_err = np.sqrt(np.abs(z_err))
+    def _compute_impedance_error_from_covariance(self) -> None:
+        """
+        Compute transfer function errors from covariance matrices
+
+        This will become important when writing edi files.
 
-        self.dataset.transfer_function_error.loc[
-            dict(input=self.hx_hy, output=self.ex_ey)
-        ] = z_err
+        """
+        self._set_error_from_covariance(self.ex_ey)
 
     def _compute_tipper_error_from_covariance(self) -> None:
         """
@@ -1503,37 +1544,307 @@ class TF:
 
         This will become important when writing edi files.
 
-        Translated from code written by Ben Murphy.
+        """
+        self._set_error_from_covariance([self.hz])
+
+    def _compute_error_from_covariance(self) -> None:
+        """
+        convenience method to compute errors from covariance
 
         """
-        sigma_e = self.residual_covariance.loc[dict(input=[self.hz], output=[self.hz])]
-        sigma_s = self.inverse_signal_power.loc[
-            dict(input=self.hx_hy, output=self.hx_hy)
-        ]
+        self._set_error_from_covariance(self.ex_ey_hz)
+
+    def rotate(self, angle: float | np.ndarray, inplace: bool = True) -> Self | None:
+        """
+        Rotate the transfer function.
+
+        The transfer function, inverse signal power and residual covariance
+        are rotated for all periods at once.  If the covariances are set the
+        errors are computed from the rotated covariances, otherwise the
+        error variances are rotated assuming independent errors, as are
+        the model errors.
+
+        Parameters
+        ----------
+        angle : float | np.ndarray
+            Rotation angle in degrees clockwise from north, a single angle
+            or one per period.
+        inplace : bool
+            Rotate this object, otherwise return a rotated copy.
+
+        Returns
+        -------
+        Self | None
+            The rotated copy if inplace is False.
+
+        Raises
+        ------
+        TFError
+            If there is not one angle per period.
+
+        :Example: ::
 
-        t_err = np.zeros((self.period.size, 1, 2), dtype=float)
-        t_err[:, 0, 0] = np.abs(
-            sigma_e.loc[dict(input=[self.hz], output=[self.hz])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hx], output=[self.hx])].data.flatten()
+            >>> tf_obj.rotate(30)
+            >>> tf_obj.rotate(-30)  # back to the original orientation
+
+        """
+        if not inplace:
+            tf_obj = self.copy()
+            tf_obj.rotate(angle)
+            return tf_obj
+
+        angle = np.asarray(angle, dtype=float)
+        if angle.ndim > 0 and angle.size != self.period.size:
+            msg = (
+                f"Number of angles {angle.size} must be 1 or the number of "
+                f"periods {self.period.size}"
+            )
+            logger.error(msg)
+            raise TFError(msg)
+        period_angle = np.broadcast_to(angle.reshape(-1), self.period.shape)
+
+        comps = dict(
+            output=self._ch_output_dict["all"], input=self._ch_input_dict["all"]
         )
-        t_err[:, 0, 1] = np.abs(
-            sigma_e.loc[dict(input=[self.hz], output=[self.hz])].data.flatten()
-            * sigma_s.loc[dict(input=[self.hy], output=[self.hy])].data.flatten()
+        for key in [
+            "transfer_function",
+            "inverse_signal_power",
+            "residual_covariance",
+        ]:
+            data_array = self._transfer_function[key]
+            data_array.loc[comps] = rotate_tensors(
+                data_array.loc[comps].data, period_angle
+            )
+
+        error_keys = ["transfer_function_model_error"]
+        use_covariance = (
+            self.has_residual_covariance() and self.has_inverse_signal_power()
         )
+        if not use_covariance:
+            error_keys.append("transfer_function_error")
+        for key in error_keys:
+            data_array = self._transfer_function[key]
+            data_array.loc[comps] = np.sqrt(
+                rotate_tensors(
+                    data_array.loc[comps].data ** 2, period_angle, variance=True
+                )
+            )
+        if use_covariance:
+            self._compute_error_from_covariance()
 
-        t_err = np.sqrt(np.abs(t_err))
+        if angle.ndim == 0 and np.ndim(self._rotation_angle) == 0:
+            self._rotation_angle = float(self._rotation_angle + angle)
+        else:
+            self._rotation_angle = np.asarray(self._rotation_angle) + period_angle
+        self._derived_cache = {}
+
+    def interpolate(
+        self,
+        new_periods: np.ndarray,
+        method: str = "linear",
+        inplace: bool = False,
+    ) -> Self | None:
+        """
+        Interpolate the transfer function to new periods.
 
-        self.dataset.transfer_function_error.loc[
-            dict(input=self.hx_hy, output=[self.hz])
-        ] = t_err
+        All variables of the dataset are interpolated for all periods at
+        once in log-period space, see
+        :mod:`mt_metadata.transfer_functions.interpolation`.  The inverse
+        signal power and residual covariance are interpolated as values.  If
+        the covariances are set the errors are computed from the
+        interpolated covariances, otherwise the error variances are
+        interpolated assuming independent errors, as are the model errors.
+        New periods outside of the periods of the transfer function are NaN.
+
+        Parameters
+        ----------
+        new_periods : np.ndarray
+            New periods in seconds.
+        method : str
+            [ "linear" | "nearest" ] interpolation in log-period.
+        inplace : bool
+            Interpolate this object, otherwise return an interpolated copy.
+
+        Returns
+        -------
+        Self | None
+            The interpolated copy if inplace is False.
+
+        Raises
+        ------
+        TFError
+            If there are fewer than 2 periods or the method is not supported.
+
+        :Example: ::
+
+            >>> new_tf = tf_obj.interpolate(np.logspace(-2, 3, 30))
 
-    def _compute_error_from_covariance(self) -> None:
         """
-        convenience method to compute errors from covariance
+        if not inplace:
+            tf_obj = self.copy()
+            tf_obj.interpolate(new_periods, method=method, inplace=True)
+            return tf_obj
+
+        new_periods = np.atleast_1d(np.asarray(new_periods, dtype=float))
+        use_covariance = (
+            self.has_residual_covariance() and self.has_inverse_signal_power()
+        )
+        error_keys = ["transfer_function_model_error"]
+        if not use_covariance:
+            error_keys.append("transfer_function_error")
+
+        dataset = self._transfer_function
+        period = self.period
+        data_vars = {}
+        try:
+            for key, data_array in dataset.data_vars.items():
+                if key in error_keys:
+                    data = np.sqrt(
+                        interpolate_tensors(
+                            data_array.data**2,
+                            period,
+                            new_periods,
+                            method=method,
+                            variance=True,
+                        )
+                    )
+                else:
+                    data = interpolate_tensors(
+                        data_array.data, period, new_periods, method=method
+                    )
+                data_vars[key] = (data_array.dims, data, data_array.attrs)
+        except ValueError as error:
+            logger.error(error)
+            raise TFError(error)
+
+        self._transfer_function = xr.Dataset(
+            data_vars,
+            coords={
+                "period": new_periods,
+                "output": dataset.output,
+                "input": dataset.input,
+            },
+            attrs=dataset.attrs,
+        )
+        if np.ndim(self._rotation_angle) > 0:
+            order = np.argsort(period)
+            self._rotation_angle = np.interp(
+                np.log10(new_periods),
+                np.log10(period[order]),
+                np.asarray(self._rotation_angle)[order],
+            )
+        if use_covariance:
+            self._compute_error_from_covariance()
+
+    def _get_derived(self, key: str, compute) -> Any:
+        """
+        Memoized derived quantities.  The memo is cleared whenever data are
+        set through the TF setters, :meth:`rotate` or a new read.
+        """
+        if key not in self._derived_cache:
+            self._derived_cache[key] = compute()
+        return self._derived_cache[key]
+
+    def _impedance_arrays(self) -> tuple[xr.DataArray, np.ndarray] | None:
+        """impedance and its error"""
+        z = self.impedance
+        if z is None:
+            return None
+        return z, self.impedance_error.data
+
+    def _compute_resistivity_phase(self) -> dict[str, xr.DataArray] | None:
+        arrays = self._impedance_arrays()
+        if arrays is None:
+            return None
+        z, z_err = arrays
+        res, res_err = derived.apparent_resistivity(self.period, z.data, z_err)
+        phase, phase_err = derived.phase(z.data, z_err)
+        return {
+            name: z.copy(data=values).rename(name)
+            for name, values in [
+                ("apparent_resistivity", res),
+                ("apparent_resistivity_error", res_err),
+                ("phase", phase),
+                ("phase_error", phase_err),
+            ]
+        }
+
+    def _compute_phase_tensor(self) -> xr.Dataset | None:
+        arrays = self._impedance_arrays()
+        if arrays is None:
+            return None
+        z, z_err = arrays
+        pt, pt_err = derived.phase_tensor(z.data, z_err)
+        dims = ["period", "output", "input"]
+        data_vars = {"phase_tensor": (dims, pt), "phase_tensor_error": (dims, pt_err)}
+        for name, values in derived.phase_tensor_invariants(pt, pt_err).items():
+            data_vars[name] = (["period"], values)
+        return xr.Dataset(data_vars, coords=z.coords)
+
+    def _compute_tipper_magnitude(self) -> xr.Dataset | None:
+        t = self.tipper
+        if t is None:
+            return None
+        quantities = derived.tipper_magnitude(t.data, self.tipper_error.data)
+        return xr.Dataset(
+            {name: (["period"], values) for name, values in quantities.items()},
+            coords={"period": t.period},
+        )
+
+    @property
+    def apparent_resistivity(self) -> xr.DataArray | None:
+        """
+        Apparent resistivity in Ohm-m, None if there is no impedance.
+
+        Computed once for all periods and memoized until the data change,
+        like all derived quantities.
+        """
+        values = self._get_derived("resistivity_phase", self._compute_resistivity_phase)
+        if values is not None:
+            return values["apparent_resistivity"]
+
+    @property
+    def apparent_resistivity_error(self) -> xr.DataArray | None:
+        """Apparent resistivity error in Ohm-m propagated from impedance error"""
+        values = self._get_derived("resistivity_phase", self._compute_resistivity_phase)
+        if values is not None:
+            return values["apparent_resistivity_error"]
+
+    @property
+    def phase(self) -> xr.DataArray | None:
+        """Impedance phase in degrees, None if there is no impedance"""
+        values = self._get_derived("resistivity_phase", self._compute_resistivity_phase)
+        if values is not None:
+            return values["phase"]
+
+    @property
+    def phase_error(self) -> xr.DataArray | None:
+        """Impedance phase error in degrees propagated from impedance error"""
+        values = self._get_derived("resistivity_phase", self._compute_resistivity_phase)
+        if values is not None:
+            return values["phase_error"]
 
+    @property
+    def phase_tensor(self) -> xr.Dataset | None:
         """
-        self._compute_impedance_error_from_covariance()
-        self._compute_tipper_error_from_covariance()
+        Phase tensor and its invariants, None if there is no impedance.
+
+        Variables are phase_tensor and phase_tensor_error with the
+        coordinates of the impedance, and phimin, phimax, alpha, skew,
+        strike and ellipticity by period, all angles in degrees.  alpha,
+        skew and strike have errors as ``<name>_error``.  See
+        :func:`mt_metadata.transfer_functions.derived.phase_tensor_invariants`.
+        """
+        return self._get_derived("phase_tensor", self._compute_phase_tensor)
+
+    @property
+    def tipper_magnitude(self) -> xr.Dataset | None:
+        """
+        Magnitude and angle of the real and imaginary induction vectors by
+        period with their errors, None if there is no tipper.  See
+        :func:`mt_metadata.transfer_functions.derived.tipper_magnitude`.
+        """
+        return self._get_derived("tipper_magnitude", self._compute_tipper_magnitude)
 
     @property
     def period(self) -> np.ndarray | None:
@@ -1570,6 +1881,7 @@ class TF:
                 raise TFError(msg)
             elif not (self.period == value).all():
                 self.dataset["period"] = value
+                self._derived_cache = {}
         else:
             self._transfer_function = self._initialize_transfer_function(periods=value)
         return
@@ -1885,7 +2197,7 @@ class TF:
         fn: str | Path | None = None,
         save_dir: str | Path | None = None,
         fn_basename: str | None = None,
-        file_type: Literal["edi", "xml", "zmm", "avg", "j"] = "edi",
+        file_type: Literal["edi", "xml", "zmm", "avg", "j", "nc", "zarr"] = "edi",
         **kwargs,
     ):
         """
@@ -1901,7 +2213,7 @@ class TF:
             Full path save directory.
         fn_basename: str | None
             Name of file with or without extension.
-        file_type: Literal["edi", "xml", "zmm", "avg", "j"]
+        file_type: Literal["edi", "xml", "zmm", "avg", "j", "nc", "zarr"]
             Type of file to write.
 
         Optional Keyword Arguments
@@ -1947,7 +2259,9 @@ class TF:
             raise TFError(msg)
         fn = self.save_dir.joinpath(fn_basename)
 
-        if not isinstance(self._rotation_angle, (float, int)):
+        if self._rotation_angle is None:
+            self._rotation_angle = 0.0
+        elif not isinstance(self._rotation_angle, (float, int)):
             if self._rotation_angle.size != self.period.size:
                 self._rotation_angle = np.repeat(
                     self._rotation_angle.mean(), self.period.size
@@ -1970,6 +2284,9 @@ class TF:
         fn: str | Path | None = None,
         file_type: str | None = None,
         get_elevation: bool = False,
+        metadata_only: bool = False,
+        lazy: bool = False,
+        cache: bool | TFCache = False,
         **kwargs,
     ):
         """
@@ -1988,6 +2305,18 @@ class TF:
             the extension. Options are [edi | j | xml | avg | zmm | zrr | zss | ...]
         get_elevation: bool
             Whether to get elevation from US National Map DEM
+        metadata_only: bool
+            Only read the station and survey metadata and the periods, the
+            data blocks are not parsed and the dataset is not filled.  See
+            :meth:`peek` for a summary of the file.
+        lazy: bool
+            Only read the metadata now and read the data the first time the
+            dataset, or any property derived from it like ``impedance``,
+            ``tipper`` or ``period``, is accessed.
+        cache: bool | TFCache
+            Load the parsed file from a binary cache if it was read before,
+            otherwise parse it and store it in the cache.  True uses the
+            default :class:`~mt_metadata.transfer_functions.cache.TFCache`.
 
         :Example: ::
 
@@ -2004,14 +2333,100 @@ class TF:
         self.save_dir = self.fn.parent
         if file_type is None:
             file_type = self.fn.suffix.lower()[1:]
+        self._metadata_period = None
+        self._lazy_read_kwargs = None
+        if lazy and not metadata_only:
+            metadata_only = True
+            self._lazy_read_kwargs = dict(
+                fn=self.fn,
+                file_type=file_type,
+                get_elevation=get_elevation,
+                cache=cache,
+                **kwargs,
+            )
+
+        cache_key = None
+        if cache and not metadata_only:
+            if not isinstance(cache, TFCache):
+                cache = TFCache()
+            cache_key = cache.get_key(
+                self.fn,
+                file_type=file_type,
+                get_elevation=get_elevation,
+                channel_nomenclature=self.channel_nomenclature,
+                **kwargs,
+            )
+            if cache.load(cache_key, self):
+                return
+
         self._read_write_dict[file_type]["read"](
-            self.fn, get_elevation=get_elevation, **kwargs
+            self.fn, get_elevation=get_elevation, metadata_only=metadata_only, **kwargs
         )
 
         self.station_metadata.update_time_period()
         self.survey_metadata.update_bounding_box()
         self.survey_metadata.update_time_period()
 
+        if cache_key is not None:
+            cache.save(cache_key, self)
+
+    def peek(
+        self,
+        fn: str | Path | None = None,
+        file_type: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Read only the metadata of a transfer function file and summarize it.
+
+        The data blocks are not parsed and the dataset is not filled, which
+        makes this much faster than :meth:`read` when building a catalog of
+        many files.
+
+        Parameters
+        ----------
+        fn: str | Path | None
+            Full path to input file.
+        file_type: str | None
+            Type of file to read. If None, automatically detects file type by
+            the extension.
+        kwargs: dict
+            Keyword arguments passed on to :meth:`read`
+
+        Returns
+        -------
+        dict
+            Station id, location, period range, recorded channels and time
+            period of the file.
+
+        :Example: ::
+
+            >>> from mt_metadata import TF_EDI_CGG
+            >>> from mt_metadata.transfer_functions import TF
+            >>> TF().peek(TF_EDI_CGG)["period_max"]
+
+        """
+        self.read(fn=fn, file_type=file_type, metadata_only=True, **kwargs)
+
+        period = self._metadata_period
+        if period is None:
+            period = np.array([])
+        period = np.asarray(period, dtype=float)
+        station = self.station_metadata
+        return {
+            "fn": self.fn,
+            "id": station.id,
+            "latitude": station.location.latitude,
+            "longitude": station.location.longitude,
+            "elevation": station.location.elevation,
+            "n_periods": int(period.size),
+            "period_min": float(period.min()) if period.size else None,
+            "period_max": float(period.max()) if period.size else None,
+            "channels_recorded": list(station.channels_recorded),
+            "start": station.time_period.start.isoformat(),
+            "end": station.time_period.end.isoformat(),
+        }
+
     def to_edi(self) -> EDI:
         """
 
@@ -2075,7 +2490,11 @@ class TF:
         return edi_obj
 
     def from_edi(
-        self, edi_obj: str | Path | EDI, get_elevation: bool = False, **kwargs
+        self,
+        edi_obj: str | Path | EDI,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
         Read in an EDI file or a
@@ -2091,6 +2510,8 @@ class TF:
         get_elevation: bool
            Try to get elevation from US National Map,
            defaults to False
+        metadata_only: bool
+           Only read the metadata and frequencies, defaults to False
 
         Raises
         ------
@@ -2102,9 +2523,15 @@ class TF:
         if isinstance(edi_obj, (str, Path)):
             self._fn = Path(edi_obj)
             edi_obj = EDI(**kwargs)
-            edi_obj.read(self._fn, get_elevation=get_elevation)
+            edi_obj.read(
+                self._fn, get_elevation=get_elevation, metadata_only=metadata_only
+            )
         if not isinstance(edi_obj, EDI):
             raise TypeError(f"Input must be a EDI object not {type(edi_obj)}")
+        if metadata_only:
+            self.survey_metadata = edi_obj.survey_metadata
+            self._metadata_period = edi_obj.period
+            return
         if edi_obj.tf is not None and edi_obj.tf.shape[1:] == (3, 2):
             k_dict = OrderedDict(
                 {
@@ -2207,7 +2634,11 @@ class TF:
         return emtf
 
     def from_emtfxml(
-        self, emtfxml_obj: str | Path | EMTFXML, get_elevation: bool = False, **kwargs
+        self,
+        emtfxml_obj: str | Path | EMTFXML,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
 
@@ -2217,6 +2648,8 @@ class TF:
             The input object to convert from.
         get_elevation: bool
             Try to get elevation from US National Map, defaults to True.
+        metadata_only: bool
+            Only read the metadata and periods, defaults to False.
 
         Returns
         -------
@@ -2227,11 +2660,16 @@ class TF:
         if isinstance(emtfxml_obj, (str, Path)):
             self._fn = Path(emtfxml_obj)
             emtfxml_obj = EMTFXML(**kwargs)
-            emtfxml_obj.read(self._fn, get_elevation=get_elevation)
+            emtfxml_obj.read(
+                self._fn, get_elevation=get_elevation, metadata_only=metadata_only
+            )
         if not isinstance(emtfxml_obj, EMTFXML):
             raise TypeError(f"Input must be a EMTFXML object not {type(emtfxml_obj)}")
         self.survey_metadata = emtfxml_obj.survey_metadata
         self.station_metadata = self.survey_metadata.stations[0]
+        if metadata_only:
+            self._metadata_period = emtfxml_obj.data.period
+            return
 
         self.period = emtfxml_obj.data.period
         self.impedance = emtfxml_obj.data.z
@@ -2270,7 +2708,11 @@ class TF:
         raise NotImplementedError("to_jfile not implemented yet.")
 
     def from_jfile(
-        self, j_obj: str | Path | JFile, get_elevation: bool = False, **kwargs
+        self,
+        j_obj: str | Path | JFile,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
 
@@ -2280,6 +2722,10 @@ class TF:
             The input object to convert from.
         get_elevation: bool
             Try to get elevation from US National Map, defaults to True.
+        metadata_only: bool
+            Only set the metadata and periods, defaults to False.  The data
+            of a j-file are still read because the recorded channels are
+            found from them.
 
         Returns
         -------
@@ -2292,6 +2738,10 @@ class TF:
             j_obj.read(self._fn, get_elevation=get_elevation)
         if not isinstance(j_obj, JFile):
             raise TypeError(f"Input must be a JFile object not {type(j_obj)}")
+        if metadata_only:
+            self.survey_metadata = j_obj.survey_metadata
+            self._metadata_period = j_obj.periods
+            return
         k_dict = OrderedDict(
             {
                 "period": "periods",
@@ -2407,7 +2857,11 @@ class TF:
         return zmm_obj
 
     def from_zmm(
-        self, zmm_obj: str | Path | ZMM, get_elevation: bool = False, **kwargs
+        self,
+        zmm_obj: str | Path | ZMM,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
 
@@ -2417,6 +2871,9 @@ class TF:
             Path to .zmm file or ZMM object
         get_elevation: bool
             Try to get elevation from US National Map, defaults to True
+        metadata_only: bool
+            Only read the header and the period and decimation information,
+            defaults to False
         kwargs: dict
             Keyword arguments for ZMM object
             Can include channel_nomenclature, inverse_channel_nomenclature
@@ -2439,10 +2896,16 @@ class TF:
                     "rotate_to_measurement_coordinates", True
                 ),
                 use_declination=kwargs.get("use_declination", False),
+                metadata_only=metadata_only,
             )
         if not isinstance(zmm_obj, ZMM):
             raise TypeError(f"Input must be a ZMM object not {type(zmm_obj)}")
         self.decimation_dict = zmm_obj.decimation_dict
+        if metadata_only:
+            self.survey_metadata = zmm_obj.survey_metadata
+            self.station_metadata = zmm_obj.station_metadata
+            self._metadata_period = zmm_obj.periods
+            return
         k_dict = OrderedDict(
             {
                 "survey_metadata": "survey_metadata",
@@ -2502,7 +2965,11 @@ class TF:
         return self.to_zmm()
 
     def from_zrr(
-        self, zrr_obj: str | Path | ZMM, get_elevation: bool = False, **kwargs
+        self,
+        zrr_obj: str | Path | ZMM,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
         Parameters
@@ -2516,7 +2983,12 @@ class TF:
 
         """
 
-        self.from_zmm(zrr_obj, get_elevation=get_elevation, **kwargs)
+        self.from_zmm(
+            zrr_obj,
+            get_elevation=get_elevation,
+            metadata_only=metadata_only,
+            **kwargs,
+        )
 
     def to_zss(self) -> ZMM:
         """
@@ -2538,7 +3010,11 @@ class TF:
         return self.to_zmm()
 
     def from_zss(
-        self, zss_obj: str | Path | ZMM, get_elevation: bool = False, **kwargs
+        self,
+        zss_obj: str | Path | ZMM,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
         Parameters
@@ -2550,7 +3026,12 @@ class TF:
 
         """
 
-        self.from_zmm(zss_obj, get_elevation=get_elevation, **kwargs)
+        self.from_zmm(
+            zss_obj,
+            get_elevation=get_elevation,
+            metadata_only=metadata_only,
+            **kwargs,
+        )
 
     def to_avg(self) -> ZongeMTAvg:
         """
@@ -2576,7 +3057,11 @@ class TF:
         return avg_obj
 
     def from_avg(
-        self, avg_obj: str | Path | ZongeMTAvg, get_elevation: bool = False, **kwargs
+        self,
+        avg_obj: str | Path | ZongeMTAvg,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
     ) -> None:
         """
 
@@ -2586,15 +3071,22 @@ class TF:
             Path to .avg file or ZongeMTAvg object
         get_elevation: bool
             Try to get elevation from US National Map,   defaults to True
+        metadata_only: bool
+            Only read the header, components and frequencies, defaults to False
 
         """
         if isinstance(avg_obj, (str, Path)):
             self._fn = Path(avg_obj)
             avg_obj = ZongeMTAvg(**kwargs)
-            avg_obj.read(self._fn, get_elevation=get_elevation)
+            avg_obj.read(
+                self._fn, get_elevation=get_elevation, metadata_only=metadata_only
+            )
         if not isinstance(avg_obj, ZongeMTAvg):
             raise TypeError(f"Input must be a ZMM object not {type(avg_obj)}")
         self.survey_metadata = avg_obj.survey_metadata
+        if metadata_only:
+            self._metadata_period = 1.0 / avg_obj.frequency
+            return
 
         self.period = 1.0 / avg_obj.frequency
         self.impedance = avg_obj.z
@@ -2604,6 +3096,73 @@ class TF:
             self.tipper = avg_obj.t
             self.tipper_error = avg_obj.t_err
 
+    def to_netcdf(self) -> TFNetCDF:
+        """
+        Make a netCDF/zarr archive object of the transfer function.
+
+        The whole dataset and all metadata are kept, so reading the file
+        back gives the same transfer function.
+
+        Returns
+        -------
+        TFNetCDF
+            Archive object, the file type is set by the extension given to
+            its ``write`` method, ``.nc`` or ``.zarr``.
+
+        """
+        return TFNetCDF(
+            dataset=self._transfer_function,
+            survey_metadata=self._survey_metadata,
+            channel_nomenclature=self.channel_nomenclature,
+            rotation_angle=self._rotation_angle,
+        )
+
+    def from_netcdf(
+        self,
+        nc_obj: str | Path | TFNetCDF,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+        load: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Read a netCDF/zarr archive written by :meth:`to_netcdf`.
+
+        Parameters
+        ----------
+        nc_obj: str | Path | TFNetCDF
+            Path to a .nc or .zarr file or a TFNetCDF object
+        get_elevation: bool
+            Not used, the elevation is stored in the archive
+        metadata_only: bool
+            Only read the metadata and periods, defaults to False
+        load: bool
+            Read all the data into memory and close the file, by default the
+            data are read when first used
+
+        Raises
+        ------
+        TypeError
+            If input is incorrect
+
+        """
+        if isinstance(nc_obj, (str, Path)):
+            self._fn = Path(nc_obj)
+            nc_obj = TFNetCDF(**kwargs)
+            nc_obj.read(self._fn, metadata_only=metadata_only, load=load)
+        if not isinstance(nc_obj, TFNetCDF):
+            raise TypeError(f"Input must be a TFNetCDF object not {type(nc_obj)}")
+        if nc_obj.survey_metadata is None:
+            return
+
+        self.channel_nomenclature = nc_obj.channel_nomenclature
+        self._survey_metadata = nc_obj.survey_metadata
+        self._rotation_angle = nc_obj.rotation_angle
+        if metadata_only:
+            self._metadata_period = nc_obj.period
+            return
+        self._transfer_function = nc_obj.dataset
+
 
 # ==============================================================================
 #             Error
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.derived
+   :synopsis: Quantities derived from impedance and tipper
+
+Vectorized over any number of leading axes, so the same functions work on
+one station (n_periods, 2, 2) or a stack of stations
+(n_stations, n_periods, 2, 2).
+
+Impedance is expected in [mV/km]/[nT] and errors are standard deviations.
+The error of a complex value applies to both its real and imaginary parts.
+Errors are propagated to first order assuming independent errors.
+
+References
+----------
+Caldwell, T. G., Bibby, H. M., & Brown, C. (2004). The magnetotelluric
+phase tensor. Geophysical Journal International, 158(2), 457-469.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import numpy as np
+
+# =============================================================================
+
+
+def apparent_resistivity(
+    period: np.ndarray, z: np.ndarray, z_err: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Apparent resistivity in Ohm-m.
+
+    :param period: periods in seconds, broadcast against ``z.shape[:-2]``
+    :type period: np.ndarray
+    :param z: impedance, shape (..., 2, 2)
+    :type z: np.ndarray
+    :param z_err: impedance error, defaults to None
+    :type z_err: np.ndarray | None
+    :return: apparent resistivity and its error (None without z_err)
+    :rtype: tuple[np.ndarray, np.ndarray | None]
+
+    """
+    period = np.asarray(period, dtype=float)[..., np.newaxis, np.newaxis]
+    z_abs = np.abs(z)
+    resistivity = 0.2 * period * z_abs**2
+    if z_err is None:
+        return resistivity, None
+    return resistivity, 0.4 * period * z_abs * z_err
+
+
+def phase(
+    z: np.ndarray, z_err: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Impedance phase in degrees.
+
+    :param z: impedance, shape (..., 2, 2)
+    :type z: np.ndarray
+    :param z_err: impedance error, defaults to None
+    :type z_err: np.ndarray | None
+    :return: phase and its error (None without z_err), the error is 90
+     degrees where the error is larger than the impedance
+    :rtype: tuple[np.ndarray, np.ndarray | None]
+
+    """
+    z_phase = np.degrees(np.arctan2(z.imag, z.real))
+    if z_err is None:
+        return z_phase, None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_error = np.clip(z_err / np.abs(z), 0, 1)
+    return z_phase, np.degrees(np.arcsin(np.nan_to_num(relative_error, nan=1.0)))
+
+
+def phase_tensor(
+    z: np.ndarray, z_err: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Phase tensor Phi = X^-1 Y of an impedance Z = X + iY.
+
+    :param z: impedance, shape (..., 2, 2)
+    :type z: np.ndarray
+    :param z_err: impedance error, defaults to None
+    :type z_err: np.ndarray | None
+    :return: phase tensor and its error (None without z_err), NaN where
+     the real part of the impedance is singular
+    :rtype: tuple[np.ndarray, np.ndarray | None]
+
+    """
+    x = z.real
+    y = z.imag
+    det = x[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * x[..., 1, 0]
+    x_inv = np.empty_like(x)
+    x_inv[..., 0, 0] = x[..., 1, 1]
+    x_inv[..., 0, 1] = -x[..., 0, 1]
+    x_inv[..., 1, 0] = -x[..., 1, 0]
+    x_inv[..., 1, 1] = x[..., 0, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_inv /= det[..., np.newaxis, np.newaxis]
+    pt = np.matmul(x_inv, y)
+    if z_err is None:
+        return pt, None
+
+    # dPhi = X^-1 (dY - dX Phi)
+    variance = z_err**2
+    x_inv_2 = x_inv**2
+    pt_variance = np.einsum("...ik,...kj->...ij", x_inv_2, variance) + np.einsum(
+        "...ik,...kl,...lj->...ij", x_inv_2, variance, pt**2
+    )
+    return pt, np.sqrt(pt_variance)
+
+
+def _half_angle(
+    numerator: np.ndarray,
+    denominator: np.ndarray,
+    numerator_variance: np.ndarray | None = None,
+    denominator_variance: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    0.5 * arctan2(numerator, denominator) in degrees and its error.
+    """
+    angle = np.degrees(0.5 * np.arctan2(numerator, denominator))
+    if numerator_variance is None or denominator_variance is None:
+        return angle, None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error = (
+            0.5
+            * np.sqrt(
+                denominator**2 * numerator_variance
+                + numerator**2 * denominator_variance
+            )
+            / (numerator**2 + denominator**2)
+        )
+    return angle, np.degrees(error)
+
+
+def phase_tensor_invariants(
+    pt: np.ndarray, pt_err: np.ndarray | None = None
+) -> dict[str, np.ndarray | None]:
+    """
+    Rotational invariants of the phase tensor, all in degrees.
+
+    - phimin, phimax: principal values as angles, arctan of the minimum
+      and maximum of the phase tensor
+    - alpha: angle of the phase tensor relative to the coordinate system
+    - skew: skew angle, beta in Caldwell et al. (2004)
+    - strike: azimuth of the major axis, alpha - skew
+    - ellipticity: (phimax - phimin) / (phimax + phimin), no units
+
+    :param pt: phase tensor, shape (..., 2, 2)
+    :type pt: np.ndarray
+    :param pt_err: phase tensor error, defaults to None
+    :type pt_err: np.ndarray | None
+    :return: invariants and the errors of alpha, skew and strike keyed as
+     ``<name>_error``, the errors are None without pt_err
+    :rtype: dict[str, np.ndarray | None]
+
+    """
+    phi_1 = (pt[..., 0, 0] + pt[..., 1, 1]) / 2
+    phi_2 = np.sqrt(
+        np.abs(pt[..., 0, 0] * pt[..., 1, 1] - pt[..., 0, 1] * pt[..., 1, 0])
+    )
+    phi_3 = (pt[..., 0, 1] - pt[..., 1, 0]) / 2
+    radius = np.sqrt(phi_1**2 + phi_3**2)
+    spread = np.sqrt(np.abs(radius**2 - phi_2**2))
+    phimax = np.degrees(np.arctan(radius + spread))
+    phimin = np.degrees(np.arctan(radius - spread))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ellipticity = (phimax - phimin) / (phimax + phimin)
+
+    diagonal_variance = None
+    off_diagonal_variance = None
+    if pt_err is not None:
+        diagonal_variance = pt_err[..., 0, 0] ** 2 + pt_err[..., 1, 1] ** 2
+        off_diagonal_variance = pt_err[..., 0, 1] ** 2 + pt_err[..., 1, 0] ** 2
+
+    alpha, alpha_error = _half_angle(
+        pt[..., 0, 1] + pt[..., 1, 0],
+        pt[..., 0, 0] - pt[..., 1, 1],
+        off_diagonal_variance,
+        diagonal_variance,
+    )
+    skew, skew_error = _half_angle(
+        pt[..., 0, 1] - pt[..., 1, 0],
+        pt[..., 0, 0] + pt[..., 1, 1],
+        off_diagonal_variance,
+        diagonal_variance,
+    )
+    strike_error = None
+    if pt_err is not None:
+        strike_error = np.sqrt(alpha_error**2 + skew_error**2)
+
+    return {
+        "phimin": phimin,
+        "phimax": phimax,
+        "alpha": alpha,
+        "skew": skew,
+        "strike": alpha - skew,
+        "ellipticity": ellipticity,
+        "alpha_error": alpha_error,
+        "skew_error": skew_error,
+        "strike_error": strike_error,
+    }
+
+
+def tipper_magnitude(
+    t: np.ndarray, t_err: np.ndarray | None = None
+) -> dict[str, np.ndarray | None]:
+    """
+    Magnitude and angle of the real and imaginary induction vectors.
+
+    Angles are in degrees clockwise from north (x).
+
+    :param t: tipper, shape (..., 1, 2)
+    :type t: np.ndarray
+    :param t_err: tipper error, defaults to None
+    :type t_err: np.ndarray | None
+    :return: magnitude_real, magnitude_imag, angle_real and angle_imag and
+     their errors keyed as ``<name>_error``, the errors are None without
+     t_err
+    :rtype: dict[str, np.ndarray | None]
+
+    """
+    quantities = {}
+    for part in ["real", "imag"]:
+        t_x = getattr(t[..., 0, 0], part)
+        t_y = getattr(t[..., 0, 1], part)
+        magnitude = np.hypot(t_x, t_y)
+        quantities[f"magnitude_{part}"] = magnitude
+        quantities[f"angle_{part}"] = np.degrees(np.arctan2(t_y, t_x))
+        if t_err is None:
+            quantities[f"magnitude_{part}_error"] = None
+            quantities[f"angle_{part}_error"] = None
+            continue
+        x_err = t_err[..., 0, 0]
+        y_err = t_err[..., 0, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quantities[f"magnitude_{part}_error"] = (
+                np.hypot(t_x * x_err, t_y * y_err) / magnitude
+            )
+            quantities[f"angle_{part}_error"] = np.degrees(
+                np.hypot(t_y * x_err, t_x * y_err) / magnitude**2
+            )
+    return quantities
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.interpolation
+   :synopsis: Interpolate stacks of transfer function tensors to new periods
+
+Interpolation is done in log-period space between the two neighbouring
+periods, so each new value is a weighted sum
+
+    T(p) = (1 - w) T(p_0) + w T(p_1)
+
+of whole tensors.  Errors of independent values are propagated with the
+squared weights
+
+    var(T(p)) = (1 - w)^2 var(T(p_0)) + w^2 var(T(p_1))
+
+Covariances (residual covariance, inverse signal power) are interpolated as
+values, a weighted mean of covariance matrices is a covariance matrix.
+New periods outside of the range of the periods are NaN, there is no
+extrapolation.
+
+Period is the third to last axis, so impedance (..., n_periods, 2, 2),
+tipper (..., n_periods, 1, 2) and a TF dataset variable
+(n_periods, 5, 5) are all interpolated the same way, as is a stack of
+stations (n_stations, n_periods, 2, 2).
+
+:Example: ::
+
+    >>> periods = np.logspace(-3, 3, 50)  # periods of every station
+    >>> z = np.random.rand(100, 50, 2, 2)  # 100 stations
+    >>> new_periods = np.logspace(-2, 2, 20)
+    >>> z_new = interpolate_tensors(z, periods, new_periods)
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import numpy as np
+
+# =============================================================================
+
+INTERPOLATION_METHODS = ["linear", "nearest"]
+
+
+def _period_index(index: np.ndarray, ndim: int) -> np.ndarray:
+    """
+    Reshape an index over periods (..., n) to index the period axis of
+    tensors with ndim dimensions.
+    """
+    index = index[..., np.newaxis, np.newaxis]
+    return index.reshape((1,) * (ndim - index.ndim) + index.shape)
+
+
+def interpolation_weights(
+    periods: np.ndarray, new_periods: np.ndarray, method: str = "linear"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Neighbouring indices and weights to interpolate to new periods.
+
+    :param periods: increasing periods in seconds, shape (..., n_periods)
+    :type periods: np.ndarray
+    :param new_periods: new periods in seconds, shape (n_new,)
+    :type new_periods: np.ndarray
+    :param method: [ "linear" | "nearest" ] in log-period, defaults to
+     "linear"
+    :type method: str
+    :return: index of the lower and upper neighbour and the weight of the
+     upper neighbour, each of shape (..., n_new), the weight is NaN outside
+     of the range of periods
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+
+    """
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(
+            f"Interpolation method {method} not supported, must be one of "
+            f"{INTERPOLATION_METHODS}"
+        )
+    log_periods = np.log10(np.asarray(periods, dtype=float))
+    log_new = np.log10(np.asarray(new_periods, dtype=float))
+    n_periods = log_periods.shape[-1]
+    if n_periods < 2:
+        raise ValueError("Need at least 2 periods to interpolate")
+
+    # number of periods less or equal to each new period
+    count = np.sum(log_periods[..., np.newaxis, :] <= log_new[:, np.newaxis], axis=-1)
+    lower = np.clip(count - 1, 0, n_periods - 2)
+    upper = lower + 1
+
+    log_periods = np.broadcast_to(log_periods, lower.shape[:-1] + (n_periods,))
+    log_lower = np.take_along_axis(log_periods, lower, axis=-1)
+    log_upper = np.take_along_axis(log_periods, upper, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (log_new - log_lower) / (log_upper - log_lower)
+    weight[(weight < 0) | (weight > 1)] = np.nan
+    if method == "nearest":
+        weight = np.where(np.isnan(weight), weight, (weight >= 0.5).astype(float))
+    return lower, upper, weight
+
+
+def interpolate_tensors(
+    tensors: np.ndarray,
+    periods: np.ndarray,
+    new_periods: np.ndarray,
+    method: str = "linear",
+    variance: bool = False,
+) -> np.ndarray:
+    """
+    Interpolate a stack of tensors, for example the impedance of many
+    stations, to new periods in one call.
+
+    :param tensors: tensors of shape ``(..., n_periods, n_outputs, n_inputs)``
+    :type tensors: np.ndarray
+    :param periods: periods in seconds, shape (n_periods,) shared by all
+     tensors or one row per station that broadcasts against
+     ``tensors.shape[:-2]``
+    :type periods: np.ndarray
+    :param new_periods: new periods in seconds, shape (n_new,)
+    :type new_periods: np.ndarray
+    :param method: [ "linear" | "nearest" ] in log-period, defaults to
+     "linear"
+    :type method: str
+    :param variance: the tensors are variances of independent errors,
+     interpolate them with the squared weights, defaults to False
+    :type variance: bool
+    :return: interpolated tensors of shape ``(..., n_new, n_outputs, n_inputs)``
+    :rtype: np.ndarray
+
+    """
+    tensors = np.asarray(tensors)
+    periods = np.asarray(periods, dtype=float)
+    order = np.argsort(periods, axis=-1)
+    periods = np.take_along_axis(periods, order, axis=-1)
+    tensors = np.take_along_axis(tensors, _period_index(order, tensors.ndim), axis=-3)
+
+    lower, upper, weight = interpolation_weights(periods, new_periods, method)
+    lower_values = np.take_along_axis(
+        tensors, _period_index(lower, tensors.ndim), axis=-3
+    )
+    upper_values = np.take_along_axis(
+        tensors, _period_index(upper, tensors.ndim), axis=-3
+    )
+    weight = _period_index(weight, tensors.ndim)
+    if variance:
+        values = (1 - weight) ** 2 * lower_values + weight**2 * upper_values
+    else:
+        values = (1 - weight) * lower_values + weight * upper_values
+    # a neighbour with no weight should not bring in its NaNs
+    return np.where(
+        weight == 0, lower_values, np.where(weight == 1, upper_values, values)
+    )
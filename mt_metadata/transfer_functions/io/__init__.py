@@ -1,11 +1,30 @@
 # package file
 
-from .edi import EDI
-from .emtfxml import EMTFXML
-from .jfiles import JFile
-from .zfiles import ZMM
+# Readers are imported on first access (PEP 562)
+import importlib
 
-from .zonge import ZongeMTAvg
+_LAZY_IMPORTS = {
+    "EDI": ".edi",
+    "EMTFXML": ".emtfxml",
+    "JFile": ".jfiles",
+    "ZMM": ".zfiles",
+    "ZongeMTAvg": ".zonge",
+    "TFNetCDF": ".netcdf",
+}
 
 
-__all__ = ["EDI", "EMTFXML", "JFile", "ZMM", "ZongeMTAvg"]
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = ["EDI", "EMTFXML", "JFile", "ZMM", "ZongeMTAvg", "TFNetCDF"]
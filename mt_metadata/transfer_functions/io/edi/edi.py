@@ -33,6 +33,7 @@ from mt_metadata.transfer_functions.io.edi.metadata import (
 from mt_metadata.transfer_functions.io.tools import (
     _validate_edi_lines,
     _validate_str_with_equals,
+    errors_from_covariance,
     get_nm_elev,
     index_locator,
 )
@@ -266,7 +267,12 @@ class EDI:
                 if self.t_err is not None:
                     self.t_err = self.t_err[::-1]
 
-    def read(self, fn: str | Path | None = None, get_elevation: bool = False) -> None:
+    def read(
+        self,
+        fn: str | Path | None = None,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+    ) -> None:
         """
         Read in an edi file and fill attributes of each section's classes.
         Including:
@@ -285,6 +291,9 @@ class EDI:
         :param fn: full path to .edi file to be read in
                        *default* is None
         :type fn: string
+        :param metadata_only: only read the header sections and the
+         frequencies, z and t are not read, defaults to False
+        :type metadata_only: bool
 
         :Example: ::
 
@@ -313,7 +322,10 @@ class EDI:
         self.Data.read_data(self._edi_lines)
         self.Data.match_channels(self.Measurement.channel_ids)
 
-        self._read_data()
+        if metadata_only:
+            self._read_frequency()
+        else:
+            self._read_data()
 
         if self.Header.latitude in [None, 0.0]:
             self.Header.latitude = self.Measurement.reflat
@@ -354,6 +366,51 @@ class EDI:
         elif self.Data._data_type_in == "z":
             self._read_mt(lines)
 
+    def _read_frequency(self) -> None:
+        """
+        Read only the frequencies from the data section, either the >FREQ
+        block or the FREQ of each >SPECTRA block.
+        """
+
+        lines = self._edi_lines[self.Data._line_num :]
+        if self.Data._data_type_in == "spectra":
+            frequency = []
+            for line in lines:
+                if line.lower().find(">spectra") == 0 and line.find("!") == -1:
+                    try:
+                        frequency.append(
+                            float(
+                                [
+                                    ss.split("=")[1]
+                                    for ss in _validate_str_with_equals(line)
+                                    if ss.lower().find("freq") == 0
+                                ][0]
+                            )
+                        )
+                    except (IndexError, ValueError):
+                        self.logger.debug("did not find frequency key")
+            self.frequency = np.array(sorted(frequency, reverse=True))
+            return
+
+        block = None
+        for line in lines:
+            line = line.strip()
+            if ">" in line and "!" not in line:
+                if block is not None:
+                    break
+                line_list = line[1:].strip().split()
+                if len(line_list) > 0 and line_list[0].lower() == "freq":
+                    block = []
+            elif block is not None and "!" not in line:
+                block.append(line)
+        if block is None:
+            self.frequency = None
+            return
+        frequency = self._block_to_array(block)
+        if frequency.size > 1 and frequency[0] < frequency[1]:
+            frequency = frequency[::-1]
+        self.frequency = frequency
+
     def _read_mt(self, data_lines: list[str]) -> None:
         """
         Read in impedance and tipper data
@@ -362,8 +419,10 @@ class EDI:
         :type data_lines: list
         """
 
-        data_dict = {}
-        data_find = False
+        # collect the body lines of each accepted >KEY block, numbers are
+        # converted once per block
+        blocks = {}
+        block = None
         for line in data_lines:
             line = line.strip()
             if ">" in line and "!" not in line:
@@ -372,26 +431,12 @@ class EDI:
                     continue
                 key = line_list[0].lower()
                 if key in self._accepted_keys:
-                    data_find = True
-                    data_dict[key] = []
+                    block = blocks[key] = []
                 else:
-                    data_find = False
-            elif data_find and ">" not in line and "!" not in line:
-                d_lines = line.strip().split()
-                for ii, dd in enumerate(d_lines):
-                    # check for empty values and set them to 0, check for any
-                    # other characters sometimes there are ****** for a null
-                    # component
-                    try:
-                        d_lines[ii] = float(dd)
-                        if d_lines[ii] == self.Header.empty:
-                            d_lines[ii] = 0.0
-                    except ValueError:
-                        d_lines[ii] = 0.0
-                data_dict[key] += d_lines
-        # put everything into arrays
-        for key, k_list in data_dict.items():
-            data_dict[key] = np.array(k_list)
+                    block = None
+            elif block is not None and ">" not in line and "!" not in line:
+                block.append(line)
+        data_dict = {key: self._block_to_array(block) for key, block in blocks.items()}
         # fill useful arrays
         self.frequency = data_dict["freq"]
         self.z = np.zeros((self.frequency.size, 2, 2), dtype=complex)
@@ -459,6 +504,32 @@ class EDI:
             except KeyError:
                 self.rotation_angle = np.zeros_like(self.frequency)
 
+    def _block_to_array(self, block: list[str]) -> np.ndarray:
+        """
+        Convert the body lines of a data block to a float array.
+
+        Values that are not numbers (sometimes there are ****** for a null
+        component) and values equal to `Header.empty` are set to 0.
+
+        :param block: lines of numbers separated by white space
+        :type block: list[str]
+        :return: values of the block in order
+        :rtype: np.ndarray
+
+        """
+        tokens = " ".join(block).split()
+        try:
+            values = np.array(tokens, dtype=float)
+        except ValueError:
+            values = np.zeros(len(tokens), dtype=float)
+            for ii, token in enumerate(tokens):
+                try:
+                    values[ii] = float(token)
+                except ValueError:
+                    continue
+        values[values == self.Header.empty] = 0.0
+        return values
+
     def _read_spectra(
         self,
         data_lines: list[str],
@@ -467,7 +538,8 @@ class EDI:
         """
         Read in spectra data and convert to impedance and Tipper.
 
-        Translated from A. Kelbert's EMTF fortran module
+        Translated from A. Kelbert's EMTF fortran module.  All frequencies
+        are converted at once as stacks of cross-power matrices.
 
         :param data_lines: list of lines from edi file
         :type data_lines: list
@@ -506,187 +578,118 @@ class EDI:
                 except ValueError:
                     self.logger.debug("did not find frequency key")
             elif data_find and line.find(">") == -1 and line.find("!") == -1:
-                data_dict[key] += [float(ll) for ll in line.strip().split()]
+                data_dict[key].append(line)
             elif line.find(">spectra") == -1:
                 data_find = False
         # get an object that contains the indices for each component
         cc = index_locator(comp_list)
+        n_comp = len(comp_list)
 
         self.frequency = np.array(sorted(list(data_dict.keys()), reverse=True))
+        n_freq = self.frequency.size
 
-        self.z = np.zeros((self.frequency.size, 2, 2), dtype=complex)
-        self.t = np.zeros((self.frequency.size, 1, 2), dtype=complex)
+        # read in spectra as an (n_frequency x n_channel x n_channel) array
+        spectra_arr = np.array(
+            [
+                np.array(" ".join(data_dict[key]).split(), dtype=float)
+                for key in self.frequency
+            ]
+        ).reshape((n_freq, n_comp, n_comp))
+        avgt = np.array([avgt_dict[key] for key in self.frequency])
+
+        # compute cross powers
+        # minus sign for complex conjugation original spectra data are of
+        # form <A,B*>, but we need the order <B,A*>... this is achieved by
+        # complex conjugation of the original entries.  Keep complex
+        # conjugated entries in the lower triangular matrix.
+        s_arr = np.zeros((n_freq, n_comp, n_comp), dtype=complex)
+        diagonal = np.arange(n_comp)
+        s_arr[:, diagonal, diagonal] = spectra_arr[:, diagonal, diagonal]
+        upper, lower = np.triu_indices(n_comp, k=1)
+        s_arr.real[:, upper, lower] = spectra_arr[:, lower, upper]
+        s_arr.imag[:, upper, lower] = -spectra_arr[:, upper, lower]
+        s_arr.real[:, lower, upper] = spectra_arr[:, lower, upper]
+        s_arr.imag[:, lower, upper] = spectra_arr[:, upper, lower]
+
+        # check for empty values
+        s_arr[s_arr == 0] = np.nan
+        s_arr[s_arr == self.Header.empty] = np.nan
+
+        # from A. Kelbert's EMTF
+        # cross spectra matrices
+
+        # Note we changed the indices to [ex, ey, hz] from [hz, ex, ey]
+        inputs = np.array([cc.hx, cc.hy])
+        references = np.array([cc.rhx, cc.rhy])
+        if cc.has_tipper and cc.has_electric:
+            outputs = np.array([cc.ex, cc.ey, cc.hz])
+        elif cc.has_electric:
+            outputs = np.array([cc.ex, cc.ey])
+        else:
+            outputs = np.array([cc.hz])
+
+        def cross_powers(rows, columns):
+            return s_arr[:, rows[:, np.newaxis], columns[np.newaxis, :]]
+
+        # input channels
+        rh = cross_powers(references, inputs)
+        rr = cross_powers(references, references)
+        hh = cross_powers(inputs, inputs)
+
+        # output channels
+        re = cross_powers(references, outputs)
+        he = cross_powers(inputs, outputs)
+        ee = cross_powers(outputs, outputs)
+
+        # check to make sure the values are legit for accurate results
+        det_rh = np.abs(np.linalg.det(rh))
+        for key, det in zip(
+            self.frequency[det_rh < np.finfo(float).eps],
+            det_rh[det_rh < np.finfo(float).eps],
+        ):
+            self.logger.warning(
+                "spectral matrix determinant is too small "
+                f"{det} for period {key}. "
+                "Results may be inaccurate"
+            )
 
-        self.z_err = np.zeros_like(self.z, dtype=float)
-        self.t_err = np.zeros_like(self.t, dtype=float)
+        def hermitian(arr):
+            return arr.conj().transpose(0, 2, 1)
 
-        self.residual_covariance = np.zeros(
-            (self.frequency.size, cc.n_outputs, cc.n_outputs), dtype=complex
-        )
-        self.signal_inverse_power = np.zeros(
-            (self.frequency.size, cc.n_inputs, cc.n_inputs), dtype=complex
-        )
+        rh_inv = np.linalg.inv(rh)
+        tfh = np.matmul(rh_inv, re)
+        tf = hermitian(tfh)
+
+        sig = np.matmul(rh_inv, np.matmul(rr, np.linalg.inv(hermitian(rh))))
+        res = (
+            ee
+            - np.matmul(tf, he)
+            - np.matmul(hermitian(he), tfh)
+            + np.matmul(tf, np.matmul(hh, tfh))
+        ) / avgt[:, np.newaxis, np.newaxis]
 
-        self.tf = np.zeros(
-            (self.frequency.size, cc.n_outputs, cc.n_inputs), dtype=complex
+        tf_err = errors_from_covariance(
+            np.diagonal(res, axis1=1, axis2=2), np.diagonal(sig, axis1=1, axis2=2)
         )
-        self.tf_err = np.zeros_like(self.tf, dtype=float)
 
-        for kk, key in enumerate(self.frequency):
-            # read in spectra  as an (n_channel x n_channel) array
-            spectra_arr = np.reshape(
-                np.array(data_dict[key]), (len(comp_list), len(comp_list))
-            )
+        self.tf = tf
+        self.tf_err = tf_err
+        self.signal_inverse_power = sig
+        self.residual_covariance = res
 
-            # compute cross powers
-            s_arr = np.zeros_like(spectra_arr, dtype=complex)
-            for ii in range(s_arr.shape[0]):
-                for jj in range(ii, s_arr.shape[0]):
-                    if ii == jj:
-                        s_arr[ii, jj] = spectra_arr[ii, jj]
-                    else:
-                        # minus sign for complex conjugation
-                        # original spectra data are of form <A,B*>, but we need
-                        # the order <B,A*>...
-                        # this is achieved by complex conjugation of the
-                        # original entries
-                        s_arr[ii, jj] = complex(
-                            spectra_arr[jj, ii], -spectra_arr[ii, jj]
-                        )
-                        # keep complex conjugated entries in the lower
-                        # triangular matrix:
-                        s_arr[jj, ii] = complex(
-                            spectra_arr[jj, ii], spectra_arr[ii, jj]
-                        )
-            # check for empty values
-            s_arr[s_arr == 0] = np.nan
-            s_arr[s_arr == self.Header.empty] = np.nan
-
-            # from A. Kelbert's EMTF
-            # cross spectra matrices
-
-            # Note we changed the indices to [ex, ey, hz] from [hz, ex, ey]
-            # input channels
-            rh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-            rr = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-            hh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-
-            # output channels
-            re = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
-            he = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
-            ee = np.zeros((cc.n_outputs, cc.n_outputs), dtype=complex)
-
-            # fill in cross powers for input channels
-            rh[0, 0] = s_arr[cc.rhx, cc.hx]
-            rh[0, 1] = s_arr[cc.rhx, cc.hy]
-            rh[1, 0] = s_arr[cc.rhy, cc.hx]
-            rh[1, 1] = s_arr[cc.rhy, cc.hy]
-
-            rr[0, 0] = s_arr[cc.rhx, cc.rhx]
-            rr[0, 1] = s_arr[cc.rhx, cc.rhy]
-            rr[1, 0] = s_arr[cc.rhy, cc.rhx]
-            rr[1, 1] = s_arr[cc.rhy, cc.rhy]
-
-            hh[0, 0] = s_arr[cc.hx, cc.hx]
-            hh[0, 1] = s_arr[cc.hx, cc.hy]
-            hh[1, 0] = s_arr[cc.hy, cc.hx]
-            hh[1, 1] = s_arr[cc.hy, cc.hy]
-
-            # fill in cross powers for output channels
-            if cc.has_tipper and cc.has_electric:
-                re[0, 2] = s_arr[cc.rhx, cc.hz]
-                re[0, 0] = s_arr[cc.rhx, cc.ex]
-                re[0, 1] = s_arr[cc.rhx, cc.ey]
-                re[1, 2] = s_arr[cc.rhy, cc.hz]
-                re[1, 0] = s_arr[cc.rhy, cc.ex]
-                re[1, 1] = s_arr[cc.rhy, cc.ey]
-
-                he[0, 2] = s_arr[cc.hx, cc.hz]
-                he[0, 0] = s_arr[cc.hx, cc.ex]
-                he[0, 1] = s_arr[cc.hx, cc.ey]
-                he[1, 2] = s_arr[cc.hy, cc.hz]
-                he[1, 0] = s_arr[cc.hy, cc.ex]
-                he[1, 1] = s_arr[cc.hy, cc.ey]
-
-                ee[2, 2] = s_arr[cc.hz, cc.hz]
-                ee[2, 0] = s_arr[cc.hz, cc.ex]
-                ee[2, 1] = s_arr[cc.hz, cc.ey]
-                ee[0, 2] = s_arr[cc.ex, cc.hz]
-                ee[0, 0] = s_arr[cc.ex, cc.ex]
-                ee[0, 1] = s_arr[cc.ex, cc.ey]
-                ee[1, 2] = s_arr[cc.ey, cc.hz]
-                ee[1, 0] = s_arr[cc.ey, cc.ex]
-                ee[1, 1] = s_arr[cc.ey, cc.ey]
-            elif not cc.has_tipper and cc.has_electric:
-                re[0, 0] = s_arr[cc.rhx, cc.ex]
-                re[0, 1] = s_arr[cc.rhx, cc.ey]
-                re[1, 0] = s_arr[cc.rhy, cc.ex]
-                re[1, 0] = s_arr[cc.rhy, cc.ey]
-
-                he[0, 0] = s_arr[cc.hx, cc.ex]
-                he[0, 1] = s_arr[cc.hx, cc.ey]
-                he[0, 1] = s_arr[cc.hy, cc.ex]
-                he[1, 1] = s_arr[cc.hy, cc.ey]
-
-                ee[0, 0] = s_arr[cc.ex, cc.ex]
-                ee[0, 1] = s_arr[cc.ex, cc.ey]
-                ee[1, 0] = s_arr[cc.ey, cc.ex]
-                ee[1, 1] = s_arr[cc.ey, cc.ey]
-            elif cc.has_tipper and not cc.has_electric:
-                re[0, 0] = s_arr[cc.rhx, cc.hz]
-                re[1, 0] = s_arr[cc.rhy, cc.hz]
-
-                he[0, 0] = s_arr[cc.hx, cc.hz]
-                he[1, 0] = s_arr[cc.hy, cc.hz]
-
-                ee[0, 0] = s_arr[cc.hz, cc.hz]
-            # check to make sure the values are legit for accurate results
-            if abs(np.linalg.det(rh)) < np.finfo(float).eps:
-                self.logger.warning(
-                    "spectral matrix determinant is too small "
-                    f"{abs(np.linalg.det(rh))} for period {key}. "
-                    "Results may be inaccurate"
-                )
-            tfh = np.matmul(np.linalg.inv(rh), re)
-            tf = tfh.conj().T
+        self.z = np.zeros((n_freq, 2, 2), dtype=complex)
+        self.t = np.zeros((n_freq, 1, 2), dtype=complex)
+        self.z_err = np.zeros_like(self.z, dtype=float)
+        self.t_err = np.zeros_like(self.t, dtype=float)
 
-            sig = np.matmul(
-                np.linalg.inv(rh), np.matmul(rr, np.linalg.inv(rh.conj().T))
-            )
-            res = (
-                ee
-                - np.matmul(tf, he)
-                - np.matmul(he.conj().T, tfh)
-                + np.matmul(tf, np.matmul(hh, tfh))
-            ) / avgt_dict[key]
-
-            # variance = abs(np.dot(res[0 : cc.n_inputs, :].T, sig))
-            variance = np.zeros((cc.n_outputs, cc.n_inputs), dtype=complex)
-            for nn in range(cc.n_outputs):
-                for mm in range(cc.n_inputs):
-                    variance[nn, mm] = res[nn, nn] * sig[mm, mm]
-
-            tf_err = np.sqrt(np.abs(variance))
-            self.tf[kk, :, :] = tf
-            self.tf_err[kk, :, :] = np.sqrt(np.abs(variance))
-            self.signal_inverse_power[kk, :, :] = sig
-            self.residual_covariance[kk, :, :] = res
-
-            if cc.has_tipper and cc.has_electric:
-                self.z[kk, :, :] = tf[0:2, :]
-                self.z_err[kk, :, :] = tf_err[0:2, :]
-                self.t[kk, :, :] = tf[2, :]
-                self.t_err[kk, :, :] = tf_err[2, :]
-                self.z_err[np.where(np.nan_to_num(self.z_err) == 0.0)] = 1.0
-                self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
-            elif not cc.has_tipper and cc.has_electric:
-                self.z[kk, :, :] = tf[:, :]
-                self.z_err[kk, :, :] = tf_err[:, :]
-                self.z_err[np.where(np.nan_to_num(self.z_err) == 0.0)] = 1.0
-            elif cc.has_tipper and not cc.has_electric:
-                self.t[kk, :, :] = tf[:, :]
-                self.t_err[kk, :, :] = tf_err[:, :]
-                self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
+        if cc.has_electric:
+            self.z[:, :, :] = tf[:, 0:2, :]
+            self.z_err[:, :, :] = tf_err[:, 0:2, :]
+            self.z_err[np.nan_to_num(self.z_err) == 0.0] = 1.0
+        if cc.has_tipper:
+            self.t[:, :, :] = tf[:, -1:, :]
+            self.t_err[:, :, :] = tf_err[:, -1:, :]
+            self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
 
     def write(
         self,
@@ -894,19 +897,25 @@ class EDI:
             ]
         else:
             raise ValueError("Cannot write block for {0}".format(data_key))
-        for d_index, d_comp in enumerate(data_comp_arr, 1):
-            if d_comp == 0.0 and data_key.lower() not in ["zrot", "trot"]:
-                d_comp = self.Header.empty
-            # write the string in the specified format
-            num_str = "{0:{1}}".format(d_comp, self._num_format)
-
-            # check to see if a new line is needed
-            if d_index % self._block_len == 0:
-                num_str += "\n"
-            # at the end of the block add a return
-            if d_index == data_comp_arr.size:
-                num_str += "\n"
-            block_lines.append(num_str)
+        values = np.asarray(data_comp_arr, dtype=float).ravel()
+        if data_key.lower() not in ["zrot", "trot"]:
+            values = np.where(values == 0.0, self.Header.empty, values)
+        if values.size == 0:
+            return block_lines
+
+        # format a full line of values at a time, the block ends with an
+        # extra return
+        values = values.tolist()
+        num_str = "{:%s}" % self._num_format
+        line_str = num_str * self._block_len + "\n"
+        n_full = len(values) - len(values) % self._block_len
+        block_lines += [
+            line_str.format(*values[index : index + self._block_len])
+            for index in range(0, n_full, self._block_len)
+        ]
+        block_lines.append(
+            (num_str * (len(values) - n_full)).format(*values[n_full:]) + "\n"
+        )
         return block_lines
 
     # -----------------------------------------------------------------------
@@ -994,7 +1003,7 @@ class EDI:
             key = key.lower()
             if key.startswith("survey."):
                 if "doi" in key:
-                    if "doi" not in value:
+                    if "doi" not in str(value):
                         key = key.replace("doi", "url")
                 try:
                     sm.update_attribute(key.split("survey.")[1], value)
@@ -1046,32 +1055,33 @@ class EDI:
             sm.id = self.station
         sm.data_type = "MT"
         sm.channels_recorded = self.Measurement.channels_recorded
-        # location
-        sm.location.latitude = self.lat
-        sm.location.longitude = self.lon
-        sm.location.elevation = self.elev
-        sm.location.datum = self.Header.datum
-        sm.location.declination.value = self.Header.declination.value
-        sm.orientation.reference_frame = self.Header.coordinate_system.split()[0]
-        if self.Header.loc is not None:
-            sm.geographic_name = self.Header.loc
-
-        # provenance
-        if self.Header.acqby is not None:
-            sm.acquired_by.author = self.Header.acqby
-        sm.provenance.creation_time = self.Header.filedate
-        sm.provenance.submitter.author = self.Header.fileby
-        sm.provenance.software.name = self.Header.fileby
-        sm.provenance.software.version = self.Header.progvers
-        sm.transfer_function.processed_date = self.Header.filedate
-        sm.transfer_function.runs_processed = sm.run_list
-        if self.station is not None:
-            sm.transfer_function.id = self.station
-        # dates
-        if self.Header.acqdate is not None:
-            sm.time_period.start = self.Header.acqdate
-        if self.Header.enddate is not None:
-            sm.time_period.end = self.Header.enddate
+        with sm.deferred_validation():
+            # location
+            sm.location.latitude = self.lat
+            sm.location.longitude = self.lon
+            sm.location.elevation = self.elev
+            sm.location.datum = self.Header.datum
+            sm.location.declination.value = self.Header.declination.value
+            sm.orientation.reference_frame = self.Header.coordinate_system.split()[0]
+            if self.Header.loc is not None:
+                sm.geographic_name = self.Header.loc
+
+            # provenance
+            if self.Header.acqby is not None:
+                sm.acquired_by.author = self.Header.acqby
+            sm.provenance.creation_time = self.Header.filedate
+            sm.provenance.submitter.author = self.Header.fileby
+            sm.provenance.software.name = self.Header.fileby
+            sm.provenance.software.version = self.Header.progvers
+            sm.transfer_function.processed_date = self.Header.filedate
+            sm.transfer_function.runs_processed = sm.run_list
+            if self.station is not None:
+                sm.transfer_function.id = self.station
+            # dates
+            if self.Header.acqdate is not None:
+                sm.time_period.start = self.Header.acqdate
+            if self.Header.enddate is not None:
+                sm.time_period.end = self.Header.enddate
 
         # processing information
         for key, value in self.Info.info_dict.items():
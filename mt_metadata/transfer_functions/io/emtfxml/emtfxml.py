@@ -302,12 +302,21 @@ class EMTFXML:
     def notes(self, value: str):
         self.emtf.notes = value
 
-    def read(self, fn: str | Path = None, get_elevation: bool = False) -> None:
+    def read(
+        self,
+        fn: str | Path = None,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+    ) -> None:
         """
         Read xml file
 
         :param fn: XML file path to read, if None, use self.fn
         :type fn: str | Path
+        :param metadata_only: only read the metadata and the periods of the
+         <Data> section, the data types, statistical estimates and site
+         layout are taken as written in the file, defaults to False
+        :type metadata_only: bool
         :return: None
         :rtype: None
 
@@ -328,6 +337,15 @@ class EMTFXML:
                 et.XMLParser(encoding="utf-8"),
             )
 
+        # the data section is read straight from the element tree, only the
+        # metadata goes through the dictionary conversion
+        data_element = None
+        for child in root:
+            if child.tag.lower() == "data":
+                data_element = child
+                root.remove(child)
+                break
+
         root_dict = helpers.element_to_dict(root)
         root_dict = root_dict[list(root_dict.keys())[0]]
         root_dict = emtf_helpers._convert_keys_to_lower_case(root_dict)
@@ -335,7 +353,12 @@ class EMTFXML:
 
         for element in self.element_keys:
             attr = getattr(self, element)
-            if hasattr(attr, "read_dict"):
+            if element == "data" and data_element is not None:
+                if metadata_only:
+                    attr.read_periods(data_element)
+                else:
+                    attr.read_element(data_element)
+            elif hasattr(attr, "read_dict"):
                 attr.read_dict(root_dict)
             else:
                 emtf_helpers._read_single(self, root_dict, element)
@@ -348,9 +371,10 @@ class EMTFXML:
         if self.site.run_list is None:
             self.site.run_list = []
 
-        self._get_statistical_estimates()
-        self._get_data_types()
-        self._update_site_layout()
+        if not metadata_only:
+            self._get_statistical_estimates()
+            self._get_data_types()
+            self._update_site_layout()
 
         if self.site.location.elevation == 0 and get_elevation:
             if self.site.location.latitude != 0 and self.site.location.longitude != 0:
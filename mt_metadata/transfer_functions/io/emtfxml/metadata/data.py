@@ -362,30 +362,130 @@ class TransferFunction(MetadataBase):
             self.period[ii] = float(block["value"])  # type: ignore[assignment]
             self.read_block(block, ii)
 
-    def write_block(self, parent: et.Element, index: int) -> et.Element:
+    def read_element(self, data_element: et.Element) -> None:
         """
-        Write a data block
+        Read the <Data> element directly into the data arrays.
 
-        :param parent: DESCRIPTION
-        :type parent: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
+        Periods are walked once; the values of each component are collected
+        with their (period, output, input) indices and converted in a single
+        call per component, skipping the intermediate dictionary used by
+        :meth:`read_dict`.
+
+        :param data_element: <Data> element of an EMTF XML file
+        :type data_element: :class:`xml.etree.ElementTree.Element`
+        :return: None
+        :rtype: None
 
         """
+        if self._skip_derived_data:
+            logger.debug("Skipping derived quantities.")
+        period_elements = [
+            child for child in data_element if child.tag.lower() == "period"
+        ]
+        attrib = {key.lower(): value for key, value in data_element.attrib.items()}
+        try:
+            n_periods = int(float(attrib["count"].strip()))
+        except KeyError:
+            n_periods = len(period_elements)
 
-        period_element = et.SubElement(
-            parent,
-            "Period",
-            {"value": f"{self.period[index]:.12e}", "units": "secs"},  # type: ignore[arg-type]
-        )
+        self.initialize_arrays(n_periods)
+        # comp -> (dtype, [period index, output index, input index], [text])
+        comp_values = {}
+        for ii, period_element in enumerate(period_elements):
+            period_attrib = {
+                key.lower(): value for key, value in period_element.attrib.items()
+            }
+            self.period[ii] = float(period_attrib["value"])  # type: ignore[index]
+            for comp_element in period_element:
+                comp = comp_element.tag.lower().replace("_", "").replace(".", "_")
+                if self._skip_derived_data and comp in self._derived_keys:
+                    continue
+                if comp not in comp_values:
+                    comp_attrib = {
+                        key.lower(): value for key, value in comp_element.attrib.items()
+                    }
+                    comp_values[comp] = (
+                        self._dtype_dict.get(comp_attrib.get("type"), "unknown"),
+                        [],
+                        [],
+                    )
+                _, indices, texts = comp_values[comp]
+                for value_element in comp_element:
+                    value_attrib = {
+                        key.lower(): value
+                        for key, value in value_element.attrib.items()
+                    }
+                    indices.append(
+                        (
+                            ii,
+                            self._index_dict[value_attrib["output"].lower()],
+                            self._index_dict[value_attrib["input"].lower()],
+                        )
+                    )
+                    texts.append(value_element.text)
+
+        for comp, (dtype, indices, texts) in comp_values.items():
+            if not indices:
+                logger.debug(f"No value for {comp}")
+                continue
+            index = tuple(np.array(indices).T)
+            if dtype is complex:
+                values = np.array(" ".join(texts).split(), dtype=float)
+                values = values.reshape((-1, 2)).view(complex)[:, 0]
+            elif dtype in (float, int):
+                values = np.array(" ".join(texts).split(), dtype=float)
+            else:
+                values = []
+                for text in texts:
+                    value = text.split()
+                    if len(value) > 1:
+                        values.append(complex(float(value[0]), float(value[1])))
+                    else:
+                        values.append(float(value[0]))
+            self.array_dict[comp][index] = values
+
+    def read_periods(self, data_element: et.Element) -> None:
+        """
+        Read only the periods of the <Data> element, the data arrays are
+        left empty.
+
+        :param data_element: <Data> element of an EMTF XML file
+        :type data_element: :class:`xml.etree.ElementTree.Element`
+        :return: None
+        :rtype: None
+
+        """
+        periods = []
+        for period_element in data_element:
+            if period_element.tag.lower() != "period":
+                continue
+            for key, value in period_element.attrib.items():
+                if key.lower() == "value":
+                    periods.append(value)
+        self.period = np.array(periods, dtype=float)
+
+    def _format_blocks(self, periods: slice = slice(None)) -> list[tuple]:
+        """
+        Format the data arrays for writing.
 
+        Empty values are filled on the whole array and the value strings
+        for each component are formatted for all periods at once.
+
+        :param periods: periods to format, defaults to all
+        :type periods: slice
+        :return: list of (tag, attributes, [(value attributes, texts)])
+         where texts has one string per period
+        :rtype: list
+
+        """
+        blocks = []
         for key in self.array_dict.keys():
             if self.array_dict[key] is None:
                 continue
             if self.array_dict[key].size == 0:
                 logger.debug(f"No data for {key}, skipping.")
                 continue
-            arr = np.nan_to_num(self.array_dict[key][index])
+            arr = np.nan_to_num(self.array_dict[key][periods])
 
             # set zeros to empty value of 1E32
             if arr.dtype == complex:
@@ -395,20 +495,17 @@ class TransferFunction(MetadataBase):
 
             attr_dict = {
                 "type": self._dtype_dict[arr.dtype.name],
-                "size": str(arr.shape)[1:-1].replace(",", ""),
+                "size": str(arr.shape[1:])[1:-1].replace(",", ""),
             }
             try:
                 attr_dict["units"] = self._units_dict[key]
             except KeyError:
                 pass
 
-            comp_element = et.SubElement(
-                period_element, key.replace("_", ".").upper(), attr_dict
-            )
             idx_dict = self._write_dict[key]
-            shape = arr.shape
-            for ii in range(shape[0]):
-                for jj in range(shape[1]):
+            values = []
+            for ii in range(arr.shape[1]):
+                for jj in range(arr.shape[2]):
                     ch_out = idx_dict["out"][ii]
                     ch_in = idx_dict["in"][jj]
                     a_dict = {}
@@ -418,14 +515,62 @@ class TransferFunction(MetadataBase):
                         pass
                     a_dict["output"] = ch_out.capitalize()
                     a_dict["input"] = ch_in.capitalize()
-                    ch_element = et.SubElement(comp_element, "value", a_dict)
-                    ch_value = f"{arr[ii, jj].real:.6e}"
+
+                    real = arr[:, ii, jj].real.tolist()
                     if attr_dict["type"] in ["complex"]:
-                        ch_value = f"{ch_value} {arr[ii, jj].imag:.6e}"
-                    ch_element.text = ch_value
+                        imag = arr[:, ii, jj].imag.tolist()
+                        texts = [f"{re:.6e} {im:.6e}" for re, im in zip(real, imag)]
+                    else:
+                        texts = [f"{re:.6e}" for re in real]
+                    values.append((a_dict, texts))
+            blocks.append((key.replace("_", ".").upper(), attr_dict, values))
+        return blocks
+
+    def _write_period(
+        self, parent: et.Element, index: int, blocks: list[tuple], position: int
+    ) -> et.Element:
+        """
+        Write a period element from formatted blocks
+
+        :param parent: parent <Data> element
+        :type parent: :class:`xml.etree.ElementTree.Element`
+        :param index: index of the period
+        :type index: int
+        :param blocks: formatted blocks from :meth:`_format_blocks`
+        :type blocks: list
+        :param position: position of the period within the formatted blocks
+        :type position: int
+        :return: period element
+        :rtype: :class:`xml.etree.ElementTree.Element`
 
+        """
+        period_element = et.SubElement(
+            parent,
+            "Period",
+            {"value": f"{self.period[index]:.12e}", "units": "secs"},  # type: ignore[arg-type]
+        )
+        for tag, attr_dict, values in blocks:
+            comp_element = et.SubElement(period_element, tag, attr_dict)
+            for a_dict, texts in values:
+                et.SubElement(comp_element, "value", a_dict).text = texts[position]
         return period_element
 
+    def write_block(self, parent: et.Element, index: int) -> et.Element:
+        """
+        Write a data block
+
+        :param parent: parent <Data> element
+        :type parent: :class:`xml.etree.ElementTree.Element`
+        :param index: index of the period to write
+        :type index: int
+        :return: period element
+        :rtype: :class:`xml.etree.ElementTree.Element`
+
+        """
+
+        blocks = self._format_blocks(slice(index, index + 1))
+        return self._write_period(parent, index, blocks, 0)
+
     def to_xml(self, string: bool = False, required: bool = True) -> et.Element | str:
         """
         Write data blocks
@@ -438,8 +583,9 @@ class TransferFunction(MetadataBase):
         """
         root = et.Element("Data", {"count": f"{self.n_periods:.0f}"})
 
+        blocks = self._format_blocks()
         for index in range(self.period.size):  # type: ignore[attribute-error]
-            self.write_block(root, index)
+            self._write_period(root, index, blocks, index)
 
         if string:
             return element_to_string(root)
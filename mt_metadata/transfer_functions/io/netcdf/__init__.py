@@ -0,0 +1,6 @@
+# package file
+
+from .netcdf import TFNetCDF
+
+
+__all__ = ["TFNetCDF"]
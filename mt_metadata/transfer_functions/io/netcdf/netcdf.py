@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+====================
+netcdf
+====================
+
+Archive transfer functions as netCDF or zarr.
+
+The transfer function dataset is stored as is, with every data variable
+compressed and chunked by period.  netCDF has no complex type, so complex
+variables are stored as ``<name>_real`` and ``<name>_imag`` pairs.
+
+The survey, station, run, channel and filter metadata are stored as a
+JSON attribute, each object written with ``to_dict(nested=True)`` and its
+class name, so reading gives back the same metadata objects.
+
+netCDF4 (``.nc``) and zarr (``.zarr``) are optional dependencies.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import json
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+from loguru import logger
+
+from mt_metadata import __version__
+from mt_metadata.base.helpers import (
+    array_hook,
+    ArrayEncoder,
+    module_available,
+    requires,
+)
+from mt_metadata.timeseries import Run, Survey
+from mt_metadata.timeseries.columnar import CHANNEL_CLASSES, FILTER_CLASSES
+from mt_metadata.transfer_functions.tf import Station
+
+# =============================================================================
+
+COMPLEX_PARTS = {"real": "_real", "imag": "_imag"}
+
+
+class TFNetCDFError(Exception):
+    pass
+
+
+def survey_to_dict(survey_metadata: Survey) -> dict:
+    """
+    Nested dictionary of a survey including its stations, runs, channels
+    and filters.
+
+    :param survey_metadata: survey metadata
+    :type survey_metadata: :class:`mt_metadata.timeseries.Survey`
+    :return: nested dictionary, see :func:`survey_from_dict`
+    :rtype: dict
+
+    """
+    kwargs = {"nested": True, "single": True}
+    survey_dict = survey_metadata.to_dict(**kwargs)
+    survey_dict["stations"] = []
+    survey_dict["filters"] = []
+    for station in survey_metadata.stations:
+        station_dict = station.to_dict(**kwargs)
+        station_dict["runs"] = []
+        for run in station.runs:
+            run_dict = run.to_dict(**kwargs)
+            run_dict["channels"] = []
+            for channel in run.channels:
+                channel_dict = channel.to_dict(**kwargs)
+                channel_dict["_class"] = type(channel).__name__
+                run_dict["channels"].append(channel_dict)
+            station_dict["runs"].append(run_dict)
+        survey_dict["stations"].append(station_dict)
+    for mt_filter in survey_metadata.filters.values():
+        filter_dict = mt_filter.to_dict(**kwargs)
+        filter_dict["_class"] = type(mt_filter).__name__
+        survey_dict["filters"].append(filter_dict)
+    return survey_dict
+
+
+def survey_from_dict(survey_dict: dict) -> Survey:
+    """
+    Make a survey from a dictionary written by :func:`survey_to_dict`.
+
+    :param survey_dict: nested dictionary
+    :type survey_dict: dict
+    :return: survey metadata
+    :rtype: :class:`mt_metadata.timeseries.Survey`
+
+    """
+    survey_dict = dict(survey_dict)
+    station_list = survey_dict.pop("stations", [])
+    filter_list = survey_dict.pop("filters", [])
+    survey_metadata = Survey.from_flat_dict(survey_dict)
+
+    for filter_dict in filter_list:
+        filter_dict = dict(filter_dict)
+        mt_filter = FILTER_CLASSES[filter_dict.pop("_class")].from_flat_dict(
+            filter_dict
+        )
+        survey_metadata.filters[mt_filter.name] = mt_filter
+
+    for station_dict in station_list:
+        station_dict = dict(station_dict)
+        run_list = station_dict.pop("runs", [])
+        station = Station.from_flat_dict(station_dict)
+        for run_dict in run_list:
+            run_dict = dict(run_dict)
+            channel_list = run_dict.pop("channels", [])
+            run = Run.from_flat_dict(run_dict)
+            for channel_dict in channel_list:
+                channel_dict = dict(channel_dict)
+                channel = CHANNEL_CLASSES[channel_dict.pop("_class")].from_flat_dict(
+                    channel_dict
+                )
+                run.add_channel(channel)
+            station.add_run(run)
+        survey_metadata.add_station(station)
+    return survey_metadata
+
+
+class TFNetCDF:
+    """
+    Read and write transfer functions as netCDF (``.nc``) or zarr
+    (``.zarr``), the format is set by the file extension.
+
+    :param fn: file name
+    :type fn: str | Path | None
+    :param dataset: transfer function dataset, see
+     :attr:`mt_metadata.transfer_functions.core.TF.dataset`
+    :type dataset: xr.Dataset | None
+    :param survey_metadata: survey metadata
+    :type survey_metadata: :class:`mt_metadata.timeseries.Survey` | None
+    :param channel_nomenclature: channel names of the dataset
+    :type channel_nomenclature: dict | None
+    :param rotation_angle: rotation angle of the transfer function, a
+     single angle or one per period
+    :type rotation_angle: float | np.ndarray
+
+    :Example: ::
+
+        >>> from mt_metadata.transfer_functions import TF
+        >>> tf_obj = TF(fn="/home/mt/mt01.xml")
+        >>> tf_obj.read()
+        >>> tf_obj.write(fn="/home/mt/mt01.nc")
+
+    """
+
+    def __init__(
+        self,
+        fn: str | Path | None = None,
+        dataset: xr.Dataset | None = None,
+        survey_metadata: Survey | None = None,
+        channel_nomenclature: dict | None = None,
+        rotation_angle: float | np.ndarray = 0,
+        **kwargs,
+    ):
+        self.dataset = dataset
+        self.survey_metadata = survey_metadata
+        self.channel_nomenclature = channel_nomenclature
+        self.rotation_angle = rotation_angle
+        self.period = None
+        self.complevel = 4
+        self.period_chunk = 64
+
+        self.fn = fn
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __str__(self) -> str:
+        return f"TFNetCDF(fn={self.fn})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    @property
+    def fn(self) -> Path | None:
+        return self._fn
+
+    @fn.setter
+    def fn(self, value: str | Path | None):
+        if value is not None:
+            self._fn = Path(value)
+        else:
+            self._fn = None
+
+    @property
+    def file_type(self) -> str:
+        """nc or zarr, from the file extension"""
+        if self.fn is not None and self.fn.suffix.lower() == ".zarr":
+            return "zarr"
+        return "nc"
+
+    def _to_archive(self) -> tuple[xr.Dataset, dict]:
+        """
+        Split complex variables and add the metadata as attributes.
+
+        Returns the dataset to write and its encoding.
+        """
+        data_vars = {}
+        for name, data_array in self.dataset.data_vars.items():
+            if np.iscomplexobj(data_array.data):
+                for part, suffix in COMPLEX_PARTS.items():
+                    data_vars[f"{name}{suffix}"] = getattr(
+                        data_array, part
+                    ).assign_attrs(complex_part=part)
+            else:
+                data_vars[name] = data_array
+        archive = xr.Dataset(data_vars, coords=self.dataset.coords)
+        archive.attrs = {
+            "mt_metadata_version": __version__,
+            "channel_nomenclature": json.dumps(self.channel_nomenclature),
+            "rotation_angle": json.dumps(np.asarray(self.rotation_angle).tolist()),
+            "survey_metadata": json.dumps(
+                survey_to_dict(self.survey_metadata), cls=ArrayEncoder
+            ),
+        }
+
+        chunks = (min(self.period_chunk, archive.period.size),) + tuple(
+            archive.sizes[dim] for dim in ["output", "input"]
+        )
+        encoding = {}
+        for name in archive.data_vars:
+            if self.file_type == "zarr":
+                encoding[name] = {"chunks": chunks}
+            else:
+                encoding[name] = {
+                    "zlib": True,
+                    "complevel": self.complevel,
+                    "chunksizes": chunks,
+                }
+        return archive, encoding
+
+    @staticmethod
+    def _from_archive(archive: xr.Dataset) -> xr.Dataset:
+        """
+        Join the real and imaginary parts of complex variables.
+        """
+        data_vars = {}
+        for name, data_array in archive.data_vars.items():
+            part = data_array.attrs.get("complex_part")
+            if part == "real":
+                base = name[: -len(COMPLEX_PARTS["real"])]
+                imag = archive[f"{base}{COMPLEX_PARTS['imag']}"]
+                data_vars[base] = (data_array + 1j * imag).rename(base)
+            elif part is None:
+                data_vars[name] = data_array
+        for data_array in data_vars.values():
+            data_array.attrs = {}
+        return xr.Dataset(data_vars, coords=archive.coords)
+
+    @requires(netCDF4=module_available("netCDF4"))
+    def _write_netcdf(self, archive: xr.Dataset, encoding: dict) -> None:
+        archive.to_netcdf(self.fn, engine="netcdf4", encoding=encoding)
+
+    @requires(zarr=module_available("zarr"))
+    def _write_zarr(self, archive: xr.Dataset, encoding: dict) -> None:
+        archive.to_zarr(self.fn, mode="w", encoding=encoding)
+
+    @property
+    def _chunks(self) -> dict | None:
+        """Open with dask arrays when available, so complex parts stay lazy"""
+        if module_available("dask"):
+            return {}
+        return None
+
+    @requires(netCDF4=module_available("netCDF4"))
+    def _open_netcdf(self) -> xr.Dataset:
+        return xr.open_dataset(self.fn, engine="netcdf4", chunks=self._chunks)
+
+    @requires(zarr=module_available("zarr"))
+    def _open_zarr(self) -> xr.Dataset:
+        return xr.open_dataset(self.fn, engine="zarr", chunks=self._chunks)
+
+    def write(
+        self,
+        fn: str | Path | None = None,
+        complevel: int | None = None,
+        period_chunk: int | None = None,
+    ) -> Path:
+        """
+        Write the transfer function to a netCDF or zarr file.
+
+        :param fn: file name, ``.zarr`` writes a zarr store, anything else
+         netCDF, defaults to None
+        :type fn: str | Path | None, optional
+        :param complevel: zlib compression level of netCDF files, defaults
+         to None which uses ``self.complevel``
+        :type complevel: int | None, optional
+        :param period_chunk: number of periods per chunk, defaults to None
+         which uses ``self.period_chunk``
+        :type period_chunk: int | None, optional
+        :return: file name
+        :rtype: Path
+
+        """
+        if fn is not None:
+            self.fn = fn
+        if complevel is not None:
+            self.complevel = complevel
+        if period_chunk is not None:
+            self.period_chunk = period_chunk
+        if self.dataset is None or self.survey_metadata is None:
+            msg = "dataset and survey_metadata must be set to write a file"
+            logger.error(msg)
+            raise TFNetCDFError(msg)
+
+        archive, encoding = self._to_archive()
+        if self.file_type == "zarr":
+            self._write_zarr(archive, encoding)
+        else:
+            self._write_netcdf(archive, encoding)
+        return self.fn
+
+    def read(
+        self,
+        fn: str | Path | None = None,
+        metadata_only: bool = False,
+        load: bool = False,
+    ) -> None:
+        """
+        Read a netCDF or zarr file.
+
+        The file is opened lazily, with ``metadata_only`` only the metadata
+        and periods are read.  Otherwise the data are read from the file
+        when first used, the file stays open until then.
+
+        :param fn: file name, defaults to None
+        :type fn: str | Path | None, optional
+        :param metadata_only: only read the metadata, defaults to False
+        :type metadata_only: bool, optional
+        :param load: read all the data into memory and close the file,
+         defaults to False
+        :type load: bool, optional
+
+        """
+        if fn is not None:
+            self.fn = fn
+        if self.fn is None or not self.fn.exists():
+            msg = f"Could not find file {self.fn}"
+            logger.error(msg)
+            raise TFNetCDFError(msg)
+
+        if self.file_type == "zarr":
+            archive = self._open_zarr()
+        else:
+            archive = self._open_netcdf()
+        if archive is None:
+            return
+
+        keep_open = False
+        try:
+            self.channel_nomenclature = json.loads(
+                archive.attrs["channel_nomenclature"]
+            )
+            self.survey_metadata = survey_from_dict(
+                json.loads(archive.attrs["survey_metadata"], object_hook=array_hook)
+            )
+            rotation_angle = json.loads(archive.attrs.get("rotation_angle", "0"))
+            if isinstance(rotation_angle, list):
+                rotation_angle = np.array(rotation_angle)
+            self.rotation_angle = rotation_angle
+            self.period = archive.period.data.copy()
+            if not metadata_only:
+                dataset = self._from_archive(archive)
+                if load:
+                    dataset = dataset.load()
+                else:
+                    # the lazy variables are read from the open archive
+                    keep_open = True
+                self.dataset = dataset
+        finally:
+            if not keep_open:
+                archive.close()
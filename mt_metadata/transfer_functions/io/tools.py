@@ -12,6 +12,7 @@ import json
 # =============================================================================
 import urllib.request as url_request
 
+import numpy as np
 from loguru import logger
 
 # =============================================================================
@@ -228,3 +229,40 @@ def get_nm_elev(latitude, longitude):
     except ValueError:
         logger.warning(f"Could not convert elevation {info['value']} to float")
         return 0.0
+
+
+def errors_from_covariance(
+    residual_variance: np.ndarray, signal_variance: np.ndarray
+) -> np.ndarray:
+    """
+    Compute transfer function errors from the diagonals of the residual
+    covariance and inverse signal power, for all periods at once.
+
+    The error of output o and input i is sqrt(|N[o, o] * S[i, i]|), where
+    N is the residual covariance and S the inverse signal power.
+
+    Translated from code written by Ben Murphy.
+
+    :param residual_variance: diagonal of the residual covariance,
+     shape (n_periods, n_outputs)
+    :type residual_variance: np.ndarray
+    :param signal_variance: diagonal of the inverse signal power,
+     shape (n_periods, n_inputs)
+    :type signal_variance: np.ndarray
+    :return: errors of shape (n_periods, n_outputs, n_inputs)
+    :rtype: np.ndarray
+
+    :Example: ::
+
+        >>> tf_err = errors_from_covariance(
+        ...     np.diagonal(sigma_e, axis1=1, axis2=2),
+        ...     np.diagonal(sigma_s, axis1=1, axis2=2),
+        ... )
+
+    """
+    residual_variance = np.asarray(residual_variance)
+    signal_variance = np.asarray(signal_variance)
+    variance = (
+        residual_variance[..., :, np.newaxis] * signal_variance[..., np.newaxis, :]
+    )
+    return np.sqrt(np.abs(variance))
@@ -9,6 +9,7 @@ Translated from code by B. Murphy.
 # ==============================================================================
 # Imports
 # ==============================================================================
+import re
 from pathlib import Path
 
 import numpy as np
@@ -26,6 +27,13 @@ from .metadata import Channel
 # ==============================================================================
 PERIOD_FORMAT = ".10g"
 
+# header lines of each period block and the numeric lines of its payload
+PERIOD_PATTERN = re.compile(
+    r"period\s*:\s*(\S+).*?level\s+(\S+).*?from\s+(\S+).*?to\s+(\S+)"
+)
+POINTS_PATTERN = re.compile(r"point\s+(\S+).*?freq\.\s*(\S+)")
+DATA_LINE_PATTERN = re.compile(r"^[ \t]*[-+.\d].*$", re.MULTILINE)
+
 
 class ZMMError(Exception):
     pass
@@ -562,6 +570,7 @@ class ZMM(ZMMHeader):
         get_elevation: bool = False,
         rotate_to_measurement_coordinates: bool = True,
         use_declination: bool = False,
+        metadata_only: bool = False,
     ) -> None:
         """
         Read in Egbert zrr/zmm file
@@ -582,6 +591,11 @@ class ZMM(ZMMHeader):
             If True, rotate impedance to true north using declination value in metadata,
             by default False
 
+        metadata_only : bool, optional
+            If True, only read the header and the period and decimation
+            information of each block, the data arrays are left empty and the
+            dataset is not filled, by default False
+
         Raises
         ------
         ZMMError
@@ -596,30 +610,24 @@ class ZMM(ZMMHeader):
         self._transfer_function = self._initialize_transfer_function()
         self.dataset = self._initialize_transfer_function()
 
-        ### read each data block and fill the appropriate array
-        for ii, period_block in enumerate(self._get_period_blocks()):
-            data_block = self._read_period_block(period_block)
-            self.periods[ii] = data_block["period"]
-
-            self._fill_tf_array_from_block(data_block["tf"], ii)
-            self._fill_sig_array_from_block(data_block["sig"], ii)
-            self._fill_res_array_from_block(data_block["res"], ii)
-        self._fill_dataset(
-            rotate_to_measurement_coordinates=rotate_to_measurement_coordinates,
-            use_declination=use_declination,
-        )
+        ### read all data blocks and fill the arrays
+        self._read_period_blocks(metadata_only=metadata_only)
+        if not metadata_only:
+            self._fill_dataset(
+                rotate_to_measurement_coordinates=rotate_to_measurement_coordinates,
+                use_declination=use_declination,
+            )
 
         self.station_metadata.id = self.station
         self.station_metadata.data_type = "MT"
         self.station_metadata.channels_recorded = self.channels_recorded
-        # provenance
-        self.station_metadata.provenance.software.name = "EMTF"
-        self.station_metadata.provenance.software.version = "1"
-        self.station_metadata.transfer_function.runs_processed = (
-            self.station_metadata.run_list
-        )
-        self.station_metadata.transfer_function.software.name = "EMTF"
-        self.station_metadata.transfer_function.software.version = "1"
+        with self.station_metadata.deferred_validation() as sm:
+            # provenance
+            sm.provenance.software.name = "EMTF"
+            sm.provenance.software.version = "1"
+            sm.transfer_function.runs_processed = sm.run_list
+            sm.transfer_function.software.name = "EMTF"
+            sm.transfer_function.software.version = "1"
         self.station_metadata.runs[0].sample_rate = np.median(
             np.array([d["sample_rate"] for k, d in self.decimation_dict.items()])
         )
@@ -737,22 +745,12 @@ class ZMM(ZMMHeader):
             fid.write("\n".join(lines))
         return self.fn
 
-    def _get_period_blocks(self) -> list[list[str]]:
-        """
-        split file into period blocks
+    def _read_period_blocks(self, metadata_only: bool = False) -> None:
         """
+        Read all period blocks at once and fill the data arrays.
+
+        Each block looks like::
 
-        with open(self.fn, "r") as fid:
-            fn_str = fid.read()
-        period_strings = fn_str.lower().split("period")
-        period_blocks = []
-        for per in period_strings:
-            period_blocks.append(per.split("\n"))
-        return period_blocks[1:]
-
-    def _read_period_block(self, period_block: list[str]) -> dict:
-        """
-        read block:
             period :      0.01587    decimation level   1    freq. band from   46 to   80
             number of data point  951173 sampling freq.   0.004 Hz
              Transfer Functions
@@ -764,42 +762,88 @@ class ZMM(ZMMHeader):
              Residual Covaraince
               0.8051E-05  0.0000E+00
              -0.2231E-05 -0.2863E-06  0.8866E-05  0.0000E+00
+
+        The numeric lines of every block have the same layout, so they are
+        converted in a single pass and reshaped into one row per period:
+        (real, imaginary) pairs of the transfer function by row, the lower
+        triangle of the inverse signal power and the lower triangle of the
+        residual covariance.
+
+        Parameters
+        ----------
+        metadata_only : bool, optional
+            If True, only read the periods and decimation information,
+            by default False
+
+        Raises
+        ------
+        ZMMError
+            If the number of values does not match the number of channels
+            and periods.
         """
 
-        period = float(period_block[0].strip().split(":")[1].split()[0].strip())
-        level = int(period_block[0].strip().split("level")[1].split()[0].strip())
-        bands = (
-            int(period_block[0].strip().split("from")[1].split()[0].strip()),
-            int(period_block[0].strip().split("to")[1].split()[0].strip()),
+        with open(self.fn, "r") as fid:
+            lines = fid.read().lower().split("\n")
+        body = "\n".join(lines[self._header_count :])
+
+        # decimation information, one row per period
+        period_info = np.array(PERIOD_PATTERN.findall(body), dtype=str).reshape((-1, 4))
+        points_info = np.array(POINTS_PATTERN.findall(body), dtype=str).reshape((-1, 2))
+        n_periods = period_info.shape[0]
+        periods = period_info[:, 0].astype(float)
+        levels = period_info[:, 1].astype(int)
+        bands = period_info[:, 2:4].astype(int)
+        npts = points_info[:, 0].astype(int)
+        sample_rates = points_info[:, 1].astype(float)
+        for period, level, band, n_points, sample_rate in zip(
+            periods.tolist(),
+            levels.tolist(),
+            bands.tolist(),
+            npts.tolist(),
+            sample_rates.tolist(),
+        ):
+            self.decimation_dict[f"{period:{PERIOD_FORMAT}}"] = {
+                "level": level,
+                "bands": tuple(band),
+                "npts": n_points,
+                "sample_rate": sample_rate,
+            }
+
+        self.periods[:n_periods] = periods
+        if n_periods == 0 or metadata_only:
+            return
+
+        # numeric payload as complex values, one row per period
+        n_outputs = self.num_channels - 2
+        n_tf = 2 * n_outputs
+        n_sig = 3
+        n_res = n_outputs * (n_outputs + 1) // 2
+        values = np.array(
+            " ".join(DATA_LINE_PATTERN.findall(body)).split(), dtype=float
         )
+        if values.size != n_periods * 2 * (n_tf + n_sig + n_res):
+            raise ZMMError(
+                f"Found {values.size} values for {n_periods} periods, expected "
+                f"{n_periods * 2 * (n_tf + n_sig + n_res)} for "
+                f"{self.num_channels} channels"
+            )
+        blocks = values.reshape((n_periods, -1)).view(complex)
 
-        npts = int(period_block[1].strip().split("point")[1].split()[0].strip())
-        sr = float(period_block[1].strip().split("freq.")[1].split()[0].strip())
-        self.decimation_dict[f"{period:{PERIOD_FORMAT}}"] = {
-            "level": level,
-            "bands": bands,
-            "npts": npts,
-            "sample_rate": sr,
-        }
-        data_dict = {"period": period, "tf": [], "sig": [], "res": []}
-        key = "tf"
-        for line in period_block[2:]:
-            if "transfer" in line.lower():
-                key = "tf"
-                continue
-            elif "signal" in line.lower():
-                key = "sig"
-                continue
-            elif "residual" in line.lower():
-                key = "res"
-                continue
-            line_list = [float(xx) for xx in line.strip().split()]
-            values = [
-                complex(line_list[ii], line_list[ii + 1])
-                for ii in range(0, len(line_list), 2)
-            ]
-            data_dict[key].append(values)
-        return data_dict
+        self.transfer_functions[:n_periods] = blocks[:, :n_tf].reshape(
+            (n_periods, n_outputs, 2)
+        )
+
+        sig = blocks[:, n_tf : n_tf + n_sig]
+        self.sigma_s[:n_periods, 0, 0] = sig[:, 0]
+        self.sigma_s[:n_periods, 1, 0] = sig[:, 1]
+        self.sigma_s[:n_periods, 0, 1] = sig[:, 1].conjugate()
+        self.sigma_s[:n_periods, 1, 1] = sig[:, 2]
+
+        # residual covariance is stored as the lower triangle by row
+        res = blocks[:, n_tf + n_sig :]
+        rows, columns = np.tril_indices(n_outputs)
+        self.sigma_e[:n_periods, columns, rows] = res.conjugate()
+        self.sigma_e[:n_periods, rows, columns] = res
 
     def _flatten_list(self, x_list: list[list]) -> list:
         """
@@ -815,38 +859,6 @@ class ZMM(ZMMHeader):
 
         return flat_list
 
-    def _fill_tf_array_from_block(self, tf_block: list[complex], index: int) -> None:
-        """
-        fill tf arrays from data blocks
-        """
-        tf_block = self._flatten_list(tf_block)
-        for kk, jj in enumerate(range(0, len(tf_block), 2)):
-            self.transfer_functions[index, kk, 0] = tf_block[jj]
-            self.transfer_functions[index, kk, 1] = tf_block[jj + 1]
-
-    def _fill_sig_array_from_block(self, sig_block: list[complex], index: int) -> None:
-        """
-        fill signal array
-        """
-        sig_block = self._flatten_list(sig_block)
-        self.sigma_s[index, 0, 0] = sig_block[0]
-        self.sigma_s[index, 1, 0] = sig_block[1]
-        self.sigma_s[index, 0, 1] = sig_block[1].conjugate()
-        self.sigma_s[index, 1, 1] = sig_block[2]
-
-    def _fill_res_array_from_block(self, res_block: list[complex], index: int) -> None:
-        """
-        fill residual covariance array
-        """
-        for jj in range(self.num_channels - 2):
-            values = res_block[jj]
-            for kk in range(jj + 1):
-                if jj == kk:
-                    self.sigma_e[index, jj, kk] = values[kk]
-                else:
-                    self.sigma_e[index, jj, kk] = values[kk]
-                    self.sigma_e[index, kk, jj] = values[kk].conjugate()
-
     def _fill_dataset(
         self,
         rotate_to_measurement_coordinates: bool = False,
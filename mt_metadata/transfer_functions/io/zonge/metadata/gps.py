@@ -4,7 +4,6 @@
 from typing import Annotated
 
 from pydantic import Field, field_validator, ValidationInfo
-from pyproj import CRS
 
 from mt_metadata.base import MetadataBase
 from mt_metadata.utils import location_helpers
@@ -76,8 +75,7 @@ class GPS(MetadataBase):
         Validate the datum value and convert it to the appropriate enum type.
         """
         try:
-            datum_crs = CRS.from_user_input(value)
-            return datum_crs.name
+            return location_helpers.get_datum_name(value)
         except Exception:
             raise ValueError(
                 f"Invalid datum value: {value}. Must be a valid CRS string or identifier."
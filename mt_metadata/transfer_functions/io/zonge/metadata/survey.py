@@ -5,10 +5,10 @@ from enum import Enum
 from typing import Annotated
 
 from pydantic import Field, field_validator
-from pyproj import CRS
 
 from mt_metadata.base import MetadataBase
 from mt_metadata.common.enumerations import DataTypeEnum
+from mt_metadata.utils.location_helpers import get_datum_name
 
 # =====================================================
 
@@ -100,8 +100,7 @@ class Survey(MetadataBase):
         Validate the datum value and convert it to the appropriate enum type.
         """
         try:
-            datum_crs = CRS.from_user_input(value)
-            return datum_crs.name
+            return get_datum_name(value)
         except Exception:
             raise ValueError(
                 f"Invalid datum value: {value}. Must be a valid CRS string or identifier."
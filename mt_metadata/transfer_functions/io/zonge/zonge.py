@@ -118,7 +118,12 @@ class ZongeMTAvg:
         else:
             self._fn = None
 
-    def read(self, fn: str | Path | None = None, get_elevation: bool = False) -> None:
+    def read(
+        self,
+        fn: str | Path | None = None,
+        get_elevation: bool = False,
+        metadata_only: bool = False,
+    ) -> None:
         """
         Read data from a file into the object as a pandas DataFrame
 
@@ -128,6 +133,9 @@ class ZongeMTAvg:
             The file name to read from, by default None
         get_elevation : bool, optional
             Whether to get elevation data, by default False
+        metadata_only : bool, optional
+            If True, only read the header, the components and the
+            frequencies, z and t are not filled, by default False
         """
 
         if fn is not None:
@@ -142,6 +150,53 @@ class ZongeMTAvg:
         # read header
         data_lines = self.header.read_header(lines)
 
+        if metadata_only:
+            self._read_components_and_frequency(data_lines)
+        else:
+            self._read_data(data_lines)
+
+        if self.header.elevation == 0 and get_elevation:
+            if self.header.latitude != 0 and self.header.longitude != 0:
+                self.header.elevation = get_nm_elev(
+                    self.header.latitude, self.header.longitude
+                )
+
+    def _read_components_and_frequency(self, data_lines: list[str]) -> None:
+        """
+        Read only the component names and the frequencies of the data lines.
+
+        Parameters
+        ----------
+        data_lines : list[str]
+            lines after the header
+        """
+        components = []
+        frequency = set()
+        for line in data_lines:
+            if "$" in line:
+                comp = line.split("=")[1].strip().lower()
+            elif "skp" in line.lower() or len(line) < 2:
+                continue
+            else:
+                if comp not in components:
+                    components.append(comp)
+                frequency.add(float(line.split(",")[1]))
+
+        self.df = None
+        self.frequency = np.array(sorted(frequency))
+        self.n_freq = self.frequency.size
+        self.components = np.array(components)
+        self.freq_index_dict = dict([(ff, ii) for ii, ff in enumerate(self.frequency)])
+
+    def _read_data(self, data_lines: list[str]) -> None:
+        """
+        Read the data lines into a DataFrame and fill z and t.
+
+        Parameters
+        ----------
+        data_lines : list[str]
+            lines after the header
+        """
         data_list = []
         for line in data_lines:
             if "$" in line:
@@ -171,12 +226,6 @@ class ZongeMTAvg:
         self.z, self.z_err = self._fill_z()
         self.t, self.t_err = self._fill_t()
 
-        if self.header.elevation == 0 and get_elevation:
-            if self.header.latitude != 0 and self.header.longitude != 0:
-                self.header.elevation = get_nm_elev(
-                    self.header.latitude, self.header.longitude
-                )
-
     def to_complex(
         self, zmag: np.typing.NDArray, zphase: np.typing.NDArray
     ) -> tuple[np.typing.NDArray, np.typing.NDArray]:
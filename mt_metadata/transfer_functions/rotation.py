@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+.. module:: mt_metadata.transfer_functions.rotation
+   :synopsis: Rotate stacks of transfer function tensors
+
+Angles are in degrees clockwise from north, positive rotates x (north)
+towards y (east).  A horizontal channel pair is rotated by
+
+    R = [[cos(angle), sin(angle)], [-sin(angle), cos(angle)]]
+
+and a tensor T with outputs o and inputs i by T' = R_o T R_i^T.  The
+vertical magnetic field is not rotated.
+
+The channel layout is taken from the size of the last two axes:
+
+    ==  ===========================================
+    1   hz
+    2   ex, ey  or  hx, hy
+    3   ex, ey, hz
+    5   ex, ey, hz, hx, hy (layout of the TF dataset)
+    ==  ===========================================
+
+So impedance (2, 2), tipper (1, 2), transfer functions (3, 2), residual
+covariance (3, 3), inverse signal power (2, 2) and the TF dataset (5, 5)
+are all rotated the same way.
+
+:Example: ::
+
+    >>> z = np.random.rand(100, 50, 2, 2)  # 100 stations, 50 periods
+    >>> angle = np.random.rand(100, 1) * 90  # one angle per station
+    >>> z_rotated = rotate_tensors(z, angle)
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import numpy as np
+
+# =============================================================================
+
+# (index of the first channel of each horizontal pair, index of hz)
+CHANNEL_LAYOUTS = {
+    1: ([], [0]),
+    2: ([0], []),
+    3: ([0], [2]),
+    5: ([0, 3], [2]),
+}
+
+
+def rotation_matrix(angle: float | np.ndarray, n_channels: int = 2) -> np.ndarray:
+    """
+    Rotation matrices of a channel layout.
+
+    :param angle: rotation angle in degrees, any shape
+    :type angle: float | np.ndarray
+    :param n_channels: number of channels, one of 1, 2, 3 or 5, see
+     :data:`CHANNEL_LAYOUTS`
+    :type n_channels: int
+    :return: rotation matrices of shape ``angle.shape + (n, n)``
+    :rtype: np.ndarray
+
+    """
+    try:
+        pairs, singles = CHANNEL_LAYOUTS[n_channels]
+    except KeyError:
+        raise ValueError(
+            f"Cannot rotate {n_channels} channels, must be one of "
+            f"{list(CHANNEL_LAYOUTS.keys())}"
+        )
+    radians = np.deg2rad(np.asarray(angle, dtype=float))
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+
+    rotation = np.zeros(radians.shape + (n_channels, n_channels))
+    for index in pairs:
+        rotation[..., index, index] = cos
+        rotation[..., index, index + 1] = sin
+        rotation[..., index + 1, index] = -sin
+        rotation[..., index + 1, index + 1] = cos
+    for index in singles:
+        rotation[..., index, index] = 1
+    return rotation
+
+
+def rotate_tensors(
+    tensors: np.ndarray, angle: float | np.ndarray, variance: bool = False
+) -> np.ndarray:
+    """
+    Rotate a stack of tensors, for example the impedance of many stations
+    at many periods, in one call.
+
+    :param tensors: tensors of shape ``(..., n_outputs, n_inputs)``
+    :type tensors: np.ndarray
+    :param angle: rotation angle in degrees, a scalar or an array that
+     broadcasts against ``tensors.shape[:-2]``
+    :type angle: float | np.ndarray
+    :param variance: the tensors are variances of independent errors,
+     rotate them with the squared rotation matrices, defaults to False
+    :type variance: bool
+    :return: rotated tensors with the shape of ``tensors``
+    :rtype: np.ndarray
+
+    """
+    tensors = np.asarray(tensors)
+    angle = np.broadcast_to(np.asarray(angle, dtype=float), tensors.shape[:-2])
+    rotation_out = rotation_matrix(angle, tensors.shape[-2])
+    rotation_in = rotation_matrix(angle, tensors.shape[-1])
+    if variance:
+        rotation_out = rotation_out**2
+        rotation_in = rotation_in**2
+    return np.einsum(
+        "...ij,...jk,...lk->...il", rotation_out, tensors, rotation_in, optimize=True
+    )
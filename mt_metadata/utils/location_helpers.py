@@ -1,10 +1,20 @@
 # ===============================================================
 # imports
 # ===============================================================
+from functools import lru_cache
+
 import numpy as np
 from loguru import logger
 
 # ===============================================================
+# pyproj is slow to import, the default datum is resolved without it
+_KNOWN_DATUM_NAMES = {
+    "WGS 84": "WGS 84",
+    "WGS84": "WGS 84",
+    "EPSG:4326": "WGS 84",
+    4326: "WGS 84",
+}
+# ===============================================================
 
 
 def convert_position_float2str(position: float | int) -> str:
@@ -192,3 +202,46 @@ def validate_position(value: str | float, position_type: str) -> float:
     if not (abs(value) <= 180) and position_type in ["longitude", "lon"]:
         raise ValueError("longitude must be between -180 and 180 degrees")
     return value
+
+
+@lru_cache(maxsize=128)
+def _get_datum_name(value: str | int) -> str:
+    from pyproj import CRS
+
+    return CRS.from_user_input(value).name
+
+
+def get_datum_name(value: str | int) -> str:
+    """
+    Get the name of the coordinate reference system for a datum.
+
+    Building a pyproj CRS is expensive (milliseconds), and datums are
+    validated every time a location is created or assigned, so names are
+    memoized for hashable inputs.  pyproj is only imported for datums
+    other than WGS 84.
+
+    Parameters
+    ----------
+    value : str | int
+        Any input accepted by `pyproj.CRS.from_user_input`, e.g. 'WGS84'
+        or an EPSG number.
+
+    Returns
+    -------
+    str
+        Name of the CRS, e.g. 'WGS 84'.
+
+    Raises
+    ------
+    pyproj.exceptions.CRSError
+        If the value is not a valid CRS.
+    """
+    try:
+        if value in _KNOWN_DATUM_NAMES:
+            return _KNOWN_DATUM_NAMES[value]
+        return _get_datum_name(value)
+    except TypeError:
+        # unhashable input, like a dictionary
+        from pyproj import CRS
+
+        return CRS.from_user_input(value).name
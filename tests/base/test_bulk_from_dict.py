@@ -0,0 +1,159 @@
+"""
+Tests for the bulk mode of MetadataBase.from_dict
+
+Bulk mode validates each object once instead of once per attribute, the
+results must be identical to the per-attribute path.
+"""
+
+import json
+import time
+from xml.etree import ElementTree as et
+
+import pytest
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.base import helpers
+from mt_metadata.timeseries import Electric, Experiment, Magnetic, Run, Station
+from mt_metadata.utils.location_helpers import get_datum_name
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+@pytest.fixture(scope="module")
+def experiment():
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+    return ex
+
+
+def _all_objects(experiment):
+    for survey in experiment.surveys:
+        for station in survey.stations:
+            yield station
+            for run in station.runs:
+                yield run
+                for channel in run.channels:
+                    yield channel
+
+
+def _dumps(obj):
+    return json.dumps(obj.to_dict(required=False), cls=helpers.NumpyEncoder)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestBulkFromDict:
+    """Bulk mode must give the same result as the attribute mode"""
+
+    def test_experiment_objects(self, experiment):
+        for obj in _all_objects(experiment):
+            meta_dict = obj.to_dict(single=True)
+            attribute = type(obj)()
+            attribute.from_dict(meta_dict)
+            bulk = type(obj)()
+            bulk.from_dict(meta_dict, mode="bulk")
+            assert _dumps(attribute) == _dumps(bulk)
+
+    def test_from_flat_dict(self):
+        station = Station.from_flat_dict(
+            {"id": "mt01", "location.latitude": 40.0, "location.longitude": -120.0}
+        )
+        assert isinstance(station, Station)
+        assert station.id == "mt01"
+        assert station.location.latitude == 40.0
+        assert station.location.longitude == -120.0
+
+    def test_nested_object_updated_in_place(self):
+        station = Station()
+        location = station.location
+        station.from_dict({"location.latitude": 10.0}, mode="bulk")
+        assert station.location is location
+        assert location.latitude == 10.0
+
+    def test_extra_is_deferred(self):
+        meta_dict = {"component": "ex", "azimuth": 12.0, "new_key": "a"}
+        attribute = Electric()
+        attribute.from_dict(meta_dict)
+        bulk = Electric()
+        bulk.from_dict(meta_dict, mode="bulk")
+        assert bulk.new_key == "a"
+        assert _dumps(attribute) == _dumps(bulk)
+
+    def test_skip_none(self):
+        electric = Electric(component="ey")
+        electric.from_dict({"component": None}, skip_none=True, mode="bulk")
+        assert electric.component == "ey"
+
+    def test_bad_mode(self):
+        with pytest.raises(ValueError, match="mode"):
+            Electric().from_dict({"component": "ex"}, mode="fast")
+
+    def test_validation_error(self):
+        with pytest.raises(Exception):
+            Magnetic().from_dict({"sample_rate": "not a number"}, mode="bulk")
+
+    def test_run_channels_recorded(self):
+        run = Run()
+        run.from_dict(
+            {
+                "id": "001",
+                "channels_recorded_electric": ["ex", "ey"],
+                "channels_recorded_magnetic": ["hx", "hy", "hz"],
+            },
+            mode="bulk",
+        )
+        assert run.channels_recorded_electric == ["ex", "ey"]
+        assert run.channels_recorded_magnetic == ["hx", "hy", "hz"]
+
+
+class TestExperimentLoaders:
+    """Experiment loaders fill objects in bulk mode"""
+
+    def _dumps(self, experiment):
+        return json.dumps(experiment.to_dict(), cls=helpers.NumpyEncoder)
+
+    def test_from_json(self, experiment):
+        json_str = experiment.to_json()
+        attribute = Experiment()
+        attribute.from_json(json_str, mode="attribute")
+        bulk = Experiment()
+        bulk.from_json(json_str)
+        assert self._dumps(attribute) == self._dumps(bulk)
+        assert bulk.surveys[0].filters.keys() == experiment.surveys[0].filters.keys()
+
+    def test_from_xml_element(self, experiment):
+        element = et.parse(MT_EXPERIMENT_MULTIPLE_RUNS).getroot()
+        from_element = Experiment()
+        from_element.from_xml(element=element)
+        assert self._dumps(from_element) == self._dumps(experiment)
+
+
+class TestDatumName:
+    """Datum names are cached"""
+
+    def test_name(self):
+        assert get_datum_name("WGS84") == "WGS 84"
+        assert get_datum_name(4326) == "WGS 84"
+
+    def test_bad_datum(self):
+        with pytest.raises(Exception):
+            get_datum_name("not a datum")
+
+
+class TestBulkFromDictPerformance:
+    """Time the attribute and bulk modes"""
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    @pytest.mark.parametrize("metadata_class", [Electric, Magnetic, Station])
+    def test_from_dict_timing(self, metadata_class):
+        meta_dict = metadata_class().to_dict(single=True)
+        n_loops = 20
+        timing = {}
+        for mode in ("attribute", "bulk"):
+            start = time.perf_counter()
+            for _ in range(n_loops):
+                metadata_class().from_dict(meta_dict, mode=mode)
+            timing[mode] = (time.perf_counter() - start) / n_loops
+        assert timing["bulk"] < timing["attribute"]
@@ -0,0 +1,132 @@
+"""
+Tests for MetadataBase.deferred_validation
+"""
+
+import json
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.base import helpers
+from mt_metadata.timeseries import Electric, Experiment, Run, Station
+
+
+def _dumps(obj):
+    return json.dumps(obj.to_dict(required=False), cls=helpers.NumpyEncoder)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestDeferredValidation:
+    """Assignments are validated once when the block exits"""
+
+    def test_values_validated_on_exit(self):
+        station = Station()
+        with station.deferred_validation() as obj:
+            assert obj is station
+            station.id = "mt01"
+            station.location.latitude = "40.5"
+            station.time_period.start = "2020-01-01"
+            # raw values inside the block
+            assert station.location.latitude == "40.5"
+        assert station.location.latitude == 40.5
+        assert station.time_period.start == "2020-01-01T00:00:00+00:00"
+        assert station._deferred is None
+        assert station.location._deferred is None
+
+    def test_same_as_assignment(self):
+        values = {
+            "component": "ex",
+            "dipole_length": "55.5",
+            "measurement_azimuth": 10,
+            "positive.latitude": 40,
+            "negative.elevation": "12",
+            "time_period.end": "2020-02-01T12:00:00",
+            "units": "millivolts",
+        }
+        assigned = Electric()
+        deferred = Electric()
+        with deferred.deferred_validation():
+            for key, value in values.items():
+                deferred.update_attribute(key, value)
+        for key, value in values.items():
+            assigned.update_attribute(key, value)
+        assert _dumps(assigned) == _dumps(deferred)
+
+    def test_nested_objects_kept(self):
+        station = Station()
+        location = station.location
+        with station.deferred_validation():
+            station.location.longitude = -120
+        assert station.location is location
+
+    def test_nested_blocks(self):
+        electric = Electric()
+        with electric.deferred_validation():
+            with electric.deferred_validation():
+                electric.dipole_length = "10"
+            # only the outermost block validates
+            assert electric.dipole_length == "10"
+        assert electric.dipole_length == 10.0
+
+    def test_validation_error_restores(self):
+        station = Station(id="mt01")
+        station.location.latitude = 10
+        with pytest.raises(ValidationError):
+            with station.deferred_validation():
+                station.id = "mt02"
+                station.location.latitude = "not a number"
+        assert station.location.latitude == 10
+        assert station.id == "mt01"
+        assert station._deferred is None
+
+    def test_exception_restores(self):
+        electric = Electric(component="ex")
+        with pytest.raises(KeyError):
+            with electric.deferred_validation():
+                electric.component = "ey"
+                raise KeyError("stop")
+        assert electric.component == "ex"
+
+    def test_model_validator_runs_once(self):
+        run = Run()
+        with run.deferred_validation():
+            run.channels_recorded_electric = ["ex", "ey"]
+            run.channels_recorded_magnetic = ["hx", "hy"]
+        assert run.channels_recorded_electric == ["ex", "ey"]
+        assert run.channels_recorded_magnetic == ["hx", "hy"]
+        assert sorted(run.channels.keys()) == ["ex", "ey", "hx", "hy"]
+
+    def test_extra_attributes(self):
+        electric = Electric()
+        with electric.deferred_validation():
+            electric.new_attribute = "a"
+        assert electric.new_attribute == "a"
+
+
+class TestDeferredValidationPerformance:
+    """Time assignment against deferred validation"""
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    def test_experiment_from_xml(self):
+        ex = Experiment()
+        ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+        channel = ex.surveys[0].stations[0].runs[0].channels[0]
+        meta_dict = channel.to_dict(single=True)
+        n_loops = 20
+        timing = {}
+        for mode in ("assignment", "deferred"):
+            start = time.perf_counter()
+            for _ in range(n_loops):
+                obj = type(channel)()
+                if mode == "assignment":
+                    obj.from_dict(meta_dict)
+                else:
+                    with obj.deferred_validation():
+                        obj.from_dict(meta_dict)
+            timing[mode] = (time.perf_counter() - start) / n_loops
+        assert obj == channel
+        assert timing["deferred"] < timing["assignment"]
@@ -0,0 +1,125 @@
+"""
+Tests for the consolidated on-disk field tree cache and a startup benchmark
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from mt_metadata import __version__
+from mt_metadata.base import pydantic_helpers
+from mt_metadata.timeseries import Electric, Station
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MT_METADATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(pydantic_helpers, "_DISABLE_DISK_CACHE", False)
+    pydantic_helpers.clear_field_caches()
+    yield tmp_path
+    monkeypatch.delenv("MT_METADATA_CACHE_DIR")
+    pydantic_helpers.clear_field_caches()
+
+
+def _cache_files(path):
+    return sorted(fn.name for fn in path.iterdir() if fn.suffix == ".json")
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestFieldCache:
+    """One versioned cache file for all model classes"""
+
+    def test_single_versioned_file(self, cache_dir):
+        pydantic_helpers.get_all_fields_serializable(Station)
+        pydantic_helpers.get_all_fields_serializable(Electric)
+        # nothing is written until the cache is flushed
+        assert _cache_files(cache_dir) == []
+        pydantic_helpers.write_field_cache()
+        files = _cache_files(cache_dir)
+        assert len(files) == 1
+        assert f"mt{__version__}" in files[0]
+
+        with open(cache_dir / files[0]) as fid:
+            cache = json.load(fid)
+        assert "mt_metadata.timeseries.station.Station" in cache["trees"]
+        assert "mt_metadata.timeseries.electric.Electric" in cache["trees"]
+
+    def test_read_back(self, cache_dir):
+        computed = pydantic_helpers.get_all_fields_serializable(Station)
+        pydantic_helpers.write_field_cache()
+        pydantic_helpers.clear_field_caches()
+        assert pydantic_helpers._load_fields_from_disk(Station) == computed
+        assert pydantic_helpers.get_all_fields_serializable(Station) == computed
+
+    def test_modified_source_drops_cache(self, cache_dir):
+        pydantic_helpers.get_all_fields_serializable(Station)
+        pydantic_helpers.write_field_cache()
+        path = cache_dir / _cache_files(cache_dir)[0]
+        with open(path) as fid:
+            cache = json.load(fid)
+        for source in cache["sources"]:
+            cache["sources"][source] -= 1
+        with open(path, "w") as fid:
+            json.dump(cache, fid)
+
+        pydantic_helpers.clear_field_caches()
+        assert pydantic_helpers._load_fields_from_disk(Station) is None
+
+    def test_corrupt_file(self, cache_dir):
+        (cache_dir / os.path.basename(pydantic_helpers._disk_cache_path())).write_text(
+            "{not json"
+        )
+        assert pydantic_helpers._load_fields_from_disk(Station) is None
+        assert pydantic_helpers.get_all_fields_serializable(Station)
+
+    def test_to_dict_unchanged(self, cache_dir):
+        expected = Station().to_dict(required=False)
+        pydantic_helpers.write_field_cache()
+        pydantic_helpers.clear_field_caches()
+        assert Station().to_dict(required=False) == expected
+
+
+class TestStartupBenchmark:
+    """Time `import mt_metadata` and the first `to_dict` in a new process"""
+
+    script = (
+        "import time\n"
+        "t0 = time.perf_counter()\n"
+        "import mt_metadata\n"
+        "t1 = time.perf_counter()\n"
+        "from mt_metadata.timeseries import Station\n"
+        "t2 = time.perf_counter()\n"
+        "Station().to_dict()\n"
+        "t3 = time.perf_counter()\n"
+        "print(t1 - t0, t2 - t1, t3 - t2)\n"
+    )
+
+    def _run(self, cache_dir):
+        env = dict(os.environ, MT_METADATA_CACHE_DIR=str(cache_dir))
+        result = subprocess.run(
+            [sys.executable, "-c", self.script],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return [float(value) for value in result.stdout.split()[-3:]]
+
+    def test_new_process_writes_one_cache_file(self, tmp_path):
+        self._run(tmp_path)
+        self._run(tmp_path)
+        assert len(_cache_files(tmp_path)) == 1
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    def test_cold_and_warm_start(self, tmp_path):
+        cold = self._run(tmp_path)
+        warm = self._run(tmp_path)
+        assert warm[2] <= cold[2]
@@ -0,0 +1,151 @@
+"""
+Tests for MetadataBase.fingerprint
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.timeseries import Electric, Experiment, Run
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+@pytest.fixture(scope="module")
+def experiment():
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+    return ex
+
+
+@pytest.fixture
+def station(experiment):
+    return experiment.surveys[0].stations[0].copy()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestFingerprint:
+    """Fingerprints follow the content of the object"""
+
+    def test_equal_objects(self, station):
+        other = station.copy()
+        assert other is not station
+        assert station.fingerprint() == other.fingerprint()
+        assert isinstance(station.fingerprint(), str)
+
+    def test_class_is_hashed(self):
+        assert Electric().fingerprint() != Run().fingerprint()
+
+    def test_assignment_invalidates(self, station):
+        original = station.fingerprint()
+        latitude = station.location.latitude
+        station.location.latitude = 10.5
+        assert station.fingerprint() != original
+        station.location.latitude = latitude
+        assert station.fingerprint() == original
+
+    def test_scalar_assignment_invalidates(self):
+        electric = Electric(component="ex")
+        original = electric.fingerprint()
+        electric.component = "ey"
+        assert electric.fingerprint() != original
+
+    def test_list_mutation(self):
+        run = Run()
+        run.channels_recorded_auxiliary = ["temperature"]
+        original = run.fingerprint()
+        run.channels_recorded_auxiliary.append("battery")
+        assert run.fingerprint() != original
+
+    def test_array_values(self):
+        electric = Electric()
+        electric.new_array = np.arange(4)
+        original = electric.fingerprint()
+        electric.new_array[0] = 10
+        assert electric.fingerprint() != original
+
+    def test_skip_equals(self, station):
+        other = station.copy()
+        other.provenance.creation_time = "2000-01-01T00:00:00"
+        assert station.fingerprint() == other.fingerprint()
+        assert station.fingerprint([]) != other.fingerprint([])
+
+    def test_runs_not_included(self, station):
+        other = station.copy()
+        other.runs[0].id = "changed"
+        # same as to_dict, child collections are not compared
+        assert station.fingerprint() == other.fingerprint()
+        assert station.runs[0].fingerprint() != other.runs[0].fingerprint()
+
+    def test_copy_update(self):
+        electric = Electric(component="ex")
+        electric.fingerprint()
+        other = electric.copy(update={"component": "ey"})
+        assert other.fingerprint() != electric.fingerprint()
+
+    def test_from_dict_bulk(self):
+        electric = Electric(component="ex")
+        original = electric.fingerprint()
+        electric.from_dict({"component": "ey"}, mode="bulk")
+        assert electric.fingerprint() != original
+
+    def test_deferred_validation(self):
+        electric = Electric(component="ex")
+        original = electric.fingerprint()
+        with electric.deferred_validation():
+            electric.component = "ey"
+        assert electric.fingerprint() != original
+        assert electric.fingerprint() == Electric(component="ey").fingerprint()
+
+    def test_dict_key(self, experiment):
+        stations = {}
+        for survey in experiment.surveys:
+            for station in survey.stations:
+                stations.setdefault(station.fingerprint(), station)
+                stations.setdefault(station.copy().fingerprint(), station)
+        assert len(stations) == len(experiment.surveys[0].stations)
+
+
+class TestFingerprintEquality:
+    """__eq__ short circuits on the fingerprint"""
+
+    def test_equal(self, station):
+        assert station == station.copy()
+
+    def test_not_equal(self, station):
+        other = station.copy()
+        other.location.latitude = 10.5
+        assert station != other
+
+    def test_update_equal_is_noop(self, station):
+        other = station.copy()
+        station.update(other)
+        assert station == other
+
+
+class TestFingerprintPerformance:
+    """Time the fingerprint against to_dict based equality"""
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    def test_equality_timing(self, station):
+        other = station.copy()
+        n_loops = 50
+        start = time.perf_counter()
+        for _ in range(n_loops):
+            station.to_dict(single=True, required=False) == other.to_dict(
+                single=True, required=False
+            )
+        to_dict_time = (time.perf_counter() - start) / n_loops
+
+        start = time.perf_counter()
+        for _ in range(n_loops):
+            station.fingerprint() == other.fingerprint()
+        fingerprint_time = (time.perf_counter() - start) / n_loops
+
+        assert station == other
+        assert fingerprint_time < to_dict_time
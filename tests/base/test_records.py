@@ -0,0 +1,97 @@
+"""
+Tests for array-backed metadata records
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata.base.records import get_record_fields, to_records
+from mt_metadata.common.list_dict import ListDict
+from mt_metadata.timeseries import Electric, Magnetic, Run
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+@pytest.fixture
+def channels():
+    ex = Electric(component="ex", sample_rate=256, dipole_length=50.5)
+    ex.time_period.start = "2020-01-01T00:00:00+00:00"
+    ex.time_period.end = "2020-01-02T00:00:00+00:00"
+    hx = Magnetic(component="hx", sample_rate=1)
+    hx.location.latitude = 40.0
+    return [ex, hx]
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestToRecords:
+    """Objects are written as structured arrays"""
+
+    def test_single_object(self, channels):
+        records = channels[0].to_records()
+        assert records.shape == (1,)
+        assert set(records.dtype.names) == set(get_record_fields([channels[0]]))
+
+    def test_dtypes(self, channels):
+        records = to_records(
+            channels, ["component", "sample_rate", "time_period.start"]
+        )
+        assert records.dtype["component"].kind == "U"
+        assert records.dtype["sample_rate"] == np.float64
+        assert records.dtype["time_period.start"] == np.dtype("M8[ns]")
+        assert records["time_period.start"][0] == np.datetime64("2020-01-01")
+
+    def test_read_only(self, channels):
+        records = to_records(channels, ["component"])
+        with pytest.raises(ValueError):
+            records["component"][0] = "ey"
+
+    def test_mixed_classes(self, channels):
+        records = to_records(channels)
+        assert np.isnan(records["dipole_length"][1])
+        assert records["dipole_length"][0] == 50.5
+        assert records["sensor.id"][0] == ""
+
+    def test_vector_filter(self, channels):
+        records = to_records(channels * 100, ["component", "sample_rate"])
+        fast = records[records["sample_rate"] > 10]
+        assert len(fast) == 100
+        assert (fast["component"] == "ex").all()
+
+    def test_collections_skipped(self):
+        run = Run(id="001")
+        run.add_channel(Electric(component="ex"))
+        records = run.to_records()
+        assert "channels" not in records.dtype.names
+        assert records["id"][0] == "001"
+
+
+class TestFromRecords:
+    """Objects can be recreated from records"""
+
+    def test_round_trip(self, channels):
+        records = to_records(channels[:1])
+        ex = Electric.from_records(records)[0]
+        assert ex.component == "ex"
+        assert ex.dipole_length == 50.5
+        assert ex.time_period.start == channels[0].time_period.start
+        assert ex.time_period.end == channels[0].time_period.end
+
+    def test_single_row(self, channels):
+        records = to_records(channels)
+        hx = Magnetic.from_records(records[1])[0]
+        assert hx.component == "hx"
+        assert hx.location.latitude == 40.0
+
+    def test_list_dict(self, channels):
+        list_dict = ListDict()
+        for channel in channels:
+            list_dict.append(channel)
+        records = list_dict.to_records(["component", "sample_rate"])
+        assert records["component"].tolist() == ["ex", "hx"]
+
+        electrics = ListDict.from_records(records[:1], Electric)
+        assert electrics.keys() == ["ex"]
+        assert electrics["ex"].sample_rate == 256
@@ -0,0 +1,287 @@
+"""
+Tests for the compiled serialization plans in mt_metadata.base.serialization
+
+The reference implementation below is the per-attribute walk that
+`MetadataBase.to_dict` used before plans were compiled.  It is used as the
+oracle for byte-identical output and as the baseline for the benchmark.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from enum import Enum
+from operator import itemgetter
+
+import numpy as np
+import pytest
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.base import helpers
+from mt_metadata.base.serialization import (
+    clear_serialization_plans,
+    get_serialization_plan,
+    SerializationPlan,
+)
+from mt_metadata.timeseries import Electric, Experiment, Magnetic, Run, Station
+from mt_metadata.timeseries.filters import PoleZeroFilter
+from mt_metadata.utils.validators import validate_name
+
+
+# =============================================================================
+# Reference implementation
+# =============================================================================
+def _simple_comment(obj):
+    return (
+        obj.value is not None
+        and isinstance(obj.value, str)
+        and obj.author in (None, "")
+        and (
+            obj.time_stamp is None or str(obj.time_stamp) == "1980-01-01T00:00:00+00:00"
+        )
+    )
+
+
+def reference_to_dict(obj, nested=False, single=False, required=True):
+    """Per-attribute walk used by MetadataBase.to_dict before plans."""
+    empty = [None, "1980-01-01T00:00:00+00:00", "1980", [], ""]
+    fields = obj.get_all_fields()
+    required_fields = [k for k, v in fields.items() if v.get("required", False)]
+    meta_dict = {}
+    processed = set()
+    for name in sorted(fields.keys()):
+        if ".value" in name and name.replace(".value", "") not in processed:
+            base = name.replace(".value", "")
+            try:
+                comment = obj.get_attr_from_name(base)
+                if comment.__class__.__name__ == "Comment":
+                    if _simple_comment(comment) and not nested:
+                        if not required or comment.value not in empty:
+                            meta_dict[base] = str(comment.value)
+                        processed.add(base)
+                        continue
+            except (AttributeError, KeyError):
+                pass
+        if any(name.startswith(p + ".") for p in processed):
+            continue
+        try:
+            value = obj.get_attr_from_name(name)
+            if value.__class__.__name__ == "Comment":
+                if _simple_comment(value) and not nested:
+                    value = str(value.value)
+                else:
+                    value = value.to_dict(nested=nested, required=required)
+            elif hasattr(value, "to_dict"):
+                value = value.to_dict(nested=nested, required=required)
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    if hasattr(item, "to_dict"):
+                        value[key] = item.to_dict(nested=nested, required=required)
+                    elif isinstance(item, Enum):
+                        value[key] = item.value
+            elif isinstance(value, list):
+                value = [
+                    (
+                        item.to_dict(nested=nested, required=required)
+                        if hasattr(item, "to_dict")
+                        else item.value
+                        if isinstance(item, Enum)
+                        else item
+                    )
+                    for item in value
+                ]
+            elif isinstance(value, Enum):
+                value = value.value
+            elif hasattr(value, "unicode_string"):
+                value = value.unicode_string()
+        except AttributeError:
+            value = None
+        if required:
+            if isinstance(value, np.ndarray):
+                if name in ("zeros", "poles") or value.all() != 0:
+                    meta_dict[name] = value
+            elif hasattr(value, "size"):
+                if value.size > 0:
+                    meta_dict[name] = value
+            elif (
+                value not in empty
+                or name in required_fields
+                or helpers._should_include_coordinate_field(name)
+                or helpers._should_convert_none_to_empty_string(name)
+            ):
+                if helpers._should_include_coordinate_field(name) and value is None:
+                    value = 0.0
+                elif (
+                    helpers._should_convert_none_to_empty_string(name) and value is None
+                ):
+                    value = ""
+                meta_dict[name] = value
+        else:
+            meta_dict[name] = value
+    if nested:
+        meta_dict = helpers.structure_dict(meta_dict)
+    meta_dict = {
+        validate_name(obj.__class__.__name__): OrderedDict(
+            sorted(meta_dict.items(), key=itemgetter(0))
+        )
+    }
+    if single:
+        meta_dict = meta_dict[list(meta_dict.keys())[0]]
+    return meta_dict
+
+
+def _dumps(value):
+    return json.dumps(value, cls=helpers.NumpyEncoder)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+@pytest.fixture(scope="module")
+def experiment():
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+    return ex
+
+
+@pytest.fixture
+def populated_station():
+    station = Station(id="mt01")
+    station.location.latitude = 40.1
+    station.location.longitude = -120.5
+    station.comments = "simple comment"
+    station.provenance.comments = "author | needs author"
+    station.acquired_by.author = "me"
+    station.run_list = ["a", "b"]
+    return station
+
+
+@pytest.fixture
+def pole_zero_filter():
+    return PoleZeroFilter(
+        name="pz", zeros=[0j, 0j], poles=[-1 + 1j, -1 - 1j], normalization_factor=2.0
+    )
+
+
+def _all_objects(experiment):
+    for survey in experiment.surveys:
+        yield survey
+        for station in survey.stations:
+            yield station
+            for run in station.runs:
+                yield run
+                for channel in run.channels:
+                    yield channel
+        for f in survey.filters.values():
+            yield f
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+class TestSerializationPlan:
+    """Test compilation and caching of plans"""
+
+    def test_plan_is_cached_per_class(self):
+        assert get_serialization_plan(Electric) is get_serialization_plan(Electric())
+        assert get_serialization_plan(Electric) is not get_serialization_plan(Magnetic)
+
+    def test_clear_plans(self):
+        plan = get_serialization_plan(Station)
+        clear_serialization_plans()
+        assert get_serialization_plan(Station) is not plan
+
+    def test_plan_attributes(self):
+        plan = get_serialization_plan(Station)
+        assert isinstance(plan, SerializationPlan)
+        assert plan.class_name == "station"
+        assert list(plan.attribute_names) == sorted(plan.field_map.keys())
+        assert [f.name for f in plan.fields] == list(plan.attribute_names)
+        assert set(plan.required_fields) <= set(plan.attribute_names)
+
+    def test_attribute_list_from_plan(self):
+        station = Station()
+        assert station.get_attribute_list() == list(
+            get_serialization_plan(Station).attribute_names
+        )
+        # returned list is a copy
+        station.get_attribute_list().append("bad")
+        assert "bad" not in station.get_attribute_list()
+
+
+class TestSerializationPlanOutput:
+    """Compiled output must match the reference walk byte for byte"""
+
+    @pytest.mark.parametrize("nested", [True, False])
+    @pytest.mark.parametrize("required", [True, False])
+    @pytest.mark.parametrize("single", [True, False])
+    def test_default_objects(self, nested, required, single):
+        for obj in (Electric(), Magnetic(), Station(), Run()):
+            assert _dumps(
+                obj.to_dict(nested=nested, required=required, single=single)
+            ) == _dumps(
+                reference_to_dict(obj, nested=nested, required=required, single=single)
+            )
+
+    @pytest.mark.parametrize("nested", [True, False])
+    @pytest.mark.parametrize("required", [True, False])
+    def test_populated_station(self, populated_station, nested, required):
+        assert _dumps(
+            populated_station.to_dict(nested=nested, required=required)
+        ) == _dumps(
+            reference_to_dict(populated_station, nested=nested, required=required)
+        )
+
+    @pytest.mark.parametrize("required", [True, False])
+    def test_simple_comment(self, populated_station, required):
+        result = populated_station.to_dict(single=True, required=required)
+        assert result["comments"] == "simple comment"
+        assert "comments.value" not in result
+
+    def test_arrays(self, pole_zero_filter):
+        for required in (True, False):
+            assert _dumps(pole_zero_filter.to_dict(required=required)) == _dumps(
+                reference_to_dict(pole_zero_filter, required=required)
+            )
+
+    @pytest.mark.parametrize("required", [True, False])
+    def test_experiment_objects(self, experiment, required):
+        for obj in _all_objects(experiment):
+            assert _dumps(obj.to_dict(required=required)) == _dumps(
+                reference_to_dict(obj, required=required)
+            )
+
+    def test_to_json_and_xml(self, populated_station):
+        assert populated_station.to_json() == json.dumps(
+            reference_to_dict(populated_station),
+            cls=helpers.NumpyEncoder,
+            indent=" " * 4,
+        )
+        assert populated_station.to_xml(string=True) == helpers.element_to_string(
+            helpers.dict_to_xml(
+                reference_to_dict(populated_station, nested=True),
+                populated_station.get_all_fields(),
+            )
+        )
+
+
+class TestSerializationPlanPerformance:
+    """Benchmark the compiled plan against the reference walk"""
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    @pytest.mark.parametrize("metadata_class", [Electric, Magnetic, Station])
+    def test_to_dict_speedup(self, metadata_class):
+        obj = metadata_class()
+        obj.to_dict()
+        n_loops = 50
+
+        start = time.perf_counter()
+        for _ in range(n_loops):
+            reference_to_dict(obj)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n_loops):
+            obj.to_dict()
+        compiled_time = time.perf_counter() - start
+
+        assert compiled_time < reference_time
@@ -0,0 +1,76 @@
+"""
+Import-time regression tests
+
+Each check runs in a fresh interpreter so nothing is already imported.  The
+default budget is generous enough for CI machines and catches imports that
+grow by seconds, e.g. an eager import of a heavy dependency.  Set
+MT_METADATA_IMPORT_BUDGET (seconds) to check a tighter budget locally.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET = float(os.environ.get("MT_METADATA_IMPORT_BUDGET", "5.0"))
+HEAVY_MODULES = [
+    "scipy.signal",
+    "scipy.interpolate",
+    "matplotlib",
+    "xarray",
+    "pyproj",
+    "obspy",
+]
+
+
+def _run(statement, n_runs=3):
+    """
+    Run `statement` in new interpreters, return the fastest import time and
+    the heavy modules it loaded.
+    """
+    script = (
+        "import json, sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - t0\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'time': elapsed, 'heavy': heavy}))\n"
+    )
+    results = []
+    for _ in range(n_runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(r["time"] for r in results), results[0]["heavy"]
+
+
+class TestImportTime:
+    """Importing the metadata classes should not load heavy dependencies"""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import mt_metadata",
+            "from mt_metadata.timeseries import Station",
+            "from mt_metadata.timeseries import Station; Station().to_dict()",
+            "import mt_metadata.transfer_functions",
+        ],
+    )
+    def test_no_heavy_imports(self, statement):
+        _, heavy = _run(statement, n_runs=1)
+        assert heavy == []
+
+    def test_transfer_function_is_lazy(self):
+        _, heavy = _run("import mt_metadata.transfer_functions as tf; tf.TF", n_runs=1)
+        assert "xarray" in heavy
+
+    @pytest.mark.performance
+    def test_station_import_budget(self):
+        elapsed, _ = _run("from mt_metadata.timeseries import Station")
+        assert elapsed < IMPORT_BUDGET
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the columnar (Arrow/Parquet) Experiment tables
+
+:license: MIT
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.timeseries import Experiment
+from mt_metadata.timeseries.columnar import LEVELS, read_parquet
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(scope="module")
+def experiment():
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+    return ex
+
+
+@pytest.fixture(scope="module")
+def archive(experiment, tmp_path_factory):
+    return experiment.to_parquet(tmp_path_factory.mktemp("archive"))
+
+
+def test_tables(experiment):
+    tables = experiment.to_arrow()
+    assert set(tables.keys()) == set(LEVELS)
+    n_channels = sum(
+        len(run.channels)
+        for survey in experiment.surveys
+        for station in survey.stations
+        for run in station.runs
+    )
+    assert tables["channel"].num_rows == n_channels
+    assert "sample_rate" in tables["channel"].column_names
+    assert "location.latitude" in tables["station"].column_names
+
+
+def test_arrow_round_trip(experiment):
+    ex = Experiment()
+    ex.from_arrow(experiment.to_arrow())
+    assert ex.surveys.keys() == experiment.surveys.keys()
+    for survey, original in zip(ex.surveys, experiment.surveys):
+        assert survey == original
+        assert survey.filters.keys() == original.filters.keys()
+        for key, mt_filter in survey.filters.items():
+            assert mt_filter == original.filters[key]
+        for station, original_station in zip(survey.stations, original.stations):
+            assert station == original_station
+            for run, original_run in zip(station.runs, original_station.runs):
+                assert run == original_run
+                assert run.channels.keys() == original_run.channels.keys()
+                for channel, original_channel in zip(
+                    run.channels, original_run.channels
+                ):
+                    assert channel == original_channel
+
+
+def test_complex_poles(experiment):
+    tables = experiment.to_arrow()
+    ex = Experiment()
+    ex.from_arrow(tables)
+    for key, mt_filter in experiment.surveys[0].filters.items():
+        if hasattr(mt_filter, "poles"):
+            assert np.allclose(mt_filter.poles, ex.surveys[0].filters[key].poles)
+
+
+def test_read_parquet_pushdown(archive):
+    table = read_parquet(
+        archive,
+        "channel",
+        columns=["_station", "component", "sample_rate"],
+        filters=[("_class", "==", "Magnetic"), ("sample_rate", ">=", 1)],
+    )
+    assert table.column_names == ["_station", "component", "sample_rate"]
+    assert table.num_rows > 0
+    assert all(c.startswith("h") for c in table["component"].to_pylist())
+    assert all(sr >= 1 for sr in table["sample_rate"].to_pylist())
+
+
+def test_from_parquet_filters(experiment, archive):
+    ex = Experiment()
+    ex.from_parquet(archive, filters={"channel": [("_class", "==", "Magnetic")]})
+    for station in ex.surveys[0].stations:
+        for run in station.runs:
+            assert all(ch.type == "magnetic" for ch in run.channels)
+
+
+def test_bad_level(archive):
+    with pytest.raises(ValueError):
+        read_parquet(archive, "network")
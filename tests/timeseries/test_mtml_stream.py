@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the streaming MTML reader
+
+:license: MIT
+"""
+
+import json
+from xml.etree import cElementTree as et
+
+import pytest
+
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS
+from mt_metadata.base.helpers import NumpyEncoder
+from mt_metadata.timeseries import Experiment
+from mt_metadata.timeseries.mtml_stream import (
+    iter_runs,
+    iter_stations,
+    iter_surveys,
+    iter_xml,
+    write_xml,
+)
+
+
+@pytest.fixture(scope="module")
+def experiment():
+    """Experiment read from a parsed element, without streaming"""
+    ex = Experiment()
+    ex.from_xml(element=et.parse(MT_EXPERIMENT_MULTIPLE_RUNS).getroot())
+    return ex
+
+
+def to_json(experiment):
+    """Dictionary of an experiment as JSON, it can hold numpy arrays"""
+    return json.dumps(experiment.to_dict(), cls=NumpyEncoder)
+
+
+def channel_filter_names(experiment):
+    """Filter names of every channel in the experiment"""
+    return [
+        channel.filter_names
+        for survey in experiment.surveys
+        for station in survey.stations
+        for run in station.runs
+        for channel in run.channels
+    ]
+
+
+@pytest.fixture(scope="module")
+def station_ids(experiment):
+    return [station.id for station in experiment.surveys[0].stations]
+
+
+def test_from_xml_matches_element(experiment):
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS)
+    assert to_json(ex) == to_json(experiment)
+    assert ex.surveys[0].filters.keys() == experiment.surveys[0].filters.keys()
+
+
+def test_iter_surveys(experiment):
+    surveys = list(iter_surveys(MT_EXPERIMENT_MULTIPLE_RUNS))
+    assert len(surveys) == len(experiment.surveys)
+    assert surveys[0].stations.keys() == experiment.surveys[0].stations.keys()
+
+
+def test_iter_stations(experiment, station_ids):
+    items = list(iter_stations(MT_EXPERIMENT_MULTIPLE_RUNS))
+    assert sorted(station.id for _, station in items) == sorted(station_ids)
+    survey, station = items[0]
+    assert survey.id == experiment.surveys[0].id
+    assert survey.n_stations == 0
+    assert len(survey.filters) == len(experiment.surveys[0].filters)
+    original = experiment.surveys[0].stations[station.id]
+    assert set(station.runs.keys()) == set(original.runs.keys())
+
+
+def test_iter_runs(experiment):
+    n_runs = sum(station.n_runs for station in experiment.surveys[0].stations)
+    items = list(iter_runs(MT_EXPERIMENT_MULTIPLE_RUNS))
+    assert len(items) == n_runs
+    survey, station, run = items[0]
+    assert station.n_runs == 0
+    original = experiment.surveys[0].stations[station.id].runs[run.id]
+    assert set(run.channels.keys()) == set(original.channels.keys())
+
+
+def test_station_filter(station_ids):
+    items = list(iter_stations(MT_EXPERIMENT_MULTIPLE_RUNS, stations=station_ids[:1]))
+    assert [station.id for _, station in items] == station_ids[:1]
+
+    ex = Experiment()
+    ex.from_xml(fn=MT_EXPERIMENT_MULTIPLE_RUNS, stations=station_ids[:1])
+    assert ex.surveys[0].stations.keys() == station_ids[:1]
+
+
+def test_bad_level():
+    with pytest.raises(ValueError):
+        next(iter_xml(MT_EXPERIMENT_MULTIPLE_RUNS, level="channel"))
+
+
+def test_stream_write_matches_to_xml(experiment, tmp_path):
+    full_fn = tmp_path.joinpath("full.xml")
+    stream_fn = tmp_path.joinpath("stream.xml")
+    experiment.to_xml(fn=full_fn)
+    assert experiment.to_xml(fn=stream_fn, stream=True) is None
+    assert stream_fn.read_text() == full_fn.read_text()
+
+
+def test_stream_write_round_trip(experiment, tmp_path):
+    fn = tmp_path.joinpath("stream.xml")
+    write_xml(experiment, fn)
+    ex = Experiment()
+    ex.from_xml(fn=fn)
+    assert to_json(ex) == to_json(experiment)
+
+
+@pytest.mark.parametrize("from_element", [False, True])
+def test_write_keeps_channel_filters(experiment, tmp_path, from_element):
+    fn = tmp_path.joinpath("stream.xml")
+    write_xml(experiment, fn)
+    ex = Experiment()
+    if from_element:
+        ex.from_xml(element=et.parse(fn).getroot())
+    else:
+        ex.from_xml(fn=fn)
+    expected = channel_filter_names(experiment)
+    assert any(expected)
+    assert channel_filter_names(ex) == expected
+
+
+def test_stream_write_needs_fn(experiment):
+    with pytest.raises(ValueError):
+        experiment.to_xml(stream=True)
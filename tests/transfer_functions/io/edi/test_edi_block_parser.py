@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Check the block parser of EDI._read_mt against the per-token parser it
+replaced on every EDI file shipped with mt_metadata.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG
+from mt_metadata.transfer_functions.io.edi import EDI
+
+EDI_FILES = sorted(TF_EDI_CGG.parent.glob("*.edi"))
+
+
+def legacy_read_mt(edi_obj, data_lines):
+    """Per-token parser used before block parsing"""
+    data_dict = {}
+    data_find = False
+    for line in data_lines:
+        line = line.strip()
+        if ">" in line and "!" not in line:
+            line_list = line[1:].strip().split()
+            if len(line_list) == 0:
+                continue
+            key = line_list[0].lower()
+            if key in edi_obj._accepted_keys:
+                data_find = True
+                data_dict[key] = []
+            else:
+                data_find = False
+        elif data_find and ">" not in line and "!" not in line:
+            d_lines = line.strip().split()
+            for ii, dd in enumerate(d_lines):
+                try:
+                    d_lines[ii] = float(dd)
+                    if d_lines[ii] == edi_obj.Header.empty:
+                        d_lines[ii] = 0.0
+                except ValueError:
+                    d_lines[ii] = 0.0
+            data_dict[key] += d_lines
+    return {key: np.array(values) for key, values in data_dict.items()}
+
+
+@pytest.mark.parametrize("fn", EDI_FILES, ids=[fn.name for fn in EDI_FILES])
+def test_block_parser_matches_legacy(fn):
+    edi_obj = EDI(fn=fn)
+    if edi_obj.Data._data_type_in != "z":
+        pytest.skip("spectra EDI")
+    expected = legacy_read_mt(edi_obj, edi_obj._edi_lines[edi_obj.Data._line_num :])
+    assert edi_obj.data_dict.keys() == expected.keys()
+    for key, values in expected.items():
+        assert edi_obj.data_dict[key].dtype == values.dtype
+        assert np.array_equal(edi_obj.data_dict[key], values), key
+
+
+def test_null_markers():
+    edi_obj = EDI()
+    values = edi_obj._block_to_array(
+        ["1.0 ****** 2.5", f"{edi_obj.Header.empty:.6e} nan 3"]
+    )
+    assert np.array_equal(values[:3], [1.0, 0.0, 2.5])
+    assert values[3] == 0.0
+    assert np.isnan(values[4])
+    assert values[5] == 3.0
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Check the line-at-a-time block writer of EDI._write_data_block against the
+per-value writer it replaced.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_EDI_SPECTRA
+from mt_metadata.transfer_functions.core import TF
+from mt_metadata.transfer_functions.io.edi import EDI
+
+
+def legacy_write_data_block(edi_obj, data_comp_arr, data_key):
+    """Per-value data lines written before line formatting"""
+    block_lines = []
+    for d_index, d_comp in enumerate(data_comp_arr, 1):
+        if d_comp == 0.0 and data_key.lower() not in ["zrot", "trot"]:
+            d_comp = edi_obj.Header.empty
+        num_str = "{0:{1}}".format(d_comp, edi_obj._num_format)
+        if d_index % edi_obj._block_len == 0:
+            num_str += "\n"
+        if d_index == data_comp_arr.size:
+            num_str += "\n"
+        block_lines.append(num_str)
+    return "".join(block_lines)
+
+
+@pytest.fixture(scope="module", params=[TF_EDI_CGG, TF_EDI_SPECTRA])
+def edi_obj(request):
+    return EDI(fn=request.param)
+
+
+@pytest.mark.parametrize("n_values", [0, 1, 5, 6, 7, 12, 13])
+@pytest.mark.parametrize("data_key", ["freq", "zrot", "zxxr", "txr.exp"])
+def test_block_matches_legacy(n_values, data_key):
+    edi_obj = EDI()
+    values = np.linspace(-1, 1, n_values) * 1e3
+    values[::3] = 0.0
+    lines = edi_obj._write_data_block(values, data_key)
+    assert lines[0].startswith(f">{data_key.upper()}")
+    assert "".join(lines[1:]) == legacy_write_data_block(edi_obj, values, data_key)
+
+
+def test_file_data_blocks(edi_obj):
+    for values, data_key in [
+        (edi_obj.frequency, "freq"),
+        (edi_obj.z[:, 0, 1].real, "zxyr"),
+        (edi_obj.z_err[:, 1, 0] ** 2, "zyx.var"),
+        (edi_obj.t[:, 0, 0].imag, "txi.exp"),
+    ]:
+        lines = edi_obj._write_data_block(values, data_key)
+        assert "".join(lines[1:]) == legacy_write_data_block(edi_obj, values, data_key)
+
+
+@pytest.mark.parametrize("fn", [TF_EDI_CGG, TF_EDI_SPECTRA])
+def test_write_round_trip(fn, tmp_path):
+    # write through TF.to_edi, the same as TF.write
+    tf_obj = TF(fn=fn)
+    tf_obj.read()
+    edi_obj = tf_obj.to_edi()
+    new_edi = EDI(fn=edi_obj.write(tmp_path.joinpath("round_trip.edi")))
+    assert np.allclose(new_edi.frequency, edi_obj.frequency, rtol=1e-6)
+    assert np.allclose(new_edi.z, edi_obj.z, rtol=1e-6, equal_nan=True)
+    assert np.allclose(new_edi.t, edi_obj.t, rtol=1e-6, equal_nan=True)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Check the vectorized spectra conversion of EDI._read_spectra against the
+per-frequency loop it replaced, and benchmark the two on a spectra EDI scaled
+to many frequencies.
+"""
+
+import time
+from re import search, sub
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_SPECTRA
+from mt_metadata.transfer_functions.io.edi import EDI
+from mt_metadata.transfer_functions.io.tools import index_locator
+
+COMP_LIST = ["hx", "hy", "hz", "ex", "ey", "rhx", "rhy"]
+
+
+def legacy_read_spectra(edi_obj, data_lines, comp_list):
+    """Per-frequency conversion used before vectorization (tipper + electric)"""
+    data_dict = {}
+    avgt_dict = {}
+    key = None
+    for line in data_lines:
+        if line.lower().startswith(">spectra"):
+            key = float(search(r"FREQ=\s*(\S+)", line).group(1))
+            avgt_dict[key] = float(search(r"AVGT=\s*(\S+)", line).group(1))
+            data_dict[key] = []
+        elif line.startswith(">"):
+            key = None
+        elif key is not None and line.strip():
+            data_dict[key] += [float(ll) for ll in line.split()]
+
+    cc = index_locator(comp_list)
+    frequency = np.array(sorted(data_dict.keys(), reverse=True))
+    tf_arr = np.zeros((frequency.size, cc.n_outputs, cc.n_inputs), dtype=complex)
+    tf_err_arr = np.zeros_like(tf_arr, dtype=float)
+    sig_arr = np.zeros((frequency.size, cc.n_inputs, cc.n_inputs), dtype=complex)
+    res_arr = np.zeros((frequency.size, cc.n_outputs, cc.n_outputs), dtype=complex)
+    outputs = [cc.ex, cc.ey, cc.hz]
+    for kk, key in enumerate(frequency):
+        spectra_arr = np.reshape(
+            np.array(data_dict[key]), (len(comp_list), len(comp_list))
+        )
+        s_arr = np.zeros_like(spectra_arr, dtype=complex)
+        for ii in range(s_arr.shape[0]):
+            for jj in range(ii, s_arr.shape[0]):
+                if ii == jj:
+                    s_arr[ii, jj] = spectra_arr[ii, jj]
+                else:
+                    s_arr[ii, jj] = complex(spectra_arr[jj, ii], -spectra_arr[ii, jj])
+                    s_arr[jj, ii] = complex(spectra_arr[jj, ii], spectra_arr[ii, jj])
+        s_arr[s_arr == 0] = np.nan
+        s_arr[s_arr == edi_obj.Header.empty] = np.nan
+
+        rh = np.array([[s_arr[r, h] for h in (cc.hx, cc.hy)] for r in (cc.rhx, cc.rhy)])
+        rr = np.array(
+            [[s_arr[r, c] for c in (cc.rhx, cc.rhy)] for r in (cc.rhx, cc.rhy)]
+        )
+        hh = np.array([[s_arr[r, c] for c in (cc.hx, cc.hy)] for r in (cc.hx, cc.hy)])
+        re = np.array([[s_arr[r, c] for c in outputs] for r in (cc.rhx, cc.rhy)])
+        he = np.array([[s_arr[r, c] for c in outputs] for r in (cc.hx, cc.hy)])
+        ee = np.array([[s_arr[r, c] for c in outputs] for r in outputs])
+
+        tfh = np.matmul(np.linalg.inv(rh), re)
+        tf = tfh.conj().T
+        sig = np.matmul(np.linalg.inv(rh), np.matmul(rr, np.linalg.inv(rh.conj().T)))
+        res = (
+            ee
+            - np.matmul(tf, he)
+            - np.matmul(he.conj().T, tfh)
+            + np.matmul(tf, np.matmul(hh, tfh))
+        ) / avgt_dict[key]
+        variance = np.zeros((cc.n_outputs, cc.n_inputs), dtype=complex)
+        for nn in range(cc.n_outputs):
+            for mm in range(cc.n_inputs):
+                variance[nn, mm] = res[nn, nn] * sig[mm, mm]
+
+        tf_arr[kk] = tf
+        tf_err_arr[kk] = np.sqrt(np.abs(variance))
+        sig_arr[kk] = sig
+        res_arr[kk] = res
+    return frequency, tf_arr, tf_err_arr, sig_arr, res_arr
+
+
+def scale_spectra_lines(data_lines, n_copies):
+    """Repeat every spectra block with slightly shifted frequencies"""
+    blocks = []
+    for line in data_lines:
+        if line.lower().startswith(">spectra"):
+            blocks.append([line, []])
+        elif line.startswith(">"):
+            continue
+        elif blocks and line.strip():
+            blocks[-1][1].append(line)
+
+    lines = []
+    for ii in range(n_copies):
+        for header, block in blocks:
+            freq = float(search(r"FREQ=\s*(\S+)", header).group(1))
+            lines.append(
+                sub(
+                    r"FREQ=\s*\S+",
+                    f"FREQ= {freq * (1 + ii * 1e-3):.9E}",
+                    header,
+                )
+            )
+            lines += block
+    lines.append(">END")
+    return lines
+
+
+def drop_spectra_channel(data_lines, comp_list, channel):
+    """Remove the row and column of one channel from every spectra block"""
+    index = comp_list.index(channel)
+    n_comp = len(comp_list) - 1
+    lines = []
+    block = []
+    for line in data_lines + [">END"]:
+        if line.startswith(">") and block:
+            spectra = np.array(" ".join(block).split(), dtype=float)
+            spectra = spectra.reshape((n_comp + 1, n_comp + 1))
+            spectra = np.delete(np.delete(spectra, index, axis=0), index, axis=1)
+            lines += [" ".join(repr(float(value)) for value in row) for row in spectra]
+            block = []
+        if line.lower().startswith(">spectra"):
+            lines.append(sub(r"//\s*\d+", f"//{n_comp ** 2}", line))
+        elif not line.startswith(">") and line.strip():
+            block.append(line)
+    lines.append(">END")
+    return lines
+
+
+@pytest.fixture(scope="module")
+def spectra_lines():
+    edi_obj = EDI(fn=TF_EDI_SPECTRA)
+    return edi_obj._edi_lines[edi_obj.Data._line_num :]
+
+
+def assert_matches_legacy(edi_obj, expected):
+    frequency, tf, tf_err, sig, res = expected
+    assert np.array_equal(edi_obj.frequency, frequency)
+    assert np.allclose(edi_obj.tf, tf, rtol=1e-12, equal_nan=True)
+    assert np.allclose(edi_obj.tf_err, tf_err, rtol=1e-12, equal_nan=True)
+    assert np.allclose(edi_obj.signal_inverse_power, sig, rtol=1e-12, equal_nan=True)
+    assert np.allclose(edi_obj.residual_covariance, res, rtol=1e-12, equal_nan=True)
+
+
+def test_matches_legacy(spectra_lines):
+    edi_obj = EDI()
+    edi_obj._read_spectra(spectra_lines, comp_list=COMP_LIST)
+    assert_matches_legacy(
+        edi_obj, legacy_read_spectra(edi_obj, spectra_lines, COMP_LIST)
+    )
+    assert np.allclose(edi_obj.z, edi_obj.tf[:, 0:2, :], equal_nan=True)
+    assert np.allclose(edi_obj.t, edi_obj.tf[:, 2:3, :], equal_nan=True)
+
+
+def test_empty_spectra():
+    edi_obj = EDI()
+    edi_obj._read_spectra([">END"], comp_list=COMP_LIST)
+    assert edi_obj.frequency.size == 0
+    assert edi_obj.z.shape == (0, 2, 2)
+    assert edi_obj.tf.shape == (0, 3, 2)
+
+
+def test_matches_legacy_many_frequencies(spectra_lines):
+    lines = scale_spectra_lines(spectra_lines, 30)
+    expected = legacy_read_spectra(EDI(), lines, COMP_LIST)
+    edi_obj = EDI()
+    edi_obj._read_spectra(lines, comp_list=COMP_LIST)
+    assert_matches_legacy(edi_obj, expected)
+
+
+def test_no_tipper(spectra_lines):
+    """
+    Without Hz the impedance only depends on the electric and magnetic cross
+    powers, so it has to match the impedance read with Hz.  The loop this
+    replaced filled re[1, 0] and he[0, 1] twice and left re[1, 1] and
+    he[1, 0] empty in this case.
+    """
+    full = EDI()
+    full._read_spectra(spectra_lines, comp_list=COMP_LIST)
+    comp_list = [comp for comp in COMP_LIST if comp != "hz"]
+    edi_obj = EDI()
+    edi_obj._read_spectra(
+        drop_spectra_channel(spectra_lines, COMP_LIST, "hz"), comp_list=comp_list
+    )
+
+    assert np.array_equal(edi_obj.frequency, full.frequency)
+    assert edi_obj.tf.shape == (full.frequency.size, 2, 2)
+    assert np.allclose(edi_obj.z, full.z, rtol=1e-12, equal_nan=True)
+    assert np.allclose(
+        edi_obj.residual_covariance,
+        full.residual_covariance[:, 0:2, 0:2],
+        rtol=1e-12,
+        equal_nan=True,
+    )
+    assert not np.any(edi_obj.t)
+
+
+class TestSpectraPerformance:
+    """Benchmark the vectorized conversion against the per-frequency loop"""
+
+    @pytest.mark.skip("Performance tests are not run by default")
+    def test_read_spectra_speedup(self, spectra_lines):
+        lines = scale_spectra_lines(spectra_lines, 30)
+        edi_obj = EDI()
+
+        start = time.perf_counter()
+        legacy_read_spectra(edi_obj, lines, COMP_LIST)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        edi_obj._read_spectra(lines, comp_list=COMP_LIST)
+        vectorized_time = time.perf_counter() - start
+
+        assert vectorized_time < reference_time
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Check that the <Data> section read straight from the element tree matches
+the dictionary based reader, and that the array based writer matches the
+per-value writer.
+"""
+
+from xml.etree import cElementTree as et
+
+import numpy as np
+import pytest
+
+from mt_metadata import (
+    TF_POOR_XML,
+    TF_XML,
+    TF_XML_COMPLETE_REMOTE_INFO,
+    TF_XML_MULTIPLE_ATTACHMENTS,
+    TF_XML_NO_SITE_LAYOUT,
+    TF_XML_WITH_DERIVED_QUANTITIES,
+)
+from mt_metadata.base import helpers
+from mt_metadata.transfer_functions.io.emtfxml import EMTFXML
+from mt_metadata.transfer_functions.io.emtfxml.metadata import (
+    helpers as emtf_helpers,
+)
+from mt_metadata.transfer_functions.io.emtfxml.metadata.data import TransferFunction
+
+XML_FILES = [
+    TF_XML,
+    TF_POOR_XML,
+    TF_XML_COMPLETE_REMOTE_INFO,
+    TF_XML_MULTIPLE_ATTACHMENTS,
+    TF_XML_NO_SITE_LAYOUT,
+    TF_XML_WITH_DERIVED_QUANTITIES,
+]
+
+
+def get_data_element(fn):
+    root = et.fromstring(fn.read_text(encoding="utf-8").replace("&", "and"))
+    for child in root:
+        if child.tag.lower() == "data":
+            return child
+
+
+def legacy_to_xml(tf):
+    """Per-value writer used before formatting whole arrays"""
+    root = et.Element("Data", {"count": f"{tf.n_periods:.0f}"})
+    for index in range(tf.period.size):
+        period_element = et.SubElement(
+            root,
+            "Period",
+            {"value": f"{tf.period[index]:.12e}", "units": "secs"},
+        )
+        for key in tf.array_dict.keys():
+            if tf.array_dict[key] is None or tf.array_dict[key].size == 0:
+                continue
+            arr = np.nan_to_num(tf.array_dict[key][index])
+            if arr.dtype == complex:
+                arr[np.where(arr == 0)] = 1e32 + 1e32j
+            else:
+                arr[np.where(arr == 0)] = 1e32
+            attr_dict = {
+                "type": tf._dtype_dict[arr.dtype.name],
+                "size": str(arr.shape)[1:-1].replace(",", ""),
+            }
+            if key in tf._units_dict:
+                attr_dict["units"] = tf._units_dict[key]
+            comp_element = et.SubElement(
+                period_element, key.replace("_", ".").upper(), attr_dict
+            )
+            idx_dict = tf._write_dict[key]
+            for ii in range(arr.shape[0]):
+                for jj in range(arr.shape[1]):
+                    ch_out = idx_dict["out"][ii]
+                    ch_in = idx_dict["in"][jj]
+                    a_dict = {}
+                    if ch_out + ch_in in tf._name_dict:
+                        a_dict["name"] = tf._name_dict[ch_out + ch_in].capitalize()
+                    a_dict["output"] = ch_out.capitalize()
+                    a_dict["input"] = ch_in.capitalize()
+                    ch_element = et.SubElement(comp_element, "value", a_dict)
+                    ch_value = f"{arr[ii, jj].real:.6e}"
+                    if attr_dict["type"] in ["complex"]:
+                        ch_value = f"{ch_value} {arr[ii, jj].imag:.6e}"
+                    ch_element.text = ch_value
+    return root
+
+
+@pytest.mark.parametrize("fn", XML_FILES, ids=[fn.name for fn in XML_FILES])
+def test_read_element_matches_read_dict(fn):
+    data_element = get_data_element(fn)
+    root_dict = emtf_helpers._convert_keys_to_lower_case(
+        {"data": helpers.element_to_dict(data_element)[data_element.tag]}
+    )
+    expected = TransferFunction()
+    expected.read_dict(root_dict)
+
+    tf = TransferFunction()
+    tf.read_element(get_data_element(fn))
+
+    assert np.array_equal(tf.period, expected.period)
+    for key, values in expected.array_dict.items():
+        assert np.array_equal(tf.array_dict[key], values, equal_nan=True), key
+
+
+@pytest.mark.parametrize("fn", XML_FILES, ids=[fn.name for fn in XML_FILES])
+def test_to_xml_matches_legacy(fn):
+    tf = EMTFXML(fn=fn).data
+    assert et.tostring(tf.to_xml()) == et.tostring(legacy_to_xml(tf))
+
+
+def test_write_block_single_period():
+    tf = EMTFXML(fn=TF_XML).data
+    parent = et.Element("Data")
+    tf.write_block(parent, 3)
+    expected = legacy_to_xml(tf)[3]
+    assert et.tostring(parent[0]) == et.tostring(expected)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Round trip transfer functions through netCDF and zarr archives.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_SPECTRA, TF_XML, TF_ZMM
+from mt_metadata.base.helpers import module_available
+from mt_metadata.transfer_functions.core import TF
+from mt_metadata.transfer_functions.io.netcdf.netcdf import (
+    survey_from_dict,
+    survey_to_dict,
+)
+
+TF_FILES = [TF_EDI_SPECTRA, TF_XML, TF_ZMM]
+FILE_TYPES = [
+    pytest.param(
+        "nc",
+        marks=pytest.mark.skipif(
+            not module_available("netCDF4"), reason="netCDF4 is not installed"
+        ),
+    ),
+    pytest.param(
+        "zarr",
+        marks=pytest.mark.skipif(
+            not module_available("zarr"), reason="zarr is not installed"
+        ),
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=TF_FILES, ids=[fn.name for fn in TF_FILES])
+def tf_obj(request):
+    tf = TF(fn=request.param)
+    tf.read()
+    return tf
+
+
+def test_survey_dict_round_trip(tf_obj):
+    survey = survey_from_dict(survey_to_dict(tf_obj.survey_metadata))
+    assert survey == tf_obj.survey_metadata
+
+
+@pytest.mark.parametrize("file_type", FILE_TYPES)
+def test_round_trip(tf_obj, file_type, tmp_path):
+    fn = tf_obj.write(fn=tmp_path.joinpath(f"{tf_obj.station}.{file_type}")).fn
+
+    new_tf = TF(fn=fn)
+    new_tf.read()
+    assert new_tf.survey_metadata == tf_obj.survey_metadata
+    assert new_tf.station_metadata == tf_obj.station_metadata
+    assert np.array_equal(new_tf.period, tf_obj.period)
+    for key in tf_obj.dataset.data_vars:
+        assert np.array_equal(
+            new_tf.dataset[key].data, tf_obj.dataset[key].data, equal_nan=True
+        ), key
+
+
+@pytest.mark.parametrize("file_type", FILE_TYPES)
+def test_metadata_only(tf_obj, file_type, tmp_path):
+    fn = tf_obj.write(fn=tmp_path.joinpath(f"{tf_obj.station}.{file_type}")).fn
+
+    summary = TF().peek(fn)
+    assert summary["id"] == tf_obj.station_metadata.id
+    assert summary["n_periods"] == tf_obj.period.size
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Check the single pass period block reader of ZMM against the per-block
+parser it replaced.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_ZMM, TF_ZSS_TIPPER
+from mt_metadata.transfer_functions.io.zfiles.zmm import ZMM, ZMMError
+
+
+def legacy_read_blocks(zmm_obj):
+    """Per-block parsing used before the single pass reader"""
+    with open(zmm_obj.fn, "r") as fid:
+        period_strings = fid.read().lower().split("period")[1:]
+
+    n_outputs = zmm_obj.num_channels - 2
+    n_periods = len(period_strings)
+    periods = np.zeros(n_periods)
+    tf = np.zeros((n_periods, n_outputs, 2), dtype=np.complex64)
+    sigma_s = np.zeros((n_periods, 2, 2), dtype=np.complex64)
+    sigma_e = np.zeros((n_periods, n_outputs, n_outputs), dtype=np.complex64)
+    decimation_dict = {}
+    for index, period_string in enumerate(period_strings):
+        period_block = period_string.split("\n")
+        period = float(period_block[0].strip().split(":")[1].split()[0].strip())
+        decimation_dict[f"{period:.10g}"] = {
+            "level": int(period_block[0].split("level")[1].split()[0]),
+            "bands": (
+                int(period_block[0].split("from")[1].split()[0]),
+                int(period_block[0].split("to")[1].split()[0]),
+            ),
+            "npts": int(period_block[1].split("point")[1].split()[0]),
+            "sample_rate": float(period_block[1].split("freq.")[1].split()[0]),
+        }
+        data_dict = {"tf": [], "sig": [], "res": []}
+        key = "tf"
+        for line in period_block[2:]:
+            if "transfer" in line:
+                key = "tf"
+                continue
+            elif "signal" in line:
+                key = "sig"
+                continue
+            elif "residual" in line:
+                key = "res"
+                continue
+            line_list = [float(xx) for xx in line.strip().split()]
+            data_dict[key].append(
+                [
+                    complex(line_list[ii], line_list[ii + 1])
+                    for ii in range(0, len(line_list), 2)
+                ]
+            )
+
+        periods[index] = period
+        tf_block = [item for sublist in data_dict["tf"] for item in sublist]
+        for kk, jj in enumerate(range(0, len(tf_block), 2)):
+            tf[index, kk, 0] = tf_block[jj]
+            tf[index, kk, 1] = tf_block[jj + 1]
+        sig_block = [item for sublist in data_dict["sig"] for item in sublist]
+        sigma_s[index, 0, 0] = sig_block[0]
+        sigma_s[index, 1, 0] = sig_block[1]
+        sigma_s[index, 0, 1] = sig_block[1].conjugate()
+        sigma_s[index, 1, 1] = sig_block[2]
+        for jj in range(n_outputs):
+            values = data_dict["res"][jj]
+            for kk in range(jj + 1):
+                sigma_e[index, jj, kk] = values[kk]
+                if jj != kk:
+                    sigma_e[index, kk, jj] = values[kk].conjugate()
+    return periods, tf, sigma_s, sigma_e, decimation_dict
+
+
+@pytest.mark.parametrize("fn", [TF_ZMM, TF_ZSS_TIPPER], ids=["zmm", "zss"])
+def test_matches_legacy(fn):
+    zmm_obj = ZMM(fn=fn)
+    periods, tf, sigma_s, sigma_e, decimation_dict = legacy_read_blocks(zmm_obj)
+    assert np.array_equal(zmm_obj.periods, periods)
+    assert np.array_equal(zmm_obj.transfer_functions, tf)
+    assert np.array_equal(zmm_obj.sigma_s, sigma_s)
+    assert np.array_equal(zmm_obj.sigma_e, sigma_e)
+    assert zmm_obj.decimation_dict == decimation_dict
+
+
+def test_truncated_file(tmp_path):
+    lines = TF_ZMM.read_text().rstrip().split("\n")
+    fn = tmp_path.joinpath("truncated.zmm")
+    fn.write_text("\n".join(lines[:-1]))
+    with pytest.raises(ZMMError):
+        ZMM(fn=fn)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Check the vectorized covariance to error computation against the element
+by element computation it replaced.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_SPECTRA, TF_XML, TF_ZMM
+from mt_metadata.transfer_functions.core import TF
+from mt_metadata.transfer_functions.io.tools import errors_from_covariance
+
+
+def legacy_errors(tf, outputs):
+    """Element by element errors used before errors_from_covariance"""
+    sigma_e = tf.dataset.residual_covariance.loc[dict(input=outputs, output=outputs)]
+    sigma_s = tf.dataset.inverse_signal_power.loc[dict(input=tf.hx_hy, output=tf.hx_hy)]
+    err = np.zeros((tf.period.size, len(outputs), 2), dtype=float)
+    for ii, ch_out in enumerate(outputs):
+        for jj, ch_in in enumerate(tf.hx_hy):
+            err[:, ii, jj] = np.abs(
+                sigma_e.loc[dict(input=[ch_out], output=[ch_out])].data.flatten()
+                * sigma_s.loc[dict(input=[ch_in], output=[ch_in])].data.flatten()
+            )
+    return np.sqrt(np.abs(err))
+
+
+def test_errors_from_covariance():
+    rng = np.random.default_rng(0)
+    residual = rng.normal(size=(7, 3)) + 1j * rng.normal(size=(7, 3))
+    signal = rng.normal(size=(7, 2))
+    err = errors_from_covariance(residual, signal)
+    assert err.shape == (7, 3, 2)
+    for ii in range(3):
+        for jj in range(2):
+            assert np.allclose(
+                err[:, ii, jj], np.sqrt(np.abs(residual[:, ii] * signal[:, jj]))
+            )
+
+
+@pytest.mark.parametrize(
+    "fn", [TF_EDI_SPECTRA, TF_XML, TF_ZMM], ids=["edi_spectra", "xml", "zmm"]
+)
+def test_tf_errors_match_legacy(fn):
+    tf = TF(fn=fn)
+    tf.read()
+    if not tf.has_residual_covariance():
+        pytest.skip("no covariance")
+    expected_z = legacy_errors(tf, tf.ex_ey)
+    expected_t = legacy_errors(tf, [tf.hz])
+
+    tf._compute_error_from_covariance()
+    error = tf.dataset.transfer_function_error
+    assert np.allclose(
+        error.loc[dict(input=tf.hx_hy, output=tf.ex_ey)].data, expected_z
+    )
+    assert np.allclose(error.loc[dict(input=tf.hx_hy, output=[tf.hz])].data, expected_t)
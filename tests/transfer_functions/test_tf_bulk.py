@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for reading many transfer function files with read_many and
+read_catalog.
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_XML, TF_ZMM
+from mt_metadata.transfer_functions import read_catalog, read_many
+from mt_metadata.transfer_functions.bulk import get_tf_files
+from mt_metadata.transfer_functions.core import TF
+
+TF_FILES = [TF_EDI_CGG, TF_XML, TF_ZMM]
+
+
+@pytest.fixture(scope="module")
+def survey_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("survey")
+    for fn in TF_FILES:
+        shutil.copy(fn, path.joinpath(fn.name))
+    path.joinpath("notes.txt").write_text("not a transfer function")
+    return path
+
+
+def test_get_tf_files(survey_dir):
+    fn_list = get_tf_files(survey_dir)
+    assert sorted(fn.name for fn in fn_list) == sorted(fn.name for fn in TF_FILES)
+    assert get_tf_files(TF_EDI_CGG) == [TF_EDI_CGG]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_read_many(survey_dir, executor):
+    results = {
+        result.fn.name: result
+        for result in read_many(
+            [survey_dir, survey_dir.joinpath("missing.edi")],
+            workers=2,
+            executor=executor,
+        )
+    }
+    assert len(results) == len(TF_FILES) + 1
+    assert results["missing.edi"].tf is None
+    assert results["missing.edi"].error is not None
+
+    for fn in TF_FILES:
+        expected = TF(fn=fn)
+        expected.read()
+        result = results[fn.name]
+        assert result.error is None
+        assert result.tf.station_metadata.id == expected.station_metadata.id
+        assert np.array_equal(
+            result.tf.impedance.data, expected.impedance.data, equal_nan=True
+        )
+
+
+def test_read_many_serial(survey_dir):
+    results = list(read_many(survey_dir.joinpath(TF_ZMM.name), workers=1))
+    assert len(results) == 1
+    assert results[0].tf.has_impedance()
+
+
+def test_read_many_bad_executor(survey_dir):
+    with pytest.raises(ValueError):
+        list(read_many(survey_dir, workers=2, executor="cluster"))
+
+
+def test_read_catalog(survey_dir):
+    catalog = read_catalog(
+        [survey_dir, survey_dir.joinpath("missing.edi")],
+        workers=2,
+        executor="thread",
+    )
+    assert len(catalog) == len(TF_FILES) + 1
+    missing = catalog[catalog.fn.apply(lambda fn: fn.name) == "missing.edi"]
+    assert not pd.isna(missing.error.iloc[0])
+
+    for fn in TF_FILES:
+        row = catalog[catalog.fn.apply(lambda x: x.name) == fn.name].iloc[0]
+        # missing strings can come back as NaN
+        assert pd.isna(row.error)
+        assert row.id == TF().peek(fn)["id"]
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the binary sidecar cache used by TF.read(cache=...).
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_XML, TF_ZMM
+from mt_metadata.transfer_functions.cache import TFCache
+from mt_metadata.transfer_functions.core import TF
+
+TF_FILES = [TF_EDI_CGG, TF_XML, TF_ZMM]
+
+
+@pytest.fixture
+def tf_cache(tmp_path):
+    return TFCache(cache_dir=tmp_path.joinpath("cache"))
+
+
+@pytest.mark.parametrize("fn", TF_FILES, ids=[fn.name for fn in TF_FILES])
+def test_cached_read_matches_read(fn, tf_cache):
+    full = TF(fn=fn)
+    full.read()
+
+    first = TF(fn=fn)
+    first.read(cache=tf_cache)
+    assert len(list(tf_cache.cache_dir.glob("*.npz"))) == 1
+
+    cached = TF(fn=fn)
+    cached.read(cache=tf_cache)
+    assert cached.station_metadata.id == full.station_metadata.id
+    assert (
+        cached.station_metadata.location.latitude
+        == full.station_metadata.location.latitude
+    )
+    assert cached.station_metadata.time_period.start == (
+        full.station_metadata.time_period.start
+    )
+    assert np.array_equal(cached.period, full.period)
+    for key in full.dataset.data_vars:
+        assert np.array_equal(
+            cached.dataset[key].data, full.dataset[key].data, equal_nan=True
+        ), key
+    # TF.__eq__ does not compare the attributes set by the readers
+    np.testing.assert_allclose(cached._rotation_angle, full._rotation_angle)
+    assert cached.channel_nomenclature == full.channel_nomenclature
+    assert getattr(cached, "decimation_dict", None) == getattr(
+        full, "decimation_dict", None
+    )
+
+
+def test_cached_read_keeps_rotation(tmp_path, tf_cache):
+    tf = TF(fn=TF_EDI_CGG)
+    tf.read()
+    tf.rotate(30)
+    fn = tf.write(fn=tmp_path.joinpath("rotated.edi")).fn
+
+    full = TF(fn=fn)
+    full.read()
+    TF(fn=fn).read(cache=tf_cache)
+    cached = TF(fn=fn)
+    cached.read(cache=tf_cache)
+    np.testing.assert_allclose(cached._rotation_angle, full._rotation_angle)
+    assert not np.allclose(cached._rotation_angle, 0)
+
+
+def test_metadata_entry_is_json(tf_cache):
+    TF(fn=TF_EDI_CGG).read(cache=tf_cache)
+    assert list(tf_cache.cache_dir.glob("*.pkl")) == []
+    (metadata_fn,) = tf_cache.cache_dir.glob("*.json")
+    with open(metadata_fn) as fid:
+        metadata = json.load(fid)
+    assert len(metadata["survey_metadata"]["stations"]) == 1
+    assert "_rotation_angle" in metadata
+
+
+def test_modified_file_is_read_again(tmp_path, tf_cache):
+    fn = tmp_path.joinpath(TF_EDI_CGG.name)
+    shutil.copy(TF_EDI_CGG, fn)
+    TF(fn=fn).read(cache=tf_cache)
+    key = tf_cache.get_key(fn)
+
+    with open(fn, "a") as fid:
+        fid.write("\n")
+    assert tf_cache.get_key(fn) != key
+
+    tf = TF(fn=fn)
+    tf.read(cache=tf_cache)
+    assert tf.has_impedance()
+    assert len(list(tf_cache.cache_dir.glob("*.npz"))) == 2
+
+
+def test_evict_least_recently_used(tmp_path):
+    tf_cache = TFCache(cache_dir=tmp_path.joinpath("cache"))
+    fn_list = []
+    for name in ["old.edi", "new.edi"]:
+        fn = tmp_path.joinpath(name)
+        shutil.copy(TF_EDI_CGG, fn)
+        fn_list.append(fn)
+
+    TF(fn=fn_list[0]).read(cache=tf_cache)
+    old_keys = {entry.stem for entry in tf_cache.cache_dir.glob("*.npz")}
+    for entry in tf_cache.cache_dir.iterdir():
+        os.utime(entry, (0, 0))
+    entry_size = tf_cache.size
+
+    tf_cache.max_size = int(1.5 * entry_size)
+    TF(fn=fn_list[1]).read(cache=tf_cache)
+    assert tf_cache.size <= tf_cache.max_size
+    new_keys = {entry.stem for entry in tf_cache.cache_dir.glob("*.npz")}
+    assert len(new_keys) == 1
+    assert new_keys.isdisjoint(old_keys)
+
+    tf_cache.clear()
+    assert tf_cache.size == 0
+
+
+def test_corrupt_entry_is_read_again(tf_cache):
+    TF(fn=TF_EDI_CGG).read(cache=tf_cache)
+    for fn in tf_cache.cache_dir.glob("*.npz"):
+        fn.write_bytes(b"not an npz file")
+
+    tf = TF(fn=TF_EDI_CGG)
+    tf.read(cache=tf_cache)
+    assert tf.has_impedance()
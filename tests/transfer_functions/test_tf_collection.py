@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TFCollection, many transfer functions stacked in one dataset.
+"""
+
+import shutil
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_XML, TF_ZMM
+from mt_metadata.transfer_functions import TFCollection
+from mt_metadata.transfer_functions.core import TF, TFError
+
+TF_FILES = [TF_EDI_CGG, TF_XML, TF_ZMM]
+
+
+@pytest.fixture(scope="module")
+def tf_list():
+    tf_list = []
+    for fn in TF_FILES:
+        tf = TF(fn=fn)
+        tf.read()
+        tf_list.append(tf)
+    return tf_list
+
+
+@pytest.fixture(scope="module")
+def collection(tf_list):
+    return TFCollection(tf_list)
+
+
+def test_stacked(collection, tf_list):
+    assert len(collection) == len(tf_list)
+    assert collection.stations == [tf.station for tf in tf_list]
+    assert collection.dataset.transfer_function.dims == (
+        "station",
+        "period",
+        "output",
+        "input",
+    )
+    expected = np.unique(np.concatenate([tf.period for tf in tf_list]))
+    assert np.allclose(collection.period, expected)
+    assert collection.impedance.shape == (len(tf_list), expected.size, 2, 2)
+
+    for tf in tf_list:
+        z = collection.impedance.sel(station=tf.station, period=np.sort(tf.period))
+        order = np.argsort(tf.period)
+        assert np.array_equal(z.data, tf.impedance.data[order], equal_nan=True)
+        row = collection.station_table.loc[tf.station]
+        assert row.n_periods == tf.period.size
+        assert row.latitude == tf.latitude
+
+
+def test_to_tf(collection, tf_list):
+    for tf in tf_list:
+        new_tf = collection[tf.station]
+        order = np.argsort(tf.period)
+        assert np.array_equal(new_tf.period, tf.period[order])
+        assert new_tf.channel_nomenclature == tf.channel_nomenclature
+        assert new_tf.station_metadata.id == tf.station_metadata.id
+        for key in tf.dataset.data_vars:
+            assert np.array_equal(
+                new_tf.dataset[key].data,
+                tf.dataset[key].data[order],
+                equal_nan=True,
+            ), key
+    with pytest.raises(KeyError):
+        collection.to_tf("not_a_station")
+
+
+def test_add_duplicate(tf_list):
+    collection = TFCollection(tf_list[:1])
+    collection.add(tf_list[1:])
+    assert collection.stations == [tf.station for tf in tf_list]
+    with pytest.raises(TFError):
+        collection.add(tf_list[0])
+
+
+def test_sel_period(collection, tf_list):
+    selected = collection.sel_period([1, 10])
+    assert selected.transfer_function.shape == (len(tf_list), 2, 5, 5)
+    for tf in tf_list:
+        for period in [1, 10]:
+            index = np.argmin(np.abs(np.log10(tf.period) - np.log10(period)))
+            value = selected.sel(station=tf.station, period=period)
+            assert value.station_period == tf.period[index]
+            assert np.array_equal(
+                value.transfer_function.loc[dict(output=["ex", "ey"])]
+                .loc[dict(input=["hx", "hy"])]
+                .data,
+                tf.impedance.data[index],
+                equal_nan=True,
+            )
+
+    strict = collection.sel_period(collection.period.max() * 1.5, tolerance=0.05)
+    assert np.all(np.isnan(strict.station_period))
+    assert np.all(np.isnan(strict.transfer_function.data))
+
+
+def test_sel_location(collection, tf_list):
+    table = collection.station_table
+    station = tf_list[0].station
+    latitude = table.loc[station, "latitude"]
+    longitude = table.loc[station, "longitude"]
+
+    subset = collection.sel_bounds(
+        latitude - 0.01, latitude + 0.01, longitude - 0.01, longitude + 0.01
+    )
+    assert station in subset
+    assert set(subset.stations) <= set(collection.stations)
+
+    distance = collection.distance(latitude, longitude)
+    assert distance[station] == pytest.approx(0)
+    nearby = collection.sel_radius(latitude, longitude, 1)
+    assert station in nearby
+    assert set(nearby.stations) == set(distance.index[distance <= 1])
+
+
+def test_sel_stations(collection, tf_list):
+    station = tf_list[-1].station
+    subset = collection.sel_stations(station)
+    assert subset.stations == [station]
+    assert np.allclose(subset.period, np.sort(tf_list[-1].period))
+    assert subset.dataset.latitude.data[0] == tf_list[-1].latitude
+
+
+def test_write(collection, tmp_path):
+    collection.write(save_dir=tmp_path, file_type="edi")
+    for station in collection.stations:
+        fn = tmp_path.joinpath(f"{station}.edi")
+        assert fn.exists()
+        tf = TF(fn=fn)
+        tf.read()
+        assert np.allclose(
+            tf.impedance.data,
+            collection[station].impedance.data,
+            rtol=1e-4,
+            equal_nan=True,
+        )
+
+
+def test_from_directory(tmp_path):
+    for fn in TF_FILES:
+        shutil.copy(fn, tmp_path.joinpath(fn.name))
+    collection = TFCollection.from_directory(tmp_path, workers=2, executor="thread")
+    assert len(collection) == len(TF_FILES)
+    fn_list = [str(fn) for fn in collection.station_table.fn]
+    assert fn_list == sorted(fn_list)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the derived quantities of a TF: apparent resistivity, phase,
+phase tensor and its invariants, and tipper magnitude.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_ZMM
+from mt_metadata.transfer_functions import derived
+from mt_metadata.transfer_functions.core import TF
+
+
+@pytest.fixture(scope="module", params=[TF_ZMM, TF_EDI_CGG], ids=["zmm", "edi"])
+def tf_obj(request):
+    tf = TF(fn=request.param)
+    tf.read()
+    return tf
+
+
+def test_resistivity_phase(tf_obj):
+    z = tf_obj.impedance.data
+    z_err = tf_obj.impedance_error.data
+    for index, period in enumerate(tf_obj.period):
+        assert np.allclose(
+            tf_obj.apparent_resistivity.data[index],
+            0.2 * period * np.abs(z[index]) ** 2,
+        )
+        assert np.allclose(
+            tf_obj.apparent_resistivity_error.data[index],
+            0.4 * period * np.abs(z[index]) * z_err[index],
+        )
+        assert np.allclose(tf_obj.phase.data[index], np.degrees(np.angle(z[index])))
+    assert tf_obj.apparent_resistivity.dims == tf_obj.impedance.dims
+    assert np.all(tf_obj.phase_error.data >= 0)
+    assert np.all(tf_obj.phase_error.data <= 90)
+
+
+def test_phase_tensor(tf_obj):
+    pt = tf_obj.phase_tensor
+    z = tf_obj.impedance.data
+    for index in [0, tf_obj.period.size // 2, tf_obj.period.size - 1]:
+        expected = np.linalg.inv(z[index].real) @ z[index].imag
+        assert np.allclose(pt.phase_tensor.data[index], expected)
+    assert np.all(pt.phimax.data >= pt.phimin.data)
+    assert np.allclose(pt.strike.data, pt.alpha.data - pt.skew.data)
+    assert np.all(np.isfinite(pt.phase_tensor_error.data))
+
+
+def test_phase_tensor_1d():
+    # a 1D impedance with a 45 degree phase has phimin = phimax = 45
+    z = np.array([[[0, 1 + 1j], [-1 - 1j, 0]]])
+    pt, _ = derived.phase_tensor(z)
+    invariants = derived.phase_tensor_invariants(pt)
+    assert np.allclose(pt, np.eye(2))
+    assert np.allclose(invariants["phimin"], 45)
+    assert np.allclose(invariants["phimax"], 45)
+    assert np.allclose(invariants["skew"], 0)
+    assert np.allclose(invariants["ellipticity"], 0)
+
+
+def test_phase_tensor_rotation(tf_obj):
+    pt = tf_obj.phase_tensor
+    rotated = tf_obj.rotate(30, inplace=False).phase_tensor
+    for key in ["phimin", "phimax", "skew", "ellipticity"]:
+        assert np.allclose(rotated[key].data, pt[key].data, equal_nan=True), key
+    delta = np.mod(pt.strike.data - rotated.strike.data + 90, 180) - 90
+    assert np.allclose(delta[np.isfinite(delta)], 30)
+
+
+def test_tipper_magnitude(tf_obj):
+    magnitude = tf_obj.tipper_magnitude
+    if not tf_obj.has_tipper():
+        assert magnitude is None
+        return
+    t = tf_obj.tipper.data
+    assert np.allclose(
+        magnitude.magnitude_real.data, np.linalg.norm(t[:, 0, :].real, axis=1)
+    )
+    assert np.allclose(
+        magnitude.angle_imag.data,
+        np.degrees(np.arctan2(t[:, 0, 1].imag, t[:, 0, 0].imag)),
+    )
+
+
+def test_memoized(tf_obj):
+    tf = tf_obj.copy()
+    assert tf.phase_tensor is tf.phase_tensor
+    assert tf.apparent_resistivity is tf.apparent_resistivity
+
+
+@pytest.mark.parametrize("change", ["impedance", "period", "rotate"])
+def test_invalidated(tf_obj, change):
+    tf = tf_obj.copy()
+    resistivity = tf.apparent_resistivity
+    pt = tf.phase_tensor
+    if change == "impedance":
+        tf.impedance = tf.impedance.data * 2
+    elif change == "period":
+        tf.period = tf.period * 2
+    else:
+        tf.rotate(30)
+    assert tf.apparent_resistivity is not resistivity
+    assert tf.phase_tensor is not pt
+    if change != "rotate":
+        scale = 4 if change == "impedance" else 2
+        assert np.allclose(
+            tf.apparent_resistivity.data, resistivity.data * scale, equal_nan=True
+        )
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TF.interpolate and the batched tensor interpolation functions.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_ZMM
+from mt_metadata.transfer_functions.core import TF, TFError
+from mt_metadata.transfer_functions.interpolation import (
+    interpolate_tensors,
+    interpolation_weights,
+)
+
+
+@pytest.fixture(scope="module", params=[TF_ZMM, TF_EDI_CGG], ids=["zmm", "edi"])
+def tf_obj(request):
+    tf = TF(fn=request.param)
+    tf.read()
+    return tf
+
+
+def test_interpolation_weights():
+    periods = np.array([1.0, 10.0, 100.0])
+    lower, upper, weight = interpolation_weights(
+        periods, np.array([0.1, 1.0, np.sqrt(10), 30.0, 100.0, 1000.0])
+    )
+    assert np.array_equal(lower, [0, 0, 0, 1, 1, 1])
+    assert np.array_equal(upper, lower + 1)
+    assert np.isnan(weight[0]) and np.isnan(weight[-1])
+    assert np.allclose(weight[1:-1], [0, 0.5, np.log10(3), 1])
+
+    _, _, nearest = interpolation_weights(periods, np.array([2.0, 5.0]), "nearest")
+    assert np.array_equal(nearest, [0, 1])
+    with pytest.raises(ValueError):
+        interpolation_weights(periods, periods, "cubic")
+
+
+def test_interpolate_tensors_stack():
+    rng = np.random.default_rng(0)
+    periods = np.sort(rng.uniform(0.01, 1000, size=(4, 12)), axis=1)
+    z = rng.normal(size=(4, 12, 2, 2)) + 1j * rng.normal(size=(4, 12, 2, 2))
+    new_periods = np.logspace(-1, 2, 7)
+
+    z_new = interpolate_tensors(z, periods, new_periods)
+    assert z_new.shape == (4, 7, 2, 2)
+    for station in range(4):
+        log_periods = np.log10(periods[station])
+        for ii in range(2):
+            for jj in range(2):
+                for part in ["real", "imag"]:
+                    expected = np.interp(
+                        np.log10(new_periods),
+                        log_periods,
+                        getattr(z[station, :, ii, jj], part),
+                        left=np.nan,
+                        right=np.nan,
+                    )
+                    assert np.allclose(
+                        getattr(z_new[station, :, ii, jj], part),
+                        expected,
+                        equal_nan=True,
+                    )
+
+
+def test_interpolate_tensors_nan_neighbour():
+    periods = np.array([1.0, 10.0, 100.0])
+    values = np.array([1.0, 2.0, np.nan]).reshape(3, 1, 1)
+    new = interpolate_tensors(values, periods, np.array([1.0, 10.0, 50.0]))
+    assert np.allclose(new[:2, 0, 0], [1, 2])
+    assert np.isnan(new[2, 0, 0])
+
+
+def test_interpolate_same_periods(tf_obj):
+    tf = tf_obj.interpolate(tf_obj.period)
+    for key in tf_obj.dataset.data_vars:
+        if key == "transfer_function_error" and tf_obj.has_residual_covariance():
+            # recomputed from the covariances, see test_interpolate
+            continue
+        assert np.allclose(
+            tf.dataset[key].data, tf_obj.dataset[key].data, equal_nan=True
+        ), key
+
+
+def test_interpolate(tf_obj):
+    new_periods = np.logspace(
+        np.log10(tf_obj.period.min()), np.log10(tf_obj.period.max()), 17
+    )
+    new_periods[[0, -1]] = tf_obj.period.min(), tf_obj.period.max()
+    tf = tf_obj.interpolate(new_periods)
+    assert np.array_equal(tf.period, new_periods)
+    assert tf.impedance.shape == (17, 2, 2)
+    assert np.all(np.isfinite(tf.impedance_error.data))
+
+    z = tf_obj.impedance.data
+    order = np.argsort(tf_obj.period)
+    expected = np.interp(
+        np.log10(new_periods),
+        np.log10(tf_obj.period[order]),
+        z[order, 0, 1].real,
+    )
+    assert np.allclose(tf.impedance.data[:, 0, 1].real, expected)
+
+    if tf_obj.has_residual_covariance():
+        expected = tf.copy()
+        expected._compute_error_from_covariance()
+        assert np.allclose(tf.impedance_error.data, expected.impedance_error.data)
+
+
+def test_interpolate_outside(tf_obj):
+    tf = tf_obj.interpolate([tf_obj.period.min() / 10, tf_obj.period.max()])
+    assert np.all(np.isnan(tf.impedance.data[0]))
+    assert np.all(np.isfinite(tf.impedance.data[1]))
+
+
+def test_interpolate_inplace(tf_obj):
+    tf = tf_obj.copy()
+    assert tf.interpolate(tf.period[::2], inplace=True) is None
+    assert tf.period.size == tf_obj.period[::2].size
+
+
+def test_interpolate_bad_method(tf_obj):
+    with pytest.raises(TFError):
+        tf_obj.interpolate(tf_obj.period, method="cubic")
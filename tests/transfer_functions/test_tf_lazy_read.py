@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TF.read(lazy=True), which reads the data on first access.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_AVG, TF_EDI_CGG, TF_XML, TF_ZMM
+from mt_metadata.transfer_functions.core import TF
+
+TF_FILES = [TF_AVG, TF_EDI_CGG, TF_XML, TF_ZMM]
+
+
+@pytest.mark.parametrize("fn", TF_FILES, ids=[fn.name for fn in TF_FILES])
+def test_lazy_matches_full_read(fn):
+    full = TF(fn=fn)
+    full.read()
+
+    lazy = TF(fn=fn)
+    lazy.read(lazy=True)
+    assert lazy._lazy_read_kwargs is not None
+    assert lazy.station_metadata.id == full.station_metadata.id
+    assert lazy._lazy_read_kwargs is not None
+
+    assert np.array_equal(lazy.period, full.period)
+    assert lazy._lazy_read_kwargs is None
+    assert np.array_equal(lazy.impedance.data, full.impedance.data, equal_nan=True)
+    assert np.array_equal(
+        lazy.dataset.transfer_function_error.data,
+        full.dataset.transfer_function_error.data,
+        equal_nan=True,
+    )
+
+
+def test_lazy_keeps_metadata_changes():
+    tf = TF(fn=TF_EDI_CGG)
+    tf.read(lazy=True)
+    tf.station_metadata.id = "renamed"
+    assert tf.has_impedance()
+    assert tf.station_metadata.id == "renamed"
+
+
+def test_read_clears_pending_lazy_read():
+    tf = TF(fn=TF_EDI_CGG)
+    tf.read(lazy=True)
+    tf.read(fn=TF_ZMM)
+    assert tf._lazy_read_kwargs is None
+    assert tf.station_metadata.id == TF(fn=TF_ZMM).peek()["id"]
+    assert tf.has_impedance()
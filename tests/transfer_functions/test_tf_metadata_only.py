@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for reading only the metadata of transfer function files with
+TF.read(metadata_only=True) and TF.peek.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import (
+    TF_AVG,
+    TF_EDI_CGG,
+    TF_EDI_SPECTRA,
+    TF_JFILE,
+    TF_XML,
+    TF_ZMM,
+    TF_ZSS_TIPPER,
+)
+from mt_metadata.transfer_functions.core import TF
+
+TF_FILES = [TF_AVG, TF_EDI_CGG, TF_EDI_SPECTRA, TF_JFILE, TF_XML, TF_ZMM, TF_ZSS_TIPPER]
+
+
+@pytest.fixture(scope="module", params=TF_FILES, ids=[fn.name for fn in TF_FILES])
+def full_and_metadata(request):
+    full = TF(fn=request.param)
+    full.read()
+    metadata = TF(fn=request.param)
+    metadata.read(metadata_only=True)
+    return full, metadata
+
+
+def test_station_metadata(full_and_metadata):
+    full, metadata = full_and_metadata
+    assert metadata.station_metadata.id == full.station_metadata.id
+    assert (
+        metadata.station_metadata.location.latitude
+        == full.station_metadata.location.latitude
+    )
+    assert (
+        metadata.station_metadata.location.longitude
+        == full.station_metadata.location.longitude
+    )
+    assert (
+        metadata.station_metadata.time_period.start
+        == full.station_metadata.time_period.start
+    )
+
+
+def test_dataset_not_filled(full_and_metadata):
+    _, metadata = full_and_metadata
+    assert not metadata.has_impedance()
+    assert not metadata.has_tipper()
+
+
+def test_peek(full_and_metadata):
+    full, _ = full_and_metadata
+    summary = TF().peek(full.fn)
+    assert summary["id"] == full.station_metadata.id
+    assert summary["n_periods"] == full.period.size
+    assert np.isclose(summary["period_min"], full.period.min())
+    assert np.isclose(summary["period_max"], full.period.max())
+    assert summary["start"] == full.station_metadata.time_period.start.isoformat()
+    assert set(summary["channels_recorded"]) == set(
+        full.station_metadata.channels_recorded
+    )
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for TF.rotate and the batched tensor rotation functions.
+"""
+
+import numpy as np
+import pytest
+
+from mt_metadata import TF_EDI_CGG, TF_ZMM
+from mt_metadata.transfer_functions.core import TF, TFError
+from mt_metadata.transfer_functions.rotation import rotate_tensors, rotation_matrix
+
+
+def reference_rotation(angle):
+    radians = np.deg2rad(angle)
+    return np.array(
+        [
+            [np.cos(radians), np.sin(radians)],
+            [-np.sin(radians), np.cos(radians)],
+        ]
+    )
+
+
+@pytest.fixture(scope="module", params=[TF_ZMM, TF_EDI_CGG], ids=["zmm", "edi"])
+def tf_obj(request):
+    tf = TF(fn=request.param)
+    tf.read()
+    return tf
+
+
+def test_rotation_matrix_layouts():
+    r5 = rotation_matrix(30, 5)
+    r2 = reference_rotation(30)
+    assert np.allclose(r5[0:2, 0:2], r2)
+    assert np.allclose(r5[3:5, 3:5], r2)
+    assert r5[2, 2] == 1
+    assert np.allclose(rotation_matrix(30, 1), [[1]])
+    with pytest.raises(ValueError):
+        rotation_matrix(30, 4)
+
+
+def test_rotate_tensors_stack():
+    rng = np.random.default_rng(0)
+    z = rng.normal(size=(4, 6, 2, 2)) + 1j * rng.normal(size=(4, 6, 2, 2))
+    t = rng.normal(size=(4, 6, 1, 2)) + 1j * rng.normal(size=(4, 6, 1, 2))
+    angle = rng.uniform(-90, 90, size=(4, 1))
+
+    z_rotated = rotate_tensors(z, angle)
+    t_rotated = rotate_tensors(t, angle)
+    for station in range(4):
+        rotation = reference_rotation(angle[station, 0])
+        for period in range(6):
+            assert np.allclose(
+                z_rotated[station, period],
+                rotation @ z[station, period] @ rotation.T,
+            )
+            assert np.allclose(
+                t_rotated[station, period], t[station, period] @ rotation.T
+            )
+
+
+def test_rotate_round_trip(tf_obj):
+    tf = tf_obj.rotate(35, inplace=False)
+    assert not np.allclose(tf.impedance.data, tf_obj.impedance.data)
+    tf.rotate(-35)
+    for key in ["transfer_function", "inverse_signal_power", "residual_covariance"]:
+        assert np.allclose(tf.dataset[key].data, tf_obj.dataset[key].data), key
+    np.testing.assert_allclose(tf._rotation_angle, tf_obj._rotation_angle)
+
+
+def test_rotate_impedance(tf_obj):
+    tf = tf_obj.rotate(20, inplace=False)
+    rotation = reference_rotation(20)
+    expected = rotation @ tf_obj.impedance.data @ rotation.T
+    assert np.allclose(tf.impedance.data, expected)
+    # the determinant of the impedance does not depend on the rotation
+    assert np.allclose(
+        np.linalg.det(tf.impedance.data), np.linalg.det(tf_obj.impedance.data)
+    )
+    np.testing.assert_allclose(tf._rotation_angle, tf_obj._rotation_angle + 20)
+
+
+def test_rotate_per_period(tf_obj):
+    angle = np.linspace(0, 90, tf_obj.period.size)
+    tf = tf_obj.rotate(angle, inplace=False)
+    for index in [0, tf_obj.period.size - 1]:
+        rotation = reference_rotation(angle[index])
+        assert np.allclose(
+            tf.impedance.data[index],
+            rotation @ tf_obj.impedance.data[index] @ rotation.T,
+        )
+    assert np.allclose(tf._rotation_angle, tf_obj._rotation_angle + angle)
+
+
+def test_rotate_errors(tf_obj):
+    tf = tf_obj.rotate(45, inplace=False)
+    assert np.all(np.isfinite(tf.impedance_error.data))
+    if tf_obj.has_residual_covariance():
+        expected = tf.copy()
+        expected._compute_error_from_covariance()
+        assert np.allclose(tf.impedance_error.data, expected.impedance_error.data)
+
+
+def test_rotate_bad_angle(tf_obj):
+    with pytest.raises(TFError):
+        tf_obj.rotate(np.ones(tf_obj.period.size + 1), inplace=False)
@@ -230,6 +230,15 @@ class TestUtilityFunctions:
             assert unit.name == "unknown"
             assert unit.symbol == "unknown"
 
+    def test_get_unit_from_df_returns_new_object(self):
+        """Cached lookups still return independent Unit objects."""
+        unit_01 = get_unit_from_df("mV")
+        unit_02 = get_unit_from_df("mV")
+        assert unit_01 == unit_02
+        assert unit_01 is not unit_02
+        unit_01.name = "changed"
+        assert get_unit_from_df("mV").name == unit_02.name
+
     def test_get_unit_object(self, subtests, unit_object_test_cases):
         """Test the get_unit_object function."""
         for case in unit_object_test_cases: